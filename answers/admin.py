@@ -1,9 +1,20 @@
 from django.contrib import admin
+
+from config.admin_tools import SearchVectorModelAdmin
+
 from .models import Answer, StarAnswer, BasicAnswer
 
 
+class AnswerAdminBase(SearchVectorModelAdmin):
+    list_select_related = ("user", "question")
+    # The answer's search_vector only covers its own content
+    search_vector_extra_fields = ("question__title",)
+    autocomplete_fields = ("question", "user")
+    readonly_fields = ("created_at", "updated_at", "search_vector")
+
+
 @admin.register(Answer)
-class AnswerAdmin(admin.ModelAdmin):
+class AnswerAdmin(AnswerAdminBase):
     list_display = (
         "user",
         "question",
@@ -12,12 +23,13 @@ class AnswerAdmin(admin.ModelAdmin):
         "created_at",
     )
     list_filter = ("answer_type", "is_public", "created_at")
+    # Fallback for databases without full-text search, see
+    # SearchVectorAdminMixin
     search_fields = ("question__title",)
-    readonly_fields = ("created_at", "updated_at", "search_vector")
 
 
 @admin.register(StarAnswer)
-class StarAnswerAdmin(admin.ModelAdmin):
+class StarAnswerAdmin(AnswerAdminBase):
     list_display = ("user", "question", "is_public", "created_at")
     list_filter = ("is_public", "created_at")
     search_fields = (
@@ -27,7 +39,6 @@ class StarAnswerAdmin(admin.ModelAdmin):
         "action",
         "result",
     )
-    readonly_fields = ("created_at", "updated_at", "search_vector")
     fieldsets = (
         (None, {"fields": ("question", "user", "is_public")}),
         (
@@ -42,8 +53,7 @@ class StarAnswerAdmin(admin.ModelAdmin):
 
 
 @admin.register(BasicAnswer)
-class BasicAnswerAdmin(admin.ModelAdmin):
+class BasicAnswerAdmin(AnswerAdminBase):
     list_display = ("user", "question", "is_public", "created_at")
     list_filter = ("is_public", "created_at")
     search_fields = ("question__title", "text")
-    readonly_fields = ("created_at", "updated_at", "search_vector")
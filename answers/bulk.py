@@ -0,0 +1,36 @@
+"""
+Set-based writes for answers.
+"""
+
+from django.db import connection
+
+# Search vector of an answer, from the content columns of either type (the
+# columns of the other type are NULL)
+SEARCH_VECTOR_SQL = " || ".join(
+    f"setweight(to_tsvector('english', COALESCE({column}, '')), 'A')"
+    for column in ("situation", "task", "action", "result", "text")
+)
+
+
+def update_search_vectors(user_id=None, only_missing=False):
+    """
+    Recompute answer search vectors with one set-based UPDATE (PostgreSQL
+    only). Limited to one user's answers, and to answers without a vector,
+    when requested. Returns the number of answers updated.
+    """
+    conditions = []
+    params = []
+    if user_id is not None:
+        conditions.append("user_id = %s")
+        params.append(user_id)
+    if only_missing:
+        conditions.append("search_vector IS NULL")
+
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE answers_answer SET search_vector = {SEARCH_VECTOR_SQL}"
+            + where,
+            params,
+        )
+        return cursor.rowcount
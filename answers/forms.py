@@ -18,7 +18,20 @@ class AnswerTypeChoiceForm(forms.Form):
     )
 
 
-class StarAnswerForm(forms.ModelForm):
+class TypedAnswerForm(forms.ModelForm):
+    """
+    Base form of the answer proxy models. The content columns are nullable
+    (each answer type leaves the other type's empty), so the form marks the
+    ones it edits as required.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for field in self.fields.values():
+            field.required = True
+
+
+class StarAnswerForm(TypedAnswerForm):
     """Form for creating STAR method answers"""
 
     class Meta:
@@ -79,7 +92,7 @@ class StarAnswerForm(forms.ModelForm):
         }
 
 
-class BasicAnswerForm(forms.ModelForm):
+class BasicAnswerForm(TypedAnswerForm):
     """Form for creating basic text answers"""
 
     class Meta:
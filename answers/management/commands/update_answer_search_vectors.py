@@ -1,51 +1,21 @@
 """
 Management command to update search vectors for all answers.
 """
-# flake8: noqa: E501
 
 from django.core.management.base import BaseCommand
-from django.db import connection
+
+from answers.bulk import update_search_vectors
 
 
 class Command(BaseCommand):
     help = "Update search vectors for all answers"
 
     def handle(self, *args, **options):
-        with connection.cursor() as cursor:
-            self.stdout.write("Updating search vectors for STAR answers...")
-
-            # Update STAR answers using raw SQL
-            cursor.execute(
-                """
-                UPDATE answers_answer
-                SET search_vector =
-                    setweight(to_tsvector('english', COALESCE(answers_staranswer.situation, '')), 'A') ||  # noqa: E501
-                    setweight(to_tsvector('english', COALESCE(answers_staranswer.task, '')), 'A') ||  # noqa: E501
-                    setweight(to_tsvector('english', COALESCE(answers_staranswer.action, '')), 'A') ||  # noqa: E501
-                    setweight(to_tsvector('english', COALESCE(answers_staranswer.result, '')), 'A')  # noqa: E501
-                FROM answers_staranswer
-                WHERE answers_answer.id = answers_staranswer.answer_ptr_id
-            """
-            )
-            star_count = cursor.rowcount
-
-            self.stdout.write("Updating search vectors for Basic answers...")
-
-            # Update Basic answers using raw SQL
-            cursor.execute(
-                """
-                UPDATE answers_answer
-                SET search_vector =
-                    setweight(to_tsvector('english', COALESCE(answers_basicanswer.text, '')), 'A')  # noqa: E501
-                FROM answers_basicanswer
-                WHERE answers_answer.id = answers_basicanswer.answer_ptr_id
-            """
-            )
-            basic_count = cursor.rowcount
-
-        total_updated = star_count + basic_count
+        self.stdout.write("Updating search vectors for all answers...")
+        total_updated = update_search_vectors()
 
         self.stdout.write(
             self.style.SUCCESS(
-                f"Successfully updated {star_count} STAR answers and {basic_count} basic answers "  # noqa: E501
-                f"(total: {total_updated})"))  # noqa: E501
+                f"Successfully updated {total_updated} answers"
+            )
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answers', '0002_alter_answer_unique_together'),
+        ('questions', '0004_created_at_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['-created_at', '-id'], name='answers_ans_created_717b09_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+"""
+Step 1 of 3 of moving answer content into ``answers_answer``.
+
+Adds the content columns as nullable columns without a default, which
+PostgreSQL applies as a catalog-only change: no table rewrite and no long
+lock. Code from before the move keeps working, since it never reads or
+writes these columns.
+
+The columns are added with plain SQL: the model state only gets them in
+0006, once ``StarAnswer`` and ``BasicAnswer`` (which declare fields of the
+same names) are gone.
+"""
+
+from django.db import migrations
+
+CONTENT_COLUMNS = ("situation", "task", "action", "result", "text")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answers', '0003_created_at_id_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            f"ALTER TABLE answers_answer ADD COLUMN {column} text NULL",
+            f"ALTER TABLE answers_answer DROP COLUMN {column}",
+        )
+        for column in CONTENT_COLUMNS
+    ]
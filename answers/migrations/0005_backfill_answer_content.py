@@ -0,0 +1,237 @@
+"""
+Step 2 of 3 of moving answer content into ``answers_answer``.
+
+Keeps the multi-table inheritance child tables and the new columns in step
+while releases on both sides of the move serve:
+
+- triggers on the child tables mirror every INSERT and UPDATE the previous
+  release makes into the new columns;
+- the existing content is then copied across, outside a transaction in
+  primary key ranges of ``BATCH_SIZE``, so each UPDATE only locks one range
+  of rows, briefly, while the site keeps serving. Rows that already have
+  content (copied, or written through a trigger) are skipped, so the copy
+  can be re-run;
+- last, triggers on ``answers_answer`` mirror content the next release
+  writes to the new columns back into the child tables, so the previous
+  release still finds every answer, and delete the child rows of an answer
+  before the answer itself, so deleting answers (by ORM or with raw SQL, as
+  ``QuestionService.delete`` does) works while the child tables exist.
+
+On PostgreSQL the triggers only fire for statements made by the
+application, never for the other side's mirroring; SQLite does not fire a
+trigger from within itself.
+
+Deploy order: 0005 and 0006 are both safe to apply with ``migrate`` while
+the previous release is serving, since neither drops anything. The child
+tables and the triggers are dropped by a later migration, shipped only once
+no server of the previous release is left.
+"""
+
+from django.db import migrations
+
+BATCH_SIZE = 10_000
+
+COPIES = (
+    (
+        "answers_staranswer",
+        ("situation", "task", "action", "result"),
+        "situation",
+    ),
+    ("answers_basicanswer", ("text",), "text"),
+)
+
+DELETE_TRIGGER = "answers_answer_delete_children"
+
+
+def _trigger_name(table):
+    return f"{table}_mirror_content"
+
+
+def _back_trigger_name(table):
+    return f"{table}_mirror_back"
+
+
+def _mirror_back(table, columns):
+    column_list = ", ".join(columns)
+    values = ", ".join(f"COALESCE(NEW.{column}, '')" for column in columns)
+    assignments = ", ".join(
+        f"{column} = excluded.{column}" for column in columns
+    )
+    return (
+        f"INSERT INTO {table} (answer_ptr_id, {column_list}) "
+        f"VALUES (NEW.id, {values}) "
+        f"ON CONFLICT (answer_ptr_id) DO UPDATE SET {assignments}"
+    )
+
+
+def install_triggers(apps, schema_editor):
+    """Mirror writes to the child tables into ``answers_answer``."""
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for table, columns, _ in COPIES:
+            name = _trigger_name(table)
+            assignments = ", ".join(
+                f"{column} = NEW.{column}" for column in columns
+            )
+            mirror = (
+                f"UPDATE answers_answer SET {assignments} "
+                "WHERE id = NEW.answer_ptr_id"
+            )
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    f"CREATE OR REPLACE FUNCTION {name}() RETURNS trigger "
+                    f"AS $$ BEGIN {mirror}; RETURN NULL; END; $$ "
+                    "LANGUAGE plpgsql"
+                )
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+                cursor.execute(
+                    f"CREATE TRIGGER {name} AFTER INSERT OR UPDATE ON {table} "
+                    "FOR EACH ROW WHEN (pg_trigger_depth() < 1) "
+                    f"EXECUTE FUNCTION {name}()"
+                )
+            elif connection.vendor == "sqlite":
+                # SQLite triggers fire on a single event each
+                for event in ("INSERT", "UPDATE"):
+                    cursor.execute(
+                        f"CREATE TRIGGER IF NOT EXISTS {name}_{event.lower()} "
+                        f"AFTER {event} ON {table} "
+                        f"FOR EACH ROW BEGIN {mirror}; END"
+                    )
+
+
+def drop_triggers(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for table, _, _ in COPIES:
+            name = _trigger_name(table)
+            if connection.vendor == "postgresql":
+                cursor.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+                cursor.execute(f"DROP FUNCTION IF EXISTS {name}()")
+            elif connection.vendor == "sqlite":
+                for event in ("insert", "update"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {name}_{event}")
+
+
+def install_back_triggers(apps, schema_editor):
+    """
+    Mirror content written to ``answers_answer`` into the child tables, and
+    delete the child rows of an answer before the answer itself.
+    """
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for table, columns, marker in COPIES:
+            name = _back_trigger_name(table)
+            mirror = _mirror_back(table, columns)
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    f"CREATE OR REPLACE FUNCTION {name}() RETURNS trigger "
+                    f"AS $$ BEGIN {mirror}; RETURN NULL; END; $$ "
+                    "LANGUAGE plpgsql"
+                )
+                cursor.execute(
+                    f"DROP TRIGGER IF EXISTS {name} ON answers_answer"
+                )
+                cursor.execute(
+                    f"CREATE TRIGGER {name} AFTER INSERT OR UPDATE OF "
+                    f"{', '.join(columns)} ON answers_answer FOR EACH ROW "
+                    f"WHEN (NEW.{marker} IS NOT NULL "
+                    "AND pg_trigger_depth() < 1) "
+                    f"EXECUTE FUNCTION {name}()"
+                )
+            elif connection.vendor == "sqlite":
+                events = ("INSERT", f"UPDATE OF {', '.join(columns)}")
+                for event in events:
+                    suffix = event.split()[0].lower()
+                    cursor.execute(
+                        f"CREATE TRIGGER IF NOT EXISTS {name}_{suffix} "
+                        f"AFTER {event} ON answers_answer FOR EACH ROW "
+                        f"WHEN NEW.{marker} IS NOT NULL "
+                        f"BEGIN {mirror}; END"
+                    )
+
+        delete_children = "; ".join(
+            f"DELETE FROM {table} WHERE answer_ptr_id = OLD.id"
+            for table, _, _ in COPIES
+        )
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                f"CREATE OR REPLACE FUNCTION {DELETE_TRIGGER}() "
+                f"RETURNS trigger AS $$ BEGIN {delete_children}; "
+                "RETURN OLD; END; $$ LANGUAGE plpgsql"
+            )
+            cursor.execute(
+                f"DROP TRIGGER IF EXISTS {DELETE_TRIGGER} ON answers_answer"
+            )
+            cursor.execute(
+                f"CREATE TRIGGER {DELETE_TRIGGER} BEFORE DELETE "
+                "ON answers_answer "
+                f"FOR EACH ROW EXECUTE FUNCTION {DELETE_TRIGGER}()"
+            )
+        elif connection.vendor == "sqlite":
+            cursor.execute(
+                f"CREATE TRIGGER IF NOT EXISTS {DELETE_TRIGGER} "
+                "BEFORE DELETE ON answers_answer FOR EACH ROW "
+                f"BEGIN {delete_children}; END"
+            )
+
+
+def drop_back_triggers(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        for table, _, _ in COPIES:
+            name = _back_trigger_name(table)
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    f"DROP TRIGGER IF EXISTS {name} ON answers_answer"
+                )
+                cursor.execute(f"DROP FUNCTION IF EXISTS {name}()")
+            elif connection.vendor == "sqlite":
+                for event in ("insert", "update"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {name}_{event}")
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                f"DROP TRIGGER IF EXISTS {DELETE_TRIGGER} ON answers_answer"
+            )
+            cursor.execute(f"DROP FUNCTION IF EXISTS {DELETE_TRIGGER}()")
+        elif connection.vendor == "sqlite":
+            cursor.execute(f"DROP TRIGGER IF EXISTS {DELETE_TRIGGER}")
+
+
+def copy_content(apps, schema_editor):
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT MIN(id), MAX(id) FROM answers_answer")
+        low, high = cursor.fetchone()
+        if low is None:
+            return
+        for table, columns, marker in COPIES:
+            assignments = ", ".join(
+                f"{column} = {table}.{column}" for column in columns
+            )
+            for start in range(low, high + 1, BATCH_SIZE):
+                cursor.execute(
+                    f"UPDATE answers_answer SET {assignments} FROM {table} "
+                    f"WHERE answers_answer.id = {table}.answer_ptr_id "
+                    "AND answers_answer.id >= %s AND answers_answer.id < %s "
+                    f"AND answers_answer.{marker} IS NULL",
+                    [start, start + BATCH_SIZE],
+                )
+
+
+class Migration(migrations.Migration):
+
+    # Every batch commits on its own
+    atomic = False
+
+    dependencies = [
+        ('answers', '0004_answer_content_columns'),
+    ]
+
+    operations = [
+        # Before the copy, so no write falls between the two
+        migrations.RunPython(install_triggers, drop_triggers),
+        migrations.RunPython(copy_content, migrations.RunPython.noop),
+        # After the copy, which would otherwise write every child row back;
+        # only the next release writes the new columns itself
+        migrations.RunPython(install_back_triggers, drop_back_triggers),
+    ]
@@ -0,0 +1,67 @@
+"""
+Step 3 of 3 of moving answer content into ``answers_answer``.
+
+Only changes the model state: ``StarAnswer`` and ``BasicAnswer`` become
+proxy models and the content columns added by 0004 join it. The child
+tables and the triggers of 0005 stay in the database, so the previous
+release keeps working while the release reading the new columns rolls out,
+and applying this with the release phase's ``migrate`` is safe. They are
+dropped by a later migration, once no server of the previous release is
+left.
+"""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('answers', '0005_backfill_answer_content'),
+    ]
+
+    operations = [
+        # The child tables are kept, and the columns exist since 0004
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.DeleteModel(
+                    name='BasicAnswer',
+                ),
+                migrations.DeleteModel(
+                    name='StarAnswer',
+                ),
+            ] + [
+                migrations.AddField(
+                    model_name='answer',
+                    name=column,
+                    field=models.TextField(blank=True, null=True),
+                )
+                for column in ('situation', 'task', 'action', 'result', 'text')
+            ],
+        ),
+        migrations.CreateModel(
+            name='BasicAnswer',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'Basic Answer',
+                'verbose_name_plural': 'Basic Answers',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('answers.answer',),
+        ),
+        migrations.CreateModel(
+            name='StarAnswer',
+            fields=[
+            ],
+            options={
+                'verbose_name': 'STAR Answer',
+                'verbose_name_plural': 'STAR Answers',
+                'proxy': True,
+                'indexes': [],
+                'constraints': [],
+            },
+            bases=('answers.answer',),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db import models
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
@@ -44,6 +45,11 @@ class Answer(models.Model):
         (ANSWER_TYPE_STAR, "STAR"),
         (ANSWER_TYPE_BASIC, "Basic"),
     ]
+    # Content columns used by each answer type, in model order
+    CONTENT_FIELDS = {
+        ANSWER_TYPE_STAR: ("situation", "task", "action", "result"),
+        ANSWER_TYPE_BASIC: ("text",),
+    }
 
     question = models.ForeignKey(
         Question, on_delete=models.CASCADE, related_name="answers"
@@ -57,16 +63,30 @@ class Answer(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Content of both answer types lives in this table, so reading an answer
+    # needs no join. Each type uses its own columns and leaves the others
+    # NULL; clean_fields() requires the ones of the answer's type.
+    situation = models.TextField(null=True, blank=True)
+    task = models.TextField(null=True, blank=True)
+    action = models.TextField(null=True, blank=True)
+    result = models.TextField(null=True, blank=True)
+    text = models.TextField(null=True, blank=True)
+
     # Search vector for combined searchable text for answers (maintained from
-    # subclass fields via signal/management command)
+    # the content fields via signal/management command)
     search_vector = SearchVectorField(null=True, editable=False)
 
     objects = AnswerManager()
 
+    # Set by the proxy models, which always store answers of that type
+    proxy_answer_type = None
+
     class Meta:
         indexes = [
             GinIndex(fields=["search_vector"]),
             models.Index(fields=["answer_type"]),
+            # Keyset pagination of the JSON API
+            models.Index(fields=["-created_at", "-id"]),
         ]
         ordering = ["-created_at"]
 
@@ -75,32 +95,67 @@ class Answer(models.Model):
             f"{self.answer_type} answer by {self.user} on {self.question_id}"
         )
 
+    @property
+    def content_fields(self):
+        """Names of the content fields used by this answer's type."""
+        return self.CONTENT_FIELDS.get(self.answer_type, ())
+
+    def clean_fields(self, exclude=None):
+        if self.proxy_answer_type:
+            self.answer_type = self.proxy_answer_type
+        errors = {}
+        try:
+            super().clean_fields(exclude=exclude)
+        except ValidationError as exc:
+            errors = exc.error_dict
+        for name in self.content_fields:
+            if name in (exclude or ()) or name in errors:
+                continue
+            if getattr(self, name) in (None, ""):
+                field = self._meta.get_field(name)
+                message = field.error_messages["blank"]
+                errors[name] = [ValidationError(message, code="blank")]
+        if errors:
+            raise ValidationError(errors)
+
+    def save(self, *args, **kwargs):
+        if self.proxy_answer_type:
+            self.answer_type = self.proxy_answer_type
+        super().save(*args, **kwargs)
+
+
+class TypedAnswerManager(AnswerManager):
+    """Manager of a proxy model, limited to answers of its type."""
+
+    def __init__(self, answer_type):
+        super().__init__()
+        self.answer_type = answer_type
+
+    def get_queryset(self):
+        return super().get_queryset().filter(answer_type=self.answer_type)
+
 
 class StarAnswer(Answer):
-    # Multi-table inheritance: creates an implicit OneToOneField to Answer
-    situation = models.TextField()
-    task = models.TextField()
-    action = models.TextField()
-    result = models.TextField()
+    """An answer using the situation, task, action and result fields."""
+
+    proxy_answer_type = Answer.ANSWER_TYPE_STAR
+
+    objects = TypedAnswerManager(Answer.ANSWER_TYPE_STAR)
 
     class Meta:
+        proxy = True
         verbose_name = "STAR Answer"
         verbose_name_plural = "STAR Answers"
 
-    def save(self, *args, **kwargs):
-        self.answer_type = self.ANSWER_TYPE_STAR
-        # enforce required fields presence — though DB-level NOT NULL already
-        # ensures it
-        super().save(*args, **kwargs)
-
 
 class BasicAnswer(Answer):
-    text = models.TextField()
+    """An answer with a single free-text field."""
+
+    proxy_answer_type = Answer.ANSWER_TYPE_BASIC
+
+    objects = TypedAnswerManager(Answer.ANSWER_TYPE_BASIC)
 
     class Meta:
+        proxy = True
         verbose_name = "Basic Answer"
         verbose_name_plural = "Basic Answers"
-
-    def save(self, *args, **kwargs):
-        self.answer_type = self.ANSWER_TYPE_BASIC
-        super().save(*args, **kwargs)
@@ -2,15 +2,22 @@
 Signal handlers for the answers app.
 """
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.db import connection
-from .models import StarAnswer, BasicAnswer
+from questions import search, stats
+from questions.models import Question
+from .bulk import SEARCH_VECTOR_SQL
+from .models import Answer, StarAnswer, BasicAnswer
 
 
+# post_save is sent with the class of the saved instance, so the proxy
+# models are listed too
+@receiver(post_save, sender=Answer)
 @receiver(post_save, sender=StarAnswer)
-def update_star_answer_search_vector(sender, instance, **kwargs):
-    """Update search vector when a STAR answer is saved."""
+@receiver(post_save, sender=BasicAnswer)
+def update_answer_search_vector(sender, instance, **kwargs):
+    """Update search vector when an answer is saved."""
     # Skip if not using Postgres
     if connection.vendor != "postgresql":
         return
@@ -19,41 +26,36 @@ def update_star_answer_search_vector(sender, instance, **kwargs):
     if instance.search_vector is None or kwargs.get("created", False):
         with connection.cursor() as cursor:
             cursor.execute(
-                """
-                UPDATE answers_answer
-                SET search_vector =
-                    setweight(to_tsvector('english', COALESCE(%s, '')), 'A') ||
-                    setweight(to_tsvector('english', COALESCE(%s, '')), 'A') ||
-                    setweight(to_tsvector('english', COALESCE(%s, '')), 'A') ||
-                    setweight(to_tsvector('english', COALESCE(%s, '')), 'A')
-                WHERE id = %s
-            """,
-                [
-                    instance.situation,
-                    instance.task,
-                    instance.action,
-                    instance.result,
-                    instance.pk,
-                ],
+                f"UPDATE answers_answer SET search_vector = "
+                f"{SEARCH_VECTOR_SQL} WHERE id = %s",
+                [instance.pk],
             )
 
 
-@receiver(post_save, sender=BasicAnswer)
-def update_basic_answer_search_vector(sender, instance, **kwargs):
-    """Update search vector when a basic answer is saved."""
-    # Skip if not using Postgres
-    if connection.vendor != "postgresql":
-        return
+def _question_owner_id(answer):
+    """Return the owner of the answer's question, loaded only if needed."""
+    if Answer.question.is_cached(answer):
+        return answer.question.owner_id
+    return (
+        Question.objects.filter(pk=answer.question_id)
+        .values_list("owner_id", flat=True)
+        .first()
+    )
 
-    # Only update if search_vector is empty or just created
-    if instance.search_vector is None or kwargs.get("created", False):
-        with connection.cursor() as cursor:
-            cursor.execute(
-                """
-                UPDATE answers_answer
-                SET search_vector =
-                    setweight(to_tsvector('english', COALESCE(%s, '')), 'A')
-                WHERE id = %s
-            """,
-                [instance.text, instance.pk],
-            )
+
+@receiver(post_save, sender=Answer)
+@receiver(post_save, sender=StarAnswer)
+@receiver(post_save, sender=BasicAnswer)
+@receiver(post_delete, sender=Answer)
+@receiver(post_delete, sender=StarAnswer)
+@receiver(post_delete, sender=BasicAnswer)
+def invalidate_user_stats(sender, instance, **kwargs):
+    """
+    Drop the cached stats of the answer's author and question owner when an
+    answer is added or deleted. Edits change none of the figures, but they
+    change which of the author's questions their search matches.
+    """
+    if kwargs.get("created", True):
+        stats.invalidate([instance.user_id, _question_owner_id(instance)])
+    else:
+        search.invalidate_results([instance.user_id])
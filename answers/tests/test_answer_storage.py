@@ -0,0 +1,143 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from answers.forms import BasicAnswerForm, StarAnswerForm
+from answers.models import Answer, BasicAnswer, StarAnswer
+from questions.models import Question
+from questions.services import QuestionService
+
+
+@pytest.fixture
+def question(user):
+    return Question.objects.create(owner=user, title="Q")
+
+
+def _star(question, user, **kwargs):
+    return StarAnswer.objects.create(
+        question=question,
+        user=user,
+        situation="S",
+        task="T",
+        action="A",
+        result="R",
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db
+class TestAnswerProxyModels:
+    def test_create_is_a_single_insert(self, question, user):
+        with CaptureQueriesContext(connection) as queries:
+            _star(question, user)
+
+        inserts = [q for q in queries if q["sql"].startswith("INSERT")]
+        assert len(inserts) == 1
+        assert Answer.objects.get().answer_type == Answer.ANSWER_TYPE_STAR
+
+    def test_managers_are_limited_to_their_type(self, question, user):
+        star = _star(question, user)
+        basic = BasicAnswer.objects.create(
+            question=question, user=user, text="B"
+        )
+
+        assert list(StarAnswer.objects.all()) == [star]
+        assert list(BasicAnswer.objects.all()) == [basic]
+        assert Answer.objects.count() == 2
+
+    def test_content_is_read_without_joins(self, question, user):
+        _star(question, user)
+
+        with CaptureQueriesContext(connection) as queries:
+            answer = Answer.objects.get()
+
+        assert answer.situation == "S"
+        assert answer.text is None
+        assert "JOIN" not in queries[0]["sql"]
+
+    def test_clean_fields_requires_content_of_the_answer_type(self, user):
+        answer = StarAnswer(situation="S", task="T")
+
+        with pytest.raises(ValidationError) as exc:
+            answer.clean_fields(exclude=["question", "user"])
+
+        assert set(exc.value.message_dict) == {"action", "result"}
+        assert answer.answer_type == Answer.ANSWER_TYPE_STAR
+
+
+def _child_rows(table):
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT * FROM {table} ORDER BY answer_ptr_id")
+        return cursor.fetchall()
+
+
+@pytest.mark.django_db
+class TestChildTableMirroring:
+    """The child tables stay in step until a later migration drops them."""
+
+    def test_writes_are_mirrored_into_the_child_tables(self, question, user):
+        star = _star(question, user)
+        basic = BasicAnswer.objects.create(
+            question=question, user=user, text="B"
+        )
+        star.result = "R2"
+        star.save()
+
+        assert _child_rows("answers_staranswer") == [
+            (star.pk, "S", "T", "A", "R2")
+        ]
+        assert _child_rows("answers_basicanswer") == [(basic.pk, "B")]
+
+    def test_child_table_writes_reach_the_answer(self, question, user):
+        # As the previous release writes: the answer row, then its child
+        basic = Answer.objects.create(
+            question=question,
+            user=user,
+            answer_type=Answer.ANSWER_TYPE_BASIC,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO answers_basicanswer (answer_ptr_id, text) "
+                "VALUES (%s, 'Old')",
+                [basic.pk],
+            )
+            cursor.execute(
+                "UPDATE answers_basicanswer SET text = 'Edited' "
+                "WHERE answer_ptr_id = %s",
+                [basic.pk],
+            )
+
+        assert BasicAnswer.objects.get().text == "Edited"
+        assert _child_rows("answers_basicanswer") == [(basic.pk, "Edited")]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestChildTableDeletes:
+    # Foreign keys are only checked on commit
+    def test_question_delete_removes_child_rows(self, question, user):
+        _star(question, user)
+        BasicAnswer.objects.create(question=question, user=user, text="B")
+
+        QuestionService.delete([question.pk])
+
+        assert not Answer.objects.exists()
+        assert _child_rows("answers_staranswer") == []
+        assert _child_rows("answers_basicanswer") == []
+
+    def test_answer_delete_removes_child_rows(self, question, user):
+        _star(question, user).delete()
+
+        assert _child_rows("answers_staranswer") == []
+
+
+class TestAnswerForms:
+    def test_star_form_requires_every_section(self):
+        form = StarAnswerForm(data={"situation": "S"})
+
+        assert not form.is_valid()
+        assert set(form.errors) == {"task", "action", "result"}
+
+    def test_basic_form_requires_text(self):
+        assert not BasicAnswerForm(data={"text": ""}).is_valid()
+        assert BasicAnswerForm(data={"text": "Because"}).is_valid()
@@ -1,11 +1,18 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
 app_name = "answers"
 
+# The ASGI deployment serves the async version of the detail view
+if settings.ASYNC_VIEWS:
+    detail_view = views.aanswer_detail
+else:
+    detail_view = views.answer_detail
+
 urlpatterns = [
     path("create/<int:question_id>/", views.create_answer, name="create"),
-    path("<int:pk>/", views.answer_detail, name="detail"),
+    path("<int:pk>/", detail_view, name="detail"),
     path("<int:pk>/edit/", views.answer_edit, name="edit"),
     path("<int:pk>/delete/", views.answer_delete, name="delete"),
 ]
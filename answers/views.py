@@ -1,4 +1,9 @@
-from django.shortcuts import render, get_object_or_404, redirect
+from django.shortcuts import (
+    aget_object_or_404,
+    get_object_or_404,
+    redirect,
+    render,
+)
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import Http404
@@ -13,8 +18,10 @@ def create_answer(request, question_id):
     """Create a new answer for a specific question"""
     # Get the question, ensuring it's visible to the user
     try:
-        question = Question.objects.visible_to_user(request.user).get(
-            id=question_id
+        question = (
+            Question.objects.visible_to_user(request.user)
+            .prefetch_related("tags")
+            .get(id=question_id)
         )
     except Question.DoesNotExist:
         # Question doesn't exist or user doesn't have permission to see it
@@ -99,49 +106,69 @@ def create_answer(request, question_id):
     return render(request, "answers/pages/create.html", context)
 
 
-def answer_detail(request, pk):
-    """Display a single answer with full details"""
-    answer = get_object_or_404(
-        Answer.objects.visible_to_user(request.user), pk=pk
+def _answer_detail_queryset(user):
+    """Answers the user may open, with what the page renders loaded."""
+    return (
+        Answer.objects.visible_to_user(user)
+        .select_related("user", "question__owner")
+        .prefetch_related("question__tags")
     )
 
-    # Get the specific answer type (StarAnswer or BasicAnswer)
-    if hasattr(answer, "staranswer"):
-        specific_answer = answer.staranswer
-    elif hasattr(answer, "basicanswer"):
-        specific_answer = answer.basicanswer
-    else:
-        specific_answer = answer
 
-    context = {
+def _answer_detail_context(answer):
+    # The content of both answer types is stored on the answer itself
+    return {
         "answer": answer,
-        "specific_answer": specific_answer,
+        "specific_answer": answer,
         "question": answer.question,
     }
 
+
+def answer_detail(request, pk):
+    """Display a single answer with full details"""
+    answer = get_object_or_404(
+        _answer_detail_queryset(request.user), pk=pk
+    )
+    context = _answer_detail_context(answer)
+
+    return render(request, "answers/pages/detail.html", context)
+
+
+async def aanswer_detail(request, pk):
+    """Async version of ``answer_detail`` for the ASGI deployment."""
+    # Resolve the user asynchronously and reuse it for the template, which
+    # would otherwise load it again through the lazy request.user
+    user = request.user = await request.auser()
+
+    answer = await aget_object_or_404(_answer_detail_queryset(user), pk=pk)
+    context = _answer_detail_context(answer)
+
     return render(request, "answers/pages/detail.html", context)
 
 
 @login_required
 def answer_edit(request, pk):
     """Edit an existing answer - only owner can edit their own answers"""
-    answer = get_object_or_404(Answer, pk=pk, user=request.user)
+    answer = get_object_or_404(
+        Answer.objects.select_related("question").prefetch_related(
+            "question__tags"
+        ),
+        pk=pk,
+        user=request.user,
+    )
 
-    # Get the specific answer type instance
-    if hasattr(answer, "staranswer"):
-        specific_answer = answer.staranswer
+    # Pick the form of the answer's type
+    answer_type = answer.answer_type
+    if answer_type == Answer.ANSWER_TYPE_STAR:
         form_class = StarAnswerForm
-        answer_type = "STAR"
-    elif hasattr(answer, "basicanswer"):
-        specific_answer = answer.basicanswer
+    elif answer_type == Answer.ANSWER_TYPE_BASIC:
         form_class = BasicAnswerForm
-        answer_type = "BASIC"
     else:
         # Fallback - shouldn't happen in normal use
         raise Http404("Answer type not found")
 
     if request.method == "POST":
-        form = form_class(request.POST, instance=specific_answer)
+        form = form_class(request.POST, instance=answer)
         if form.is_valid():
             answer_instance = form.save(commit=False)
             # Ensure ownership and privacy settings remain unchanged
@@ -155,12 +182,12 @@ def answer_edit(request, pk):
             )
             return redirect("answers:detail", pk=answer.pk)
     else:
-        form = form_class(instance=specific_answer)
+        form = form_class(instance=answer)
 
     context = {
         "form": form,
         "answer": answer,
-        "specific_answer": specific_answer,
+        "specific_answer": answer,
         "question": answer.question,
         "answer_type": answer_type,
         "is_edit_mode": True,
@@ -0,0 +1,245 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from answers.models import BasicAnswer, StarAnswer
+from api import views
+from questions.models import Question, Tag
+
+
+@pytest.mark.django_db
+class TestQuestionListAPI:
+    @pytest.fixture
+    def questions(self, user, other_user):
+        tag = Tag.objects.create(
+            name="Leadership", slug="leadership", owner=user, is_public=True
+        )
+        own = Question.objects.create(owner=user, title="My private question")
+        own.tags.add(tag)
+        public = Question.objects.create(
+            owner=other_user,
+            title="Approved public question",
+            is_public=True,
+            status=Question.STATUS_APPROVED,
+        )
+        hidden = Question.objects.create(
+            owner=other_user, title="Someone else's private question"
+        )
+        return own, public, hidden
+
+    def test_lists_questions_visible_to_user(
+        self, authenticated_client, questions
+    ):
+        own, public, _ = questions
+
+        response = authenticated_client.get(reverse("api:question_list"))
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        results = response.json()["results"]
+        assert [row["id"] for row in results] == [public.pk, own.pk]
+        assert results[1]["owner"] == own.owner.username
+        assert results[1]["tags"] == ["Leadership"]
+
+    def test_anonymous_sees_only_public_approved(self, client, questions):
+        _, public, _ = questions
+
+        response = client.get(reverse("api:question_list"))
+
+        assert [row["id"] for row in response.json()["results"]] == [
+            public.pk
+        ]
+
+    def test_fields_selects_returned_fields(
+        self, authenticated_client, questions
+    ):
+        response = authenticated_client.get(
+            reverse("api:question_list"), {"fields": "title,owner"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["results"][0] == {
+            "title": "Approved public question",
+            "owner": questions[1].owner.username,
+        }
+
+    def test_unknown_field_is_400(self, authenticated_client, questions):
+        response = authenticated_client.get(
+            reverse("api:question_list"), {"fields": "title,password"}
+        )
+
+        assert response.status_code == 400
+        assert "password" in response.json()["error"]
+
+    def test_filters_by_tag_and_search(self, authenticated_client, questions):
+        url = reverse("api:question_list")
+
+        by_tag = authenticated_client.get(url, {"tag": "leadership"})
+        by_search = authenticated_client.get(url, {"search": "approved"})
+
+        assert [row["id"] for row in by_tag.json()["results"]] == [
+            questions[0].pk
+        ]
+        assert [row["id"] for row in by_search.json()["results"]] == [
+            questions[1].pk
+        ]
+
+    def test_filters_by_several_tags(self, authenticated_client, user):
+        python = Tag.objects.create(name="Python", slug="python", owner=user)
+        django = Tag.objects.create(name="Django", slug="django", owner=user)
+        both = Question.objects.create(owner=user, title="Both")
+        both.tags.add(python, django)
+        one = Question.objects.create(owner=user, title="One")
+        one.tags.add(python)
+        url = reverse("api:question_list")
+        tags = ["python", "django"]
+
+        every = authenticated_client.get(url, {"tag": tags})
+        some = authenticated_client.get(url, {"tag": tags, "mode": "any"})
+
+        assert [row["id"] for row in every.json()["results"]] == [both.pk]
+        assert [row["id"] for row in some.json()["results"]] == [
+            one.pk,
+            both.pk,
+        ]
+
+    def test_unknown_tag_mode_is_400(self, authenticated_client):
+        response = authenticated_client.get(
+            reverse("api:question_list"), {"tag": "a", "mode": "some"}
+        )
+
+        assert response.status_code == 400
+
+    def test_post_not_allowed(self, authenticated_client):
+        response = authenticated_client.post(reverse("api:question_list"))
+
+        assert response.status_code == 405
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def test_pages_cover_every_question_once(self, authenticated_client, user):
+        Question.objects.bulk_create(
+            Question(owner=user, title=f"Question {i}") for i in range(7)
+        )
+        url = reverse("api:question_list")
+
+        seen = []
+        params = {"limit": 3, "fields": "id"}
+        while True:
+            data = authenticated_client.get(url, params).json()
+            seen.extend(row["id"] for row in data["results"])
+            if not data["next_cursor"]:
+                break
+            params["cursor"] = data["next_cursor"]
+
+        expected = Question.objects.order_by(
+            "-created_at", "-id"
+        ).values_list("id", flat=True)
+        assert seen == list(expected)
+
+    @pytest.mark.parametrize(
+        "params", [{"limit": 0}, {"limit": "ten"}, {"cursor": "not-a-cursor"}]
+    )
+    def test_invalid_parameters_are_400(self, authenticated_client, params):
+        response = authenticated_client.get(
+            reverse("api:question_list"), params
+        )
+
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestDetailAPI:
+    def test_question_detail(self, authenticated_client, user):
+        question = Question.objects.create(owner=user, title="Why us?")
+
+        response = authenticated_client.get(
+            reverse("api:question_detail", args=[question.pk])
+        )
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Why us?"
+        assert response.json()["tags"] == []
+
+    def test_hidden_question_is_404(self, authenticated_client, other_user):
+        question = Question.objects.create(owner=other_user, title="Private")
+
+        response = authenticated_client.get(
+            reverse("api:question_detail", args=[question.pk])
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"error": "Question not found"}
+
+    def test_answer_detail_includes_subclass_content(
+        self, authenticated_client, user
+    ):
+        question = Question.objects.create(owner=user, title="Conflict")
+        answer = StarAnswer.objects.create(
+            question=question,
+            user=user,
+            situation="S",
+            task="T",
+            action="A",
+            result="R",
+        )
+
+        response = authenticated_client.get(
+            reverse("api:answer_detail", args=[answer.pk])
+        )
+
+        data = response.json()
+        assert data["answer_type"] == "STAR"
+        assert data["user"] == user.username
+        assert (data["situation"], data["result"]) == ("S", "R")
+        assert data["text"] is None
+
+
+@pytest.mark.django_db
+class TestAnswerListAPI:
+    def test_filters_by_question(self, authenticated_client, user):
+        first, second = Question.objects.bulk_create(
+            [
+                Question(owner=user, title="First"),
+                Question(owner=user, title="Second"),
+            ]
+        )
+        answer = BasicAnswer.objects.create(
+            question=first, user=user, text="Because"
+        )
+        BasicAnswer.objects.create(question=second, user=user, text="Other")
+
+        response = authenticated_client.get(
+            reverse("api:answer_list"),
+            {"question": first.pk, "fields": "id,text"},
+        )
+
+        assert response.json()["results"] == [
+            {"id": answer.pk, "text": "Because"}
+        ]
+
+
+@pytest.mark.django_db
+class TestEncoding:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_encodes_with_and_without_orjson(
+        self, monkeypatch, authenticated_client, user, use_orjson
+    ):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(views, "orjson", None)
+        question = Question.objects.create(owner=user, title="Encoded")
+
+        response = authenticated_client.get(
+            reverse("api:question_detail", args=[question.pk]),
+            {"fields": "id,created_at"},
+        )
+
+        data = json.loads(response.content)
+        assert data["id"] == question.pk
+        assert data["created_at"].startswith(
+            question.created_at.strftime("%Y-%m-%dT%H:%M:%S")
+        )
@@ -0,0 +1,13 @@
+from django.urls import path
+
+from . import views
+
+app_name = "api"
+
+# Mounted under /api/v1/ in config/urls.py
+urlpatterns = [
+    path("questions/", views.question_list, name="question_list"),
+    path("questions/<int:pk>/", views.question_detail, name="question_detail"),
+    path("answers/", views.answer_list, name="answer_list"),
+    path("answers/<int:pk>/", views.answer_detail, name="answer_detail"),
+]
@@ -0,0 +1,305 @@
+"""
+Versioned JSON read API for questions and answers, mounted at ``/api/v1/``.
+
+Rows are fetched with ``.values()`` and encoded with orjson when it is
+installed, so responses are built without model instances. The endpoints
+apply the same visibility rules as the HTML views (``visible_to_user``) and
+accept:
+
+- ``?fields=id,title`` to return only some fields
+- ``?limit=`` and ``?cursor=`` on lists: results are ordered newest first
+  and ``next_cursor`` in a response fetches the following page (keyset
+  pagination, so deep pages cost the same as the first)
+- ``?search=`` and ``?tag=`` on the question list (``tag`` can be repeated;
+  ``?mode=any`` matches questions with any of the tags instead of all of
+  them), ``?question=`` on the answer list
+"""
+
+import base64
+import json
+from functools import wraps
+
+from django.contrib.postgres.search import SearchQuery
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import F, Q
+from django.http import HttpResponse
+from django.utils.dateparse import parse_datetime
+
+from answers.models import Answer
+from questions.models import Question
+
+try:
+    import orjson
+except ModuleNotFoundError:  # optional, falls back to the json module
+    orjson = None
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+# API field name -> values() expression. Plain strings name a model field of
+# the same name; None marks fields added after the rows are fetched. F()
+# expressions are selected under a "_"-prefixed alias, since the API names
+# may clash with model fields (e.g. "owner").
+QUESTION_FIELDS = {
+    "id": "id",
+    "title": "title",
+    "body": "body",
+    "is_public": "is_public",
+    "status": "status",
+    "owner": F("owner__username"),
+    "created_at": "created_at",
+    "tags": None,
+}
+
+ANSWER_FIELDS = {
+    "id": "id",
+    "question_id": "question_id",
+    "user": F("user__username"),
+    "answer_type": "answer_type",
+    "is_public": "is_public",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    # STAR answer content, null for basic answers
+    "situation": "situation",
+    "task": "task",
+    "action": "action",
+    "result": "result",
+    # Basic answer content, null for STAR answers
+    "text": "text",
+}
+
+# Always fetched: the keyset pagination columns, also used to attach tags
+KEY_FIELDS = ("id", "created_at")
+
+
+class InvalidParameter(ValueError):
+    """A query string parameter could not be used; reported as a 400."""
+
+
+def json_response(data, status=200):
+    """Encode ``data`` compactly, with orjson when it is available."""
+    if orjson is not None:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return HttpResponse(body, status=status, content_type="application/json")
+
+
+def api_view(view):
+    """Allow GET only and report invalid parameters as JSON errors."""
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method != "GET":
+            return json_response(
+                {"error": "Only GET method allowed"}, status=405
+            )
+        try:
+            return view(request, *args, **kwargs)
+        except InvalidParameter as exc:
+            return json_response({"error": str(exc)}, status=400)
+
+    return wrapper
+
+
+def _requested_fields(request, available):
+    """Return the field names selected by ``?fields=``, or all of them."""
+    fields = [
+        name.strip()
+        for name in request.GET.get("fields", "").split(",")
+        if name.strip()
+    ]
+    if not fields:
+        return list(available)
+    unknown = sorted(set(fields) - set(available))
+    if unknown:
+        raise InvalidParameter(
+            f"Unknown fields: {', '.join(unknown)}. "
+            f"Available fields: {', '.join(available)}"
+        )
+    return list(dict.fromkeys(fields))
+
+
+def _values(queryset, available, fields):
+    """Select only the columns needed for ``fields`` as dict rows."""
+    columns = dict.fromkeys(KEY_FIELDS)
+    aliases = {}
+    for name in fields:
+        expression = available[name]
+        if isinstance(expression, str):
+            columns[expression] = None
+        elif isinstance(expression, F):
+            aliases[f"_{name}"] = expression
+    return queryset.values(*columns, **aliases)
+
+
+def _int_param(request, name, default=None):
+    value = request.GET.get(name)
+    if value in (None, ""):
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise InvalidParameter(f"{name} must be an integer")
+
+
+def _encode_cursor(row):
+    key = json.dumps([row["created_at"].isoformat(), row["id"]])
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _decode_cursor(cursor):
+    try:
+        created_at, pk = json.loads(base64.urlsafe_b64decode(cursor))
+        created_at = parse_datetime(created_at)
+        pk = int(pk)
+    except (TypeError, ValueError):
+        created_at = None
+    if created_at is None:
+        raise InvalidParameter("Invalid cursor")
+    return created_at, pk
+
+
+def _paginate(request, queryset):
+    """
+    Apply keyset pagination to ``queryset`` (a ``.values()`` queryset).
+    Returns the rows of the page and the cursor of the next page, if any.
+    """
+    limit = _int_param(request, "limit", DEFAULT_LIMIT)
+    if not 1 <= limit <= MAX_LIMIT:
+        raise InvalidParameter(f"limit must be between 1 and {MAX_LIMIT}")
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        created_at, pk = _decode_cursor(cursor)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+
+    # One extra row tells whether there is a next page
+    rows = list(queryset.order_by("-created_at", "-id")[: limit + 1])
+    if len(rows) > limit:
+        return rows[:limit], _encode_cursor(rows[limit - 1])
+    return rows, None
+
+
+def _attach_tags(rows):
+    """Add each question's tag names to its row - single query."""
+    tags = {}
+    links = (
+        Question.tags.through.objects.filter(
+            question_id__in=[row["id"] for row in rows]
+        )
+        .order_by("tag__name")
+        .values_list("question_id", "tag__name")
+    )
+    for question_id, name in links:
+        tags.setdefault(question_id, []).append(name)
+    for row in rows:
+        row["tags"] = tags.get(row["id"], [])
+
+
+def _serialize(rows, available, fields):
+    """Keep only the requested fields of each row, in request order."""
+    keys = [
+        (name, f"_{name}" if isinstance(available[name], F) else name)
+        for name in fields
+    ]
+    return [{name: row[key] for name, key in keys} for row in rows]
+
+
+@api_view
+def question_list(request):
+    """List and search the questions visible to the user."""
+    fields = _requested_fields(request, QUESTION_FIELDS)
+    questions = Question.objects.visible_to_user(request.user)
+
+    tag_mode = request.GET.get("mode", Question.TAG_MODE_ALL)
+    if tag_mode not in Question.TAG_MODES:
+        raise InvalidParameter("mode must be one of: all, any")
+    questions = questions.tagged(
+        [tag.strip() for tag in request.GET.getlist("tag")], tag_mode
+    )
+
+    search_query = request.GET.get("search", "").strip()
+    if search_query:
+        if connection.vendor == "postgresql":
+            search = SearchQuery(search_query, search_type="websearch")
+            questions = questions.filter(
+                Q(title__icontains=search_query) | Q(search_vector=search)
+            )
+        else:
+            # Fallback to basic search for non-Postgres databases (e.g.,
+            # SQLite in tests)
+            questions = questions.filter(
+                Q(title__icontains=search_query)
+                | Q(body__icontains=search_query)
+            )
+
+    rows, next_cursor = _paginate(
+        request, _values(questions, QUESTION_FIELDS, fields)
+    )
+    if "tags" in fields:
+        _attach_tags(rows)
+
+    return json_response(
+        {
+            "results": _serialize(rows, QUESTION_FIELDS, fields),
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@api_view
+def question_detail(request, pk):
+    """Fetch a single question visible to the user."""
+    fields = _requested_fields(request, QUESTION_FIELDS)
+    row = _values(
+        Question.objects.visible_to_user(request.user).filter(pk=pk),
+        QUESTION_FIELDS,
+        fields,
+    ).first()
+    if row is None:
+        return json_response({"error": "Question not found"}, status=404)
+    if "tags" in fields:
+        _attach_tags([row])
+
+    return json_response(_serialize([row], QUESTION_FIELDS, fields)[0])
+
+
+@api_view
+def answer_list(request):
+    """List the answers visible to the user, optionally for one question."""
+    fields = _requested_fields(request, ANSWER_FIELDS)
+    answers = Answer.objects.visible_to_user(request.user)
+
+    question_id = _int_param(request, "question")
+    if question_id is not None:
+        answers = answers.filter(question_id=question_id)
+
+    rows, next_cursor = _paginate(
+        request, _values(answers, ANSWER_FIELDS, fields)
+    )
+
+    return json_response(
+        {
+            "results": _serialize(rows, ANSWER_FIELDS, fields),
+            "next_cursor": next_cursor,
+        }
+    )
+
+
+@api_view
+def answer_detail(request, pk):
+    """Fetch a single answer visible to the user."""
+    fields = _requested_fields(request, ANSWER_FIELDS)
+    row = _values(
+        Answer.objects.visible_to_user(request.user).filter(pk=pk),
+        ANSWER_FIELDS,
+        fields,
+    ).first()
+    if row is None:
+        return json_response({"error": "Answer not found"}, status=404)
+
+    return json_response(_serialize([row], ANSWER_FIELDS, fields)[0])
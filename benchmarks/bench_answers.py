@@ -0,0 +1,98 @@
+"""
+Read and write path benchmarks for answer storage.
+
+STAR sections and basic answer text are stored in the ``answers_answer`` row
+(``StarAnswer`` and ``BasicAnswer`` are proxy models), so:
+
+- ``read_*`` load answers with their content without joining a child table
+- ``create_*`` save one answer with one INSERT (plus the search vector
+  UPDATE of the post_save handler on PostgreSQL)
+- ``bulk_create`` inserts a batch with a single ``bulk_create`` call
+
+The ``Queries`` column shows the statement count of each path.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db.models import Count
+
+from answers.models import Answer, BasicAnswer, StarAnswer
+from questions.models import Question
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+BULK_SIZE = 500
+
+
+@pytest.fixture
+def bench_question():
+    """The private question with the most answers."""
+    return (
+        Question.objects.filter(
+            owner__username__startswith="bench_", is_public=False
+        )
+        .annotate(answer_count=Count("answers"))
+        .order_by("-answer_count")
+        .first()
+    )
+
+
+def _read(queryset):
+    # .all() clones the queryset, so every round runs the query again
+    return [
+        [getattr(answer, field) for field in answer.content_fields]
+        for answer in queryset.all()
+    ]
+
+
+def test_read_question_answers(benchmark, bench_question):
+    rows = benchmark(
+        _read, bench_question.answers.select_related("user").all()
+    )
+
+    assert len(rows) == bench_question.answer_count
+
+
+def test_read_user_answers(benchmark, bench_question):
+    rows = benchmark(
+        _read, Answer.objects.filter(user_id=bench_question.owner_id)
+    )
+
+    assert rows
+
+
+@pytest.mark.parametrize("model", (StarAnswer, BasicAnswer))
+def test_create_answer(benchmark, bench_question, model):
+    fields = model.CONTENT_FIELDS[model.proxy_answer_type]
+    content = dict.fromkeys(fields, "Benchmark text")
+
+    answer = benchmark(
+        model.objects.create,
+        question=bench_question,
+        user_id=bench_question.owner_id,
+        **content,
+    )
+
+    assert answer.answer_type == model.proxy_answer_type
+
+
+def test_bulk_create(benchmark, bench_question):
+    def build():
+        return [
+            Answer(
+                question=bench_question,
+                user_id=bench_question.owner_id,
+                answer_type=Answer.ANSWER_TYPE_STAR,
+                situation="S",
+                task="T",
+                action="A",
+                result="R",
+            )
+            for _ in range(BULK_SIZE)
+        ]
+
+    answers = benchmark(lambda: Answer.objects.bulk_create(build()))
+
+    assert len(answers) == BULK_SIZE
@@ -0,0 +1,109 @@
+"""
+Template rendering benchmarks for the card-heavy list pages.
+
+Renders one page of question cards (12 per page, like the list views) with:
+
+- ``uncached``/``cached``: the filesystem + app_directories loaders with or
+  without the cached loader, which Django wraps them in by default (with
+  ``APP_DIRS`` and no ``loaders`` option, as in settings)
+- ``include``/``render_each``: the old ``{% for %}{% include %}`` loop or the
+  ``{% render_each %}`` tag now used by the list templates
+
+``cached-include`` is the previous behaviour and ``cached-render_each`` the
+current one; ``uncached`` only shows what the default cached loader saves.
+"""
+
+import pytest
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db.models import Count
+from django.template import Engine, RequestContext
+
+from questions.models import Question
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+BASE_LOADERS = [
+    "django.template.loaders.filesystem.Loader",
+    "django.template.loaders.app_directories.Loader",
+]
+
+LOADERS = {
+    "uncached": BASE_LOADERS,
+    "cached": [("django.template.loaders.cached.Loader", BASE_LOADERS)],
+}
+
+LOOPS = {
+    "include": (
+        "{% for question in questions %}"
+        '{% include "questions/components/CARD.html" %}'
+        "{% endfor %}"
+    ),
+    "render_each": (
+        "{% load ui_extras %}"
+        '{% render_each questions "questions/components/CARD.html" '
+        "as question %}"
+    ),
+}
+
+CARDS = {
+    "user_list": "user_question_card",
+    "public_list": "public_question_card",
+}
+
+
+def _engine(loaders):
+    options = settings.TEMPLATES[0]
+    return Engine(
+        dirs=options["DIRS"],
+        loaders=loaders,
+        context_processors=options["OPTIONS"]["context_processors"],
+        libraries={"ui_extras": "config.templatetags.ui_extras"},
+    )
+
+
+@pytest.fixture
+def bench_user():
+    return (
+        User.objects.filter(username__startswith="bench_")
+        .annotate(question_count=Count("questions"))
+        .order_by("-question_count")
+        .first()
+    )
+
+
+@pytest.mark.parametrize("page", CARDS)
+@pytest.mark.parametrize("loop", LOOPS)
+@pytest.mark.parametrize("loader", LOADERS)
+def test_render_card_grid(benchmark, rf, bench_user, loader, loop, page):
+    if page == "user_list":
+        questions = Question.objects.filter(owner=bench_user)
+    else:
+        questions = Question.objects.filter(
+            is_public=True, status=Question.STATUS_APPROVED
+        )
+    questions = list(
+        questions.select_related("owner").prefetch_related("tags")[:12]
+    )
+    for question in questions:
+        question.answer_count = 0
+
+    request = rf.get("/")
+    request.user = bench_user
+    grid = _engine(LOADERS[loader]).from_string(
+        LOOPS[loop].replace("CARD", CARDS[page])
+    )
+
+    def render():
+        return grid.render(
+            RequestContext(
+                request,
+                {"questions": questions, "saved_question_titles": set()},
+            )
+        )
+
+    html = benchmark(render)
+
+    assert html.count("card-body") == len(questions)
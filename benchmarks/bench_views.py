@@ -0,0 +1,160 @@
+"""
+In-process benchmarks for the read-heavy views.
+
+Each view function is called directly with a ``RequestFactory`` request, so
+the numbers exclude middleware and HTTP overhead. See ``conftest.py`` for how
+to run the suite and read its output.
+"""
+
+import itertools
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.db.models import Count
+
+from answers.models import Answer
+from answers.views import answer_detail
+from questions.models import Question, Tag
+from questions.views.check_tag_exists import check_tag_exists
+from questions.views.public_question_list import (
+    SORT_OPTIONS as PUBLIC_SORT_OPTIONS,
+    public_question_list,
+)
+from questions.views.question_detail import question_detail
+from questions.views.question_list import (
+    SORT_OPTIONS,
+    VIEW_OPTIONS,
+    question_list,
+)
+
+User = get_user_model()
+
+pytestmark = pytest.mark.django_db
+
+SEARCH_TERMS = ("", "team")
+
+
+@pytest.fixture
+def bench_user():
+    """The generated user with the largest question collection."""
+    return (
+        User.objects.filter(username__startswith="bench_")
+        .annotate(question_count=Count("questions"))
+        .order_by("-question_count")
+        .first()
+    )
+
+
+def _get(rf, user, path="/", **params):
+    request = rf.get(path, {k: v for k, v in params.items() if v})
+    request.user = user
+    return request
+
+
+@pytest.mark.parametrize(
+    "sort,view,search,with_tag",
+    list(
+        itertools.product(
+            [value for value, _ in SORT_OPTIONS],
+            [value for value, _ in VIEW_OPTIONS],
+            SEARCH_TERMS,
+            (False, True),
+        )
+    ),
+)
+def test_question_list(
+    benchmark, rf, bench_user, sort, view, search, with_tag
+):
+    tag = ""
+    if with_tag:
+        tag = (
+            Tag.objects.filter(questions__owner=bench_user)
+            .values_list("slug", flat=True)
+            .first()
+        )
+    request = _get(
+        rf, bench_user, sort=sort, view=view, search=search, tag=tag
+    )
+
+    response = benchmark(question_list, request)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("authenticated", (False, True))
+@pytest.mark.parametrize(
+    "sort,search,with_tag",
+    list(
+        itertools.product(
+            [value for value, _ in PUBLIC_SORT_OPTIONS],
+            SEARCH_TERMS,
+            (False, True),
+        )
+    ),
+)
+def test_public_question_list(
+    benchmark, rf, bench_user, sort, search, with_tag, authenticated
+):
+    tag = ""
+    if with_tag:
+        tag = (
+            Tag.objects.filter(is_public=True)
+            .values_list("slug", flat=True)
+            .first()
+        )
+    user = bench_user if authenticated else AnonymousUser()
+    request = _get(rf, user, sort=sort, search=search, tag=tag)
+
+    response = benchmark(public_question_list, request)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("visibility", ("private", "public"))
+def test_question_detail(benchmark, rf, bench_user, visibility):
+    if visibility == "private":
+        question = (
+            Question.objects.filter(owner=bench_user, is_public=False)
+            .annotate(answer_count=Count("answers"))
+            .order_by("-answer_count")
+            .first()
+        )
+    else:
+        question = Question.objects.filter(
+            is_public=True, status=Question.STATUS_APPROVED
+        ).first()
+    request = _get(rf, bench_user)
+
+    response = benchmark(question_detail, request, pk=question.pk)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "answer_type", (Answer.ANSWER_TYPE_STAR, Answer.ANSWER_TYPE_BASIC)
+)
+def test_answer_detail(benchmark, rf, bench_user, answer_type):
+    answer = Answer.objects.filter(
+        user=bench_user, answer_type=answer_type
+    ).first()
+    request = _get(rf, bench_user)
+
+    response = benchmark(answer_detail, request, pk=answer.pk)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("lookup", ("public", "personal", "missing"))
+def test_check_tag_exists(benchmark, rf, bench_user, lookup):
+    if lookup == "public":
+        name = Tag.objects.filter(is_public=True).first().name
+    elif lookup == "personal":
+        name = Tag.objects.filter(owner=bench_user).first().name
+    else:
+        name = "no such tag"
+    request = _get(rf, bench_user, name=name)
+
+    response = benchmark(check_tag_exists, request)
+
+    assert response.status_code == 200
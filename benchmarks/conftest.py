@@ -0,0 +1,127 @@
+"""
+Shared fixtures and reporting for the in-process benchmark suite.
+
+Benchmark modules are named ``bench_*.py`` so the normal test run never
+collects them. Run them explicitly, against SQLite by default or against a
+local Postgres by setting ``TEST_DATABASE_URL``:
+
+    python -m pytest benchmarks/bench_views.py --create-db
+    TEST_DATABASE_URL=postgres://localhost/star_master \\
+        python -m pytest benchmarks/bench_views.py --create-db
+
+Set ``BENCHMARK_JSON=<path>`` to also write the results as JSON.
+"""
+
+import json
+import os
+import statistics
+import time
+import tracemalloc
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# Results collected by the ``benchmark`` fixture, reported at the end of the
+# session by ``pytest_terminal_summary``.
+RESULTS = []
+
+ROUNDS = int(os.environ.get("BENCHMARK_ROUNDS", 5))
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Seed one shared benchmark dataset for the whole session."""
+    with django_db_blocker.unblock():
+        call_command(
+            "seed_benchmark_data",
+            users=int(os.environ.get("BENCHMARK_USERS", 50)),
+            questions_per_user=int(
+                os.environ.get("BENCHMARK_QUESTIONS_PER_USER", 200)
+            ),
+            flush=True,
+            verbosity=0,
+        )
+
+
+@pytest.fixture
+def benchmark(request):
+    """Time a callable the way pytest-benchmark would.
+
+    ``benchmark(func)`` runs ``func`` once to warm caches, once under
+    ``CaptureQueriesContext`` and ``tracemalloc`` to record the query count
+    and peak allocation, and then ``BENCHMARK_ROUNDS`` more times for the
+    timings. Returns the result of the last call.
+    """
+
+    def run(func, *args, **kwargs):
+        func(*args, **kwargs)
+
+        tracemalloc.start()
+        try:
+            with CaptureQueriesContext(connection) as queries:
+                func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        timings = []
+        for _ in range(ROUNDS):
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        RESULTS.append(
+            {
+                "name": request.node.name,
+                "vendor": connection.vendor,
+                "rounds": ROUNDS,
+                "min_ms": round(min(timings), 3),
+                "max_ms": round(max(timings), 3),
+                "mean_ms": round(statistics.mean(timings), 3),
+                "median_ms": round(statistics.median(timings), 3),
+                "queries": len(queries),
+                "peak_alloc_kib": round(peak / 1024, 1),
+            }
+        )
+        return result
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not RESULTS:
+        return
+
+    columns = (
+        ("Name", "name"),
+        ("Min (ms)", "min_ms"),
+        ("Max (ms)", "max_ms"),
+        ("Mean (ms)", "mean_ms"),
+        ("Median (ms)", "median_ms"),
+        ("Queries", "queries"),
+        ("Peak alloc (KiB)", "peak_alloc_kib"),
+    )
+    rows = [[str(r[key]) for _, key in columns] for r in RESULTS]
+    widths = [
+        max(len(title), *(len(row[i]) for row in rows))
+        for i, (title, _) in enumerate(columns)
+    ]
+
+    terminalreporter.write_sep(
+        "-", f"benchmark ({RESULTS[0]['vendor']}): {len(RESULTS)} tests"
+    )
+    terminalreporter.write_line(
+        "  ".join(t.ljust(w) for (t, _), w in zip(columns, widths))
+    )
+    for row in rows:
+        terminalreporter.write_line(
+            "  ".join(cell.ljust(w) for cell, w in zip(row, widths))
+        )
+
+    path = os.environ.get("BENCHMARK_JSON")
+    if path:
+        with open(path, "w") as fh:
+            json.dump(RESULTS, fh, indent=2)
+        terminalreporter.write_line(f"Benchmark results written to {path}")
@@ -0,0 +1,243 @@
+"""
+Run independent read queries concurrently.
+
+List pages issue several queries that do not depend on each other (the page,
+its COUNT, the filter dropdown's tags, the user's saved titles, ...). Against
+a remote database each costs a network round trip, so running them one after
+another makes page latency the sum of the round trips.
+
+``fetch_concurrently`` runs them on a small shared thread pool instead, so
+the latency approaches that of the slowest query. Each worker thread keeps
+its own persistent database connection (``CONN_MAX_AGE``), giving a fixed
+set of connections reused across requests. ``paginate_concurrently`` runs a
+page query and its COUNT the same way; ``paginate_ids_concurrently`` pages a
+result whose ordered ids are already known. The ``a``-prefixed functions
+are the equivalents for async views.
+
+Queries fall back to running one after another on the current connection
+when ``QUERY_FANOUT_WORKERS`` is 0, or inside a transaction, whose
+uncommitted writes other connections could not see (e.g. in tests).
+
+The execute wrappers installed on the calling thread's connections (such as
+``QueryInstrumentationMiddleware``'s) are installed on the worker's
+connection for the duration of its task, so queries run on the pool are
+still measured.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import close_old_connections, connections
+from django.db.models import QuerySet
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.QUERY_FANOUT_WORKERS,
+                thread_name_prefix="query-fanout",
+            )
+        return _executor
+
+
+def _evaluate(task):
+    """Evaluate a queryset into a list, or call a function."""
+    if isinstance(task, QuerySet):
+        return list(task)
+    return task()
+
+
+def _execute_wrappers():
+    """Return the execute wrappers of the current thread's connections."""
+    return {
+        conn.alias: list(conn.execute_wrappers)
+        for conn in connections.all(initialized_only=True)
+        if conn.execute_wrappers
+    }
+
+
+def _evaluate_in_worker(task, wrappers):
+    try:
+        with ExitStack() as stack:
+            for alias, alias_wrappers in wrappers.items():
+                for wrapper in alias_wrappers:
+                    stack.enter_context(
+                        connections[alias].execute_wrapper(wrapper)
+                    )
+            return _evaluate(task)
+    finally:
+        # Worker threads never see request_finished, so they apply
+        # CONN_MAX_AGE and the health checks to their connection here.
+        close_old_connections()
+
+
+def _can_fan_out(tasks):
+    return (
+        len(tasks) > 1
+        and settings.QUERY_FANOUT_WORKERS > 0
+        and not any(
+            conn.in_atomic_block
+            for conn in connections.all(initialized_only=True)
+        )
+    )
+
+
+def _pool_wrappers(tasks):
+    """
+    Return the execute wrappers to run ``tasks`` with on the pool, or None
+    if they must run on the current connection.
+    """
+    if not _can_fan_out(tasks):
+        return None
+    return _execute_wrappers()
+
+
+def fetch_concurrently(**tasks):
+    """
+    Evaluate independent read queries concurrently.
+
+    Each keyword argument is a queryset, evaluated into a list, or a
+    function taking no arguments, such as ``queryset.count`` or
+    ``queryset.first``. Returns a dict of the results by keyword::
+
+        results = fetch_concurrently(
+            tags=Tag.objects.order_by("name"),
+            total=Question.objects.count,
+        )
+    """
+    wrappers = _pool_wrappers(tasks)
+    if wrappers is None:
+        return {name: _evaluate(task) for name, task in tasks.items()}
+
+    executor = _get_executor()
+    futures = {
+        name: executor.submit(_evaluate_in_worker, task, wrappers)
+        for name, task in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+async def afetch_concurrently(**tasks):
+    """Async version of ``fetch_concurrently``."""
+    wrappers = await sync_to_async(_pool_wrappers)(tasks)
+    if wrappers is None:
+        return {
+            name: await sync_to_async(_evaluate)(task)
+            for name, task in tasks.items()
+        }
+
+    executor = _get_executor()
+    results = await asyncio.gather(
+        *(
+            asyncio.wrap_future(
+                executor.submit(_evaluate_in_worker, task, wrappers)
+            )
+            for task in tasks.values()
+        )
+    )
+    return dict(zip(tasks, results))
+
+
+def _page_tasks(queryset, per_page, page_number):
+    """Return the requested page number and the COUNT and page tasks."""
+    try:
+        number = int(page_number)
+    except (TypeError, ValueError):
+        number = 1
+    # Numbers below 1 are out of range; _page falls back to the last page
+    bottom = max(number - 1, 0) * per_page
+    return number, {
+        "_count": queryset.count,
+        "_rows": queryset[bottom:bottom + per_page],
+    }
+
+
+def _page(queryset, per_page, number, results):
+    """
+    Build the page from the fetched rows. If the requested number was out of
+    range, the page falls back to the last one, whose ``object_list`` is
+    still an unevaluated queryset.
+    """
+    paginator = Paginator(queryset, per_page)
+    # Paginator.count is a cached property; setting it skips the COUNT
+    paginator.count = results.pop("_count")
+    rows = results.pop("_rows")
+    page_obj = paginator.get_page(number)
+    if page_obj.number == number:
+        page_obj.object_list = rows
+    return page_obj
+
+
+def paginate_concurrently(queryset, per_page, page_number, **tasks):
+    """
+    Paginate ``queryset`` like ``Paginator.get_page``, running the page
+    query and the COUNT concurrently with each other and with ``tasks``.
+
+    Returns the page, whose ``object_list`` is an evaluated list, and the
+    results of ``tasks`` as returned by ``fetch_concurrently``.
+    """
+    number, page_tasks = _page_tasks(queryset, per_page, page_number)
+    results = fetch_concurrently(**page_tasks, **tasks)
+    page_obj = _page(queryset, per_page, number, results)
+    if isinstance(page_obj.object_list, QuerySet):
+        page_obj.object_list = list(page_obj.object_list)
+    return page_obj, results
+
+
+async def apaginate_concurrently(queryset, per_page, page_number, **tasks):
+    """Async version of ``paginate_concurrently``."""
+    number, page_tasks = _page_tasks(queryset, per_page, page_number)
+    results = await afetch_concurrently(**page_tasks, **tasks)
+    page_obj = _page(queryset, per_page, number, results)
+    if isinstance(page_obj.object_list, QuerySet):
+        page_obj.object_list = [row async for row in page_obj.object_list]
+    return page_obj, results
+
+
+def _id_page(ids, queryset, per_page, page_number):
+    """Return the page of ``ids`` and the task loading its rows."""
+    page_obj = Paginator(ids, per_page).get_page(page_number)
+    return page_obj, {"_rows": queryset.filter(pk__in=page_obj.object_list)}
+
+
+def _id_page_rows(page_obj, results):
+    """Replace the page's ids with the fetched rows, in the same order."""
+    rows = {row.pk: row for row in results.pop("_rows")}
+    # Rows deleted since the id list was built are left out
+    page_obj.object_list = [
+        rows[pk] for pk in page_obj.object_list if pk in rows
+    ]
+    return page_obj
+
+
+def paginate_ids_concurrently(ids, queryset, per_page, page_number, **tasks):
+    """
+    Paginate a result already known as an ordered list of ``ids`` (e.g.
+    cached), like ``paginate_concurrently``: the page is sliced from the
+    list, so there is no COUNT, and only its rows are loaded from
+    ``queryset`` by id, concurrently with ``tasks``. Pass the rows' base
+    queryset rather than the one the ids came from, so filters that found
+    them (e.g. a full-text search) do not run again for every page.
+    """
+    page_obj, page_tasks = _id_page(ids, queryset, per_page, page_number)
+    results = fetch_concurrently(**page_tasks, **tasks)
+    return _id_page_rows(page_obj, results), results
+
+
+async def apaginate_ids_concurrently(
+    ids, queryset, per_page, page_number, **tasks
+):
+    """Async version of ``paginate_ids_concurrently``."""
+    page_obj, page_tasks = _id_page(ids, queryset, per_page, page_number)
+    results = await afetch_concurrently(**page_tasks, **tasks)
+    return _id_page_rows(page_obj, results), results
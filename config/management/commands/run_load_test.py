@@ -0,0 +1,508 @@
+"""
+Management command to load test the main user journeys over HTTP.
+
+Drives a running server (or a gunicorn instance started with the project's
+``gunicorn.conf.py``) with a weighted mix of journeys and reports latency
+percentiles and throughput per endpoint as JSON, so results can be compared
+across commits.
+
+Intended to be run against a dataset generated by ``seed_benchmark_data``:
+
+    python manage.py seed_benchmark_data --users 1000 --questions-per-user 100
+    python manage.py run_load_test --start-server --duration 60 \\
+        --output load-test.json
+
+Virtual users are logged in by creating sessions directly in the database,
+so a server started separately must use the same ``DJANGO_SECRET_KEY``.
+
+``--server`` picks the deployment started by ``--start-server``: the gthread
+WSGI setup (``gunicorn.conf.py``) or the uvicorn ASGI setup with async views
+(``gunicorn_asgi.conf.py``). The report then also includes the server's
+memory use, so the two can be compared at the same concurrency:
+
+    python manage.py run_load_test --start-server --server gthread \
+        --concurrency 50 --output gthread.json
+    python manage.py run_load_test --start-server --server uvicorn \
+        --concurrency 50 --output uvicorn.json
+"""
+
+import json
+import math
+import os
+import random
+import socket
+import string
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+    get_user_model,
+)
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management.base import BaseCommand, CommandError
+
+from questions.models import Question
+from questions.management.commands.seed_benchmark_data import WORDS
+
+User = get_user_model()
+
+# Server name -> (gunicorn config file, application module)
+SERVERS = {
+    "gthread": ("gunicorn.conf.py", "config.wsgi"),
+    "uvicorn": ("gunicorn_asgi.conf.py", "config.asgi"),
+}
+
+# Journey name -> relative weight in the request mix
+JOURNEYS = {
+    "browse_public_list": 40,
+    "search": 20,
+    "question_detail": 20,
+    "save_public_question": 8,
+    "create_star_answer": 8,
+    "moderate": 4,
+}
+
+
+def percentile(samples, pct):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not samples:
+        return None
+    rank = max(math.ceil(pct / 100 * len(samples)), 1)
+    return samples[rank - 1]
+
+
+def summarise(results, elapsed):
+    """Build the per-endpoint report from ``{endpoint: [(ms, status)]}``."""
+    report = {}
+    for endpoint, samples in sorted(results.items()):
+        latencies = sorted(ms for ms, _ in samples)
+        statuses = defaultdict(int)
+        for _, status in samples:
+            statuses[str(status)] += 1
+        report[endpoint] = {
+            "requests": len(samples),
+            "errors": sum(
+                1 for _, status in samples if not 200 <= status < 400
+            ),
+            "statuses": dict(statuses),
+            "throughput_rps": round(len(samples) / elapsed, 2),
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+        }
+    return report
+
+
+def process_tree_rss_kib(pid):
+    """
+    Return the resident memory of a process and all its descendants in KiB,
+    read from ``/proc``. Returns None where ``/proc`` is not available.
+    """
+    parents = {}
+    rss = {}
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/status") as fh:
+                status = dict(
+                    line.split(":", 1) for line in fh if ":" in line
+                )
+        except OSError:
+            continue
+        parents[int(entry)] = int(status["PPid"])
+        rss[int(entry)] = int(status.get("VmRSS", "0 kB").split()[0])
+
+    tree = {pid}
+    added = True
+    while added:
+        children = {p for p, ppid in parents.items() if ppid in tree}
+        added = bool(children - tree)
+        tree |= children
+    if pid not in rss:
+        return None
+    return sum(rss.get(p, 0) for p in tree)
+
+
+class _MemorySampler(threading.Thread):
+    """Record the peak memory of a process tree until stopped."""
+
+    def __init__(self, pid, interval=0.5):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.peak_kib = 0
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.is_set():
+            self.peak_kib = max(
+                self.peak_kib, process_tree_rss_kib(self.pid) or 0
+            )
+            self._stopped.wait(self.interval)
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Report redirects (e.g. after a successful POST) as the response."""
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class Command(BaseCommand):
+    help = "Load test the main user journeys and report latency as JSON"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--base-url",
+            default="http://127.0.0.1:8765",
+            help="Server to test (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--start-server",
+            action="store_true",
+            help="Start gunicorn with --server's config on --base-url's port",
+        )
+        parser.add_argument(
+            "--server",
+            choices=sorted(SERVERS),
+            default="gthread",
+            help="Deployment to start with --start-server "
+            "(default: %(default)s)",
+        )
+        parser.add_argument(
+            "--duration",
+            type=float,
+            default=30,
+            help="Seconds to generate load for",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=10,
+            help="Number of concurrent virtual users",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=float,
+            default=3,
+            help="Seconds of unrecorded load before measuring",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="bench",
+            help="Username prefix used by seed_benchmark_data",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed for repeatability"
+        )
+        parser.add_argument(
+            "--output", help="Write the JSON report to this file"
+        )
+
+    def handle(self, *args, **options):
+        self.base_url = options["base_url"].rstrip("/")
+        self.rng = random.Random(options["seed"])
+        self._prepare_data(options["prefix"])
+
+        server = sampler = None
+        memory = {}
+        if options["start_server"]:
+            server = self._start_server(options["server"])
+        try:
+            if options["warmup"]:
+                self._run(options["warmup"], options["concurrency"])
+            if server:
+                memory["idle_rss_kib"] = process_tree_rss_kib(server.pid)
+                sampler = _MemorySampler(server.pid)
+                sampler.start()
+            results, elapsed = self._run(
+                options["duration"], options["concurrency"]
+            )
+        finally:
+            if sampler:
+                sampler.stop()
+            if server:
+                server.terminate()
+                server.wait(timeout=30)
+
+        if sampler and memory["idle_rss_kib"] is not None:
+            memory["peak_rss_kib"] = sampler.peak_kib
+            # Memory added by holding --concurrency connections open
+            memory["rss_per_connection_kib"] = round(
+                (sampler.peak_kib - memory["idle_rss_kib"])
+                / options["concurrency"],
+                1,
+            )
+
+        report = {
+            "commit": self._git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "base_url": self.base_url,
+            "duration_s": round(elapsed, 2),
+            "server": options["server"] if server else None,
+            "concurrency": options["concurrency"],
+            "server_memory": memory or None,
+            "total_requests": sum(len(r) for r in results.values()),
+            "endpoints": summarise(results, elapsed),
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as fh:
+                fh.write(output)
+            self.stdout.write(
+                self.style.SUCCESS(f"Report written to {options['output']}")
+            )
+        else:
+            self.stdout.write(output)
+
+    # Setup
+
+    def _prepare_data(self, prefix):
+        """Select users and question ids and log the users in."""
+        users = list(
+            User.objects.filter(username__startswith=f"{prefix}_")
+            .exclude(is_superuser=True)
+            .order_by("?")[:50]
+        )
+        if not users:
+            raise CommandError(
+                f'No users prefixed "{prefix}_" found. Run '
+                "seed_benchmark_data first."
+            )
+        moderator, _ = User.objects.get_or_create(
+            username=f"{prefix}_moderator",
+            defaults={"is_staff": True, "is_superuser": True},
+        )
+
+        self.sessions = [self._session_for(user) for user in users]
+        self.moderator_session = self._session_for(moderator)
+        self.private_question_ids = {
+            user.pk: list(
+                Question.objects.filter(owner=user, is_public=False)
+                .values_list("pk", flat=True)[:100]
+            )
+            for user in users
+        }
+        self.public_question_ids = list(
+            Question.objects.filter(
+                is_public=True, status=Question.STATUS_APPROVED
+            )
+            .order_by("?")
+            .values_list("pk", flat=True)[:1000]
+        )
+        self.pending_question_ids = list(
+            Question.objects.filter(
+                is_public=True, status=Question.STATUS_PENDING
+            ).values_list("pk", flat=True)[:1000]
+        )
+        if not self.public_question_ids:
+            raise CommandError("No approved public questions to test with.")
+        # Browse at most the first 50 pages of 12 questions
+        self.public_pages = max(
+            1, min(len(self.public_question_ids) // 12, 50)
+        )
+
+    def _session_for(self, user):
+        """Create an authenticated session and CSRF token for ``user``."""
+        session = SessionStore()
+        session[SESSION_KEY] = str(user.pk)
+        session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+        session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+        session.create()
+        csrf_token = "".join(
+            self.rng.choices(string.ascii_letters + string.digits, k=32)
+        )
+        return {
+            "user_id": user.pk,
+            "cookie": (
+                f"{settings.SESSION_COOKIE_NAME}={session.session_key}; "
+                f"{settings.CSRF_COOKIE_NAME}={csrf_token}"
+            ),
+            "csrf_token": csrf_token,
+        }
+
+    def _start_server(self, name):
+        host, _, port = self.base_url.split("://", 1)[1].partition(":")
+        port = int(port or 80)
+        config_file, application = SERVERS[name]
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "--config",
+                str(settings.BASE_DIR / config_file),
+                "--bind",
+                f"{host}:{port}",
+                application,
+            ],
+            cwd=settings.BASE_DIR,
+            # Sessions are signed, so the server must share our secret key.
+            env={**os.environ, "DJANGO_SECRET_KEY": settings.SECRET_KEY},
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection((host, port), timeout=1).close()
+                return server
+            except OSError:
+                if server.poll() is not None:
+                    break
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError("gunicorn did not start listening in time")
+
+    def _git_commit(self):
+        try:
+            return subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR,
+                text=True,
+                stderr=subprocess.DEVNULL,
+            ).strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    # Load generation
+
+    def _run(self, duration, concurrency):
+        results = defaultdict(list)
+        lock = threading.Lock()
+        deadline = time.monotonic() + duration
+        opener = urllib.request.build_opener(_NoRedirect)
+        journeys, weights = zip(*JOURNEYS.items())
+
+        def worker(worker_id):
+            rng = random.Random(self.rng.random() + worker_id)
+            while time.monotonic() < deadline:
+                journey = rng.choices(journeys, weights)[0]
+                for endpoint, request in getattr(self, f"_{journey}")(rng):
+                    ms, status = self._send(opener, request)
+                    with lock:
+                        results[endpoint].append((ms, status))
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [
+                pool.submit(worker, i) for i in range(concurrency)
+            ]:
+                future.result()
+        return results, time.monotonic() - started
+
+    def _send(self, opener, request):
+        started = time.perf_counter()
+        try:
+            with opener.open(request, timeout=30) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as exc:
+            exc.read()
+            status = exc.code
+        except (urllib.error.URLError, OSError):
+            status = 0
+        return (time.perf_counter() - started) * 1000, status
+
+    def _request(self, path, session=None, data=None, params=None):
+        url = f"{self.base_url}{path}"
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        headers = {}
+        if session:
+            headers["Cookie"] = session["cookie"]
+        if data is not None:
+            headers["X-CSRFToken"] = session["csrf_token"]
+            headers["Accept"] = "application/json"
+            data = urlencode(data).encode()
+        return urllib.request.Request(url, data=data, headers=headers)
+
+    # Journeys - each yields (endpoint, request) pairs
+
+    def _browse_public_list(self, rng):
+        session = rng.choice(self.sessions + [None])
+        for page in rng.sample(
+            range(1, self.public_pages + 1), min(3, self.public_pages)
+        ):
+            yield "public_list", self._request(
+                "/questions/public/", session, params={"page": page}
+            )
+
+    def _search(self, rng):
+        session = rng.choice(self.sessions)
+        term = rng.choice(WORDS)
+        yield "public_list_search", self._request(
+            "/questions/public/", session, params={"search": term}
+        )
+        yield "question_list_search", self._request(
+            "/questions/", session, params={"search": term}
+        )
+
+    def _question_detail(self, rng):
+        session = rng.choice(self.sessions)
+        question_id = rng.choice(self.public_question_ids)
+        yield "question_detail_public", self._request(
+            f"/questions/{question_id}/", session
+        )
+        private_ids = self.private_question_ids[session["user_id"]]
+        if private_ids:
+            yield "question_detail_private", self._request(
+                f"/questions/{rng.choice(private_ids)}/", session
+            )
+
+    def _save_public_question(self, rng):
+        session = rng.choice(self.sessions)
+        question_id = rng.choice(self.public_question_ids)
+        yield "save_public_question", self._request(
+            f"/questions/save/{question_id}/", session, data={}
+        )
+
+    def _create_star_answer(self, rng):
+        session = rng.choice(self.sessions)
+        private_ids = self.private_question_ids[session["user_id"]]
+        if not private_ids:
+            return
+        question_id = rng.choice(private_ids)
+        yield "create_answer_form", self._request(
+            f"/answers/create/{question_id}/", session
+        )
+        yield "create_star_answer", self._request(
+            f"/answers/create/{question_id}/",
+            session,
+            data={
+                "answer_type": "STAR",
+                "situation": " ".join(rng.choices(WORDS, k=60)),
+                "task": " ".join(rng.choices(WORDS, k=40)),
+                "action": " ".join(rng.choices(WORDS, k=80)),
+                "result": " ".join(rng.choices(WORDS, k=40)),
+            },
+        )
+
+    def _moderate(self, rng):
+        session = self.moderator_session
+        yield "moderation_queue", self._request("/questions/public/", session)
+        if self.pending_question_ids:
+            question_id = rng.choice(self.pending_question_ids)
+            action = rng.choice(("approve", "deny"))
+            yield f"{action}_public_question", self._request(
+                f"/questions/{action}/{question_id}/", session, data={}
+            )
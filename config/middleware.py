@@ -0,0 +1,151 @@
+"""
+Project-wide middleware.
+"""
+
+import logging
+import random
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("config.sql")
+
+# Collapse the placeholder lists Django generates for ``__in`` lookups so
+# that ``IN (%s, %s)`` and ``IN (%s, %s, %s)`` share one fingerprint.
+_IN_LIST_RE = re.compile(r"\((?:\s*%s\s*,)+\s*%s\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_sql(sql):
+    """Return a normalised form of a SQL statement for duplicate detection."""
+    sql = _IN_LIST_RE.sub("(%s)", sql)
+    return _WHITESPACE_RE.sub(" ", sql).strip()
+
+
+class QueryStats:
+    """Collects SQL timings for a single request.
+
+    An instance is installed as a ``connection.execute_wrapper`` so every
+    statement run while the request is handled passes through ``__call__``,
+    including those ``config.concurrent_queries`` runs on its threads; the
+    totals are updated under a lock, since those threads report at once.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                self.duration += duration
+                self.count += 1
+                self.fingerprints[fingerprint_sql(sql)] += 1
+
+    @property
+    def duplicates(self):
+        """Number of repeated executions of an already-seen statement."""
+        return sum(n - 1 for n in self.fingerprints.values() if n > 1)
+
+    @property
+    def duration_ms(self):
+        return self.duration * 1000
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record query count, total DB time and duplicated SQL for sampled requests.
+
+    Results are logged in the same logfmt style as the gunicorn access log
+    and exposed to the browser through a ``Server-Timing`` header. Only a
+    fraction of requests (``SQL_INSTRUMENTATION_SAMPLE_RATE``) is measured
+    so the overhead stays negligible in production.
+
+    Async capable, so the ASGI deployment does not switch threads for it.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _sampled():
+        sample_rate = getattr(settings, "SQL_INSTRUMENTATION_SAMPLE_RATE", 0)
+        return sample_rate > 0 and random.random() < sample_rate
+
+    @staticmethod
+    def _instrument(stack, stats):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(stats))
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self._sampled():
+            return self.get_response(request)
+
+        stats = QueryStats()
+        with ExitStack() as stack:
+            self._instrument(stack, stats)
+            response = self.get_response(request)
+        return self._report(request, response, stats)
+
+    async def __acall__(self, request):
+        if not self._sampled():
+            return await self.get_response(request)
+
+        stats = QueryStats()
+        stack = ExitStack()
+        # Connections are per thread, and the ORM of an async request runs
+        # in its sync_to_async thread: the wrappers are installed there
+        await sync_to_async(self._instrument)(stack, stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+        return self._report(request, response, stats)
+
+    def _report(self, request, response, stats):
+        self._log(request, response, stats)
+        response["Server-Timing"] = (
+            f'db;dur={stats.duration_ms:.2f};desc="{stats.count} queries"'
+        )
+        return response
+
+    def _log(self, request, response, stats):
+        logger.info(
+            'sql method=%s path="%s" status=%s queries=%d '
+            "db_time=%.2fms duplicates=%d request_id=%s",
+            request.method,
+            request.path,
+            response.status_code,
+            stats.count,
+            stats.duration_ms,
+            stats.duplicates,
+            request.headers.get("X-Request-Id", "-"),
+        )
+        if stats.duplicates:
+            for sql, times in stats.fingerprints.most_common(3):
+                if times < 2:
+                    break
+                logger.debug('sql duplicate times=%d sql="%s"', times, sql)
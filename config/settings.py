@@ -106,6 +106,7 @@ INSTALLED_APPS = [
     "config",
     "questions",
     "answers",
+    "api",
     # django-tailwind
     "tailwind",
     "theme",
@@ -125,6 +126,10 @@ MIDDLEWARE = [
     # after Django's `SecurityMiddleware` so that security redirects are still performed.
     # See: https://whitenoise.readthedocs.io
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    # Lightweight per-request SQL profiling (query count, DB time and
+    # duplicated statements) for a sample of requests. Listed after WhiteNoise
+    # so static file requests are never measured.
+    "config.middleware.QueryInstrumentationMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -155,6 +160,41 @@ if DEBUG and not TESTING and find_spec("debug_toolbar") is not None:
         *MIDDLEWARE,
     ]
 
+# Fraction of requests (0.0 - 1.0) measured by `QueryInstrumentationMiddleware`.
+# Every request is measured in development; production only samples a few so
+# the overhead stays negligible. Tests opt in explicitly via override_settings.
+if TESTING:
+    SQL_INSTRUMENTATION_SAMPLE_RATE = 0.0
+else:
+    SQL_INSTRUMENTATION_SAMPLE_RATE = float(
+        os.environ.get(
+            "SQL_INSTRUMENTATION_SAMPLE_RATE", "1.0" if DEBUG else "0.05"
+        )
+    )
+
+# Send the page shell of views using `config.streaming.render_streaming`
+# before their long card lists are rendered. Tests use buffered responses so
+# `response.content` is available; streaming tests opt in via settings.
+STREAM_HTML_RESPONSES = not TESTING and os.environ.get(
+    "STREAM_HTML_RESPONSES", "true"
+).lower() in ("1", "true", "yes")
+
+# Serve the async versions of the read-heavy views (public list, question and
+# answer detail, tag lookup). Turned on by `config/asgi.py`, so the ASGI
+# deployment (`gunicorn_asgi.conf.py`) uses them while WSGI keeps the sync
+# views, which would otherwise each need their own event loop.
+ASYNC_VIEWS = os.environ.get("DJANGO_ASYNC_VIEWS", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# Threads used by `config.concurrent_queries` to run a page's independent
+# queries concurrently (0 runs them one after another). Each thread keeps its
+# own persistent connection, so every gunicorn worker process may hold this
+# many database connections on top of one per request thread.
+QUERY_FANOUT_WORKERS = int(os.environ.get("QUERY_FANOUT_WORKERS", 4))
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -181,7 +221,13 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Use NEON_DB_PROD for production (Heroku) and NEON_DB_DEV for development
 # Use SQLite for testing to speed up test execution
 
-if TESTING:
+if TESTING and os.environ.get("TEST_DATABASE_URL"):
+    # Opt-in: run tests and benchmarks against a local PostgreSQL, e.g.
+    # TEST_DATABASE_URL=postgres://localhost/star_master
+    DATABASES = {
+        "default": dj_database_url.config(env="TEST_DATABASE_URL"),
+    }
+elif TESTING:
     # Use SQLite for tests (faster and doesn't require PostgreSQL setup)
     DATABASES = {
         "default": {
@@ -211,6 +257,42 @@ else:
     }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+#
+# The question stats, the profile dashboard and the search result ids are
+# cached, and writes invalidate them through the cache. Each gunicorn worker
+# (`WEB_CONCURRENCY`) is a separate process, so production needs a cache
+# shared by all of them: with per-process memory, an invalidation would only
+# reach the worker that handled the write, and the single-flight lock of
+# `questions.search.result_ids` would only hold within one process.
+# `CACHE_URL=redis://...` uses Redis (requires the `redis` package);
+# otherwise production uses the `django_cache` table of the database,
+# created by `createcachetable` in the release phase (see Procfile).
+# Tests and development keep the per-process memory cache.
+
+if os.environ.get("CACHE_URL", "").startswith(("redis://", "rediss://")):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["CACHE_URL"],
+        },
+    }
+elif TESTING or DEBUG:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        },
+    }
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -317,6 +399,11 @@ LOGGING = {
             # Prevent double logging due to the root logger.
             "propagate": False,
         },
+        "config.sql": {
+            "handlers": ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django.request": {
             # Suppress the WARNINGS from any HTTP 4xx responses (in particular for 404s caused by
             # web crawlers), but still show any ERRORs from HTTP 5xx responses/exceptions.
@@ -0,0 +1,187 @@
+"""
+Streaming rendering for pages with long, unbounded card lists.
+
+``render_streaming`` renders a page the same way ``render`` does, except that
+the context entries named in ``streamed`` are not evaluated up front. The
+page shell (header, filters, footer) is rendered first with a placeholder
+where each streamed list goes. It is sent as soon as it is ready, and the
+cards follow in chunks as rows come off a server-side cursor
+(``QuerySet.iterator``). Time to first byte therefore no longer depends on
+how many rows the list holds.
+
+Streamed lists must be rendered with ``{% render_each %}``, which knows how
+to leave a placeholder for them. ``{% if items %}`` and ``{{ items|length }}``
+keep working and cost a single ``COUNT`` query.
+
+If a list fails to load partway through, the status line and the shell
+have already been sent, so the error is logged and the page is completed
+with a notice in place of the rest of the list rather than cut off.
+
+``arender_streaming`` is the equivalent for async views; it streams from
+``QuerySet.aiterator`` so the ASGI server does not have to buffer the
+response.
+"""
+
+import logging
+import re
+import uuid
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.shortcuts import render
+from django.template import Context, loader
+
+logger = logging.getLogger("config.streaming")
+
+# Rows fetched per round trip to the server-side cursor; the cards rendered
+# from one chunk are sent to the client together.
+STREAM_CHUNK_SIZE = 100
+
+# Sent in place of the rest of a list that failed to load
+STREAM_ERROR_HTML = (
+    '<div class="alert alert-error col-span-full" data-stream-error>'
+    "The rest of this list could not be loaded. Reload the page to try "
+    "again.</div>"
+)
+
+
+class StreamedItems:
+    """
+    A queryset whose cards are rendered after the page shell has been sent.
+
+    Rendering it with ``{% render_each %}`` records the component template
+    and context and outputs a placeholder, which ``render_streaming`` later
+    replaces with the cards.
+    """
+
+    def __init__(self, queryset, chunk_size=STREAM_CHUNK_SIZE, count=None):
+        self.queryset = queryset
+        self.chunk_size = chunk_size
+        self.marker = f"<!--stream:{uuid.uuid4().hex}-->"
+        self.slot = None
+        self._count = count
+
+    def __len__(self):
+        if self._count is None:
+            self._count = self.queryset.count()
+        return self._count
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def placeholder(self, context, component, var_name):
+        """Remember how to render the cards and return the placeholder."""
+        self.slot = (component, context.flatten(), var_name)
+        return self.marker
+
+    def render_chunks(self):
+        """Yield the rendered cards, one string per chunk of rows."""
+        component, values, var_name = self.slot
+        context = Context(values)
+        bits = []
+        for item in self.queryset.iterator(chunk_size=self.chunk_size):
+            context[var_name] = item
+            bits.append(component.render(context))
+            if len(bits) == self.chunk_size:
+                yield "".join(bits)
+                bits = []
+        if bits:
+            yield "".join(bits)
+
+    async def arender_chunks(self):
+        """Async version of ``render_chunks``."""
+        component, values, var_name = self.slot
+        context = Context(values)
+        bits = []
+        rows = self.queryset.aiterator(chunk_size=self.chunk_size)
+        async for item in rows:
+            context[var_name] = item
+            bits.append(component.render(context))
+            if len(bits) == self.chunk_size:
+                yield "".join(bits)
+                bits = []
+        if bits:
+            yield "".join(bits)
+
+
+def _split_shell(shell, streams):
+    """
+    Split the rendered shell around the placeholders. Returns the parts and
+    a mapping of placeholder to the ``StreamedItems`` that fills it.
+    """
+    slots = {
+        items.marker: items
+        for items in streams.values()
+        if items.slot is not None
+    }
+    if not slots:
+        return [shell], slots
+    pattern = "|".join(re.escape(marker) for marker in slots)
+    return re.split(f"({pattern})", shell), slots
+
+
+def render_streaming(request, template_name, context, streamed=()):
+    """
+    Render ``template_name`` like ``render``, streaming the querysets in
+    ``context`` whose names are listed in ``streamed``.
+
+    Falls back to a regular response when ``STREAM_HTML_RESPONSES`` is off.
+    """
+    if not settings.STREAM_HTML_RESPONSES:
+        return render(request, template_name, context)
+
+    streams = {name: StreamedItems(context[name]) for name in streamed}
+    shell = loader.render_to_string(
+        template_name, {**context, **streams}, request
+    )
+    parts, slots = _split_shell(shell, streams)
+
+    def stream():
+        for part in parts:
+            if part in slots:
+                try:
+                    yield from slots[part].render_chunks()
+                except Exception:
+                    logger.exception("streaming %s failed", request.path)
+                    yield STREAM_ERROR_HTML
+            else:
+                yield part
+
+    return StreamingHttpResponse(stream())
+
+
+async def arender_streaming(request, template_name, context, streamed=()):
+    """
+    Async version of ``render_streaming``.
+
+    The counts of the streamed lists are fetched before the shell is
+    rendered, since templates cannot query the database from an async
+    context.
+    """
+    if not settings.STREAM_HTML_RESPONSES:
+        for name in streamed:
+            context[name] = [item async for item in context[name]]
+        return render(request, template_name, context)
+
+    streams = {
+        name: StreamedItems(context[name], count=await context[name].acount())
+        for name in streamed
+    }
+    shell = loader.render_to_string(
+        template_name, {**context, **streams}, request
+    )
+    parts, slots = _split_shell(shell, streams)
+
+    async def stream():
+        for part in parts:
+            if part in slots:
+                try:
+                    async for chunk in slots[part].arender_chunks():
+                        yield chunk
+                except Exception:
+                    logger.exception("streaming %s failed", request.path)
+                    yield STREAM_ERROR_HTML
+            else:
+                yield part
+
+    return StreamingHttpResponse(stream())
@@ -1,5 +1,7 @@
 from django import template
 
+from config.streaming import StreamedItems
+
 register = template.Library()
 
 
@@ -18,3 +20,54 @@ def prefixed_id(value, prefix="tag_modal"):
         return prefix_str
 
     return f"{prefix_str}_{suffix_str}".replace(" ", "-")
+
+
+class RenderEachNode(template.Node):
+    def __init__(self, items, template_name, var_name):
+        self.items = items
+        self.template_name = template_name
+        self.var_name = var_name
+
+    def render(self, context):
+        items = self.items.resolve(context) or ()
+        template_name = self.template_name.resolve(context)
+        # The engine's cached loader returns the same compiled Template on
+        # every call, so it is fetched once per page rather than per item.
+        component = context.template.engine.get_template(template_name)
+        if isinstance(items, StreamedItems):
+            # Cards are rendered by render_streaming after the page shell
+            # has been sent.
+            return items.placeholder(context, component, self.var_name)
+
+        bits = []
+        with context.push():
+            for item in items:
+                context[self.var_name] = item
+                bits.append(component.render(context))
+        return "".join(bits)
+
+
+@register.tag
+def render_each(parser, token):
+    """
+    Render a component template once per item of a list.
+
+    Usage::
+
+        {% render_each questions "components/card.html" as question %}
+
+    Equivalent to a ``{% for %}`` loop around ``{% include %}``, but the
+    compiled component is looked up once and rendered directly for each
+    item, skipping the per-iteration include and forloop bookkeeping on
+    card-heavy pages.
+    """
+    bits = token.split_contents()
+    if len(bits) != 5 or bits[3] != "as":
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' expects: {bits[0]} items \"template\" as name"
+        )
+    return RenderEachNode(
+        parser.compile_filter(bits[1]),
+        parser.compile_filter(bits[2]),
+        bits[4],
+    )
@@ -0,0 +1,194 @@
+"""
+Per-view query budgets.
+
+Every URL in ``questions/urls.py``, ``answers/urls.py`` and ``api/urls.py``
+must have at least one entry here. Each entry is requested twice by
+``test_query_budgets`` - once against a dataset seeded with n=1 and once with
+n=50 - and must issue the same number of queries both times, never more than
+``max_queries``.
+
+Keys of each entry:
+
+- ``url_name``: namespaced URL name passed to ``reverse``
+- ``kwargs``: callable returning the URL kwargs for a seeded dataset
+- ``method``: ``"get"`` (default) or ``"post"``
+- ``params``: callable returning the query string (GET) or form data
+  (POST)
+- ``max_queries``: hard ceiling, including session and user lookups
+- ``max_streamed_queries``: for views using
+  ``config.streaming.render_streaming``, the ceiling with
+  ``STREAM_HTML_RESPONSES`` on (forced off in tests otherwise), counting
+  the queries made while the response is streamed
+"""
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+QUERY_BUDGETS = {
+    # questions
+    "question_list": {
+        "url_name": "questions:list",
+        "max_queries": 9,
+    },
+    "question_list_all_by_answers": {
+        "url_name": "questions:list",
+        "params": lambda data: {"view": "all", "sort": "-answer_count"},
+        "max_queries": 8,
+    },
+    "question_list_tag_and_search": {
+        "url_name": "questions:list",
+        "params": lambda data: {"tag": data.tag.slug, "search": "question"},
+        "max_queries": 10,
+    },
+    "public_question_list": {
+        "url_name": "questions:public_list",
+        "max_queries": 10,
+        # The moderation queue is counted, then iterated
+        "max_streamed_queries": 11,
+    },
+    "public_question_list_tag_and_search": {
+        "url_name": "questions:public_list",
+        "params": lambda data: {
+            "tag": data.public_tag.slug,
+            "search": "question",
+        },
+        "max_queries": 11,
+        "max_streamed_queries": 12,
+    },
+    "save_public_question": {
+        "url_name": "questions:save_public",
+        "kwargs": lambda data: {"question_id": data.public_question.pk},
+        "method": "post",
+        "max_queries": 9,
+    },
+    "approve_public_question": {
+        "url_name": "questions:approve_public",
+        "kwargs": lambda data: {"question_id": data.pending_question.pk},
+        "method": "post",
+        "max_queries": 4,
+    },
+    "deny_public_question": {
+        "url_name": "questions:deny_public",
+        "kwargs": lambda data: {"question_id": data.pending_question.pk},
+        "method": "post",
+        "max_queries": 4,
+    },
+    "check_tag_exists": {
+        "url_name": "questions:check_tag_exists",
+        "params": lambda data: {"name": data.tag.name},
+        "max_queries": 4,
+    },
+    "question_create": {
+        "url_name": "questions:create",
+        "max_queries": 3,
+    },
+    "question_detail": {
+        "url_name": "questions:detail",
+        "kwargs": lambda data: {"pk": data.question.pk},
+        "max_queries": 9,
+    },
+    "question_detail_public": {
+        "url_name": "questions:detail",
+        "kwargs": lambda data: {"pk": data.public_question.pk},
+        "max_queries": 7,
+    },
+    "question_edit": {
+        "url_name": "questions:edit",
+        "kwargs": lambda data: {"pk": data.question.pk},
+        "max_queries": 6,
+    },
+    "question_delete": {
+        "url_name": "questions:delete",
+        "kwargs": lambda data: {"pk": data.question.pk},
+        "method": "post",
+        "max_queries": 9,
+    },
+    # Replacing the tags of everything matching a filter is the bulk action
+    # with the most statements
+    "question_bulk_action": {
+        "url_name": "questions:bulk_action",
+        "method": "post",
+        "params": lambda data: {
+            "action": "retag",
+            "select_all": "1",
+            "view": "all",
+            "tags": "Bulk, Tagged",
+            "replace": "1",
+        },
+        "max_queries": 11,
+    },
+    # Only the queries before streaming starts; the per-chunk queries of the
+    # body are covered by questions/tests/test_export.py
+    "question_export": {
+        "url_name": "questions:export",
+        "max_queries": 2,
+    },
+    "question_import": {
+        "url_name": "questions:import",
+        "method": "post",
+        "params": lambda data: {
+            "file": SimpleUploadedFile(
+                "bank.ndjson",
+                b'{"title": "Imported", "tags": ["Imported"], "answers": '
+                b'[{"answer_type": "BASIC", "text": "Answer"}]}\n',
+            )
+        },
+        "max_queries": 10,
+    },
+    "question_tags": {
+        "url_name": "questions:tags",
+        "kwargs": lambda data: {"pk": data.question.pk},
+        "max_queries": 4,
+    },
+    # answers
+    "answer_create": {
+        "url_name": "answers:create",
+        "kwargs": lambda data: {"question_id": data.question.pk},
+        "max_queries": 5,
+    },
+    "answer_detail": {
+        "url_name": "answers:detail",
+        "kwargs": lambda data: {"pk": data.answer.pk},
+        "max_queries": 4,
+    },
+    "answer_edit": {
+        "url_name": "answers:edit",
+        "kwargs": lambda data: {"pk": data.answer.pk},
+        "max_queries": 5,
+    },
+    "answer_delete": {
+        "url_name": "answers:delete",
+        "kwargs": lambda data: {"pk": data.answer.pk},
+        "method": "post",
+        "max_queries": 5,
+    },
+    # api
+    "api_question_list": {
+        "url_name": "api:question_list",
+        "max_queries": 4,
+    },
+    "api_question_list_tag_and_search": {
+        "url_name": "api:question_list",
+        "params": lambda data: {"tag": data.tag.slug, "search": "question"},
+        "max_queries": 4,
+    },
+    "api_question_detail": {
+        "url_name": "api:question_detail",
+        "kwargs": lambda data: {"pk": data.question.pk},
+        "max_queries": 4,
+    },
+    "api_answer_list": {
+        "url_name": "api:answer_list",
+        "params": lambda data: {"question": data.question.pk},
+        "max_queries": 3,
+    },
+    "api_answer_detail": {
+        "url_name": "api:answer_detail",
+        "kwargs": lambda data: {"pk": data.answer.pk},
+        "max_queries": 3,
+    },
+    # config
+    "profile": {
+        "url_name": "profile",
+        "max_queries": 7,
+    },
+}
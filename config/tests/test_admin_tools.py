@@ -0,0 +1,106 @@
+from types import SimpleNamespace
+
+import pytest
+
+from config import admin_tools
+from config.admin_tools import (
+    ESTIMATED_COUNT_THRESHOLD,
+    EstimatedCountPaginator,
+    SearchVectorAdminMixin,
+)
+from questions.models import Question
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    @pytest.fixture
+    def questions(self, user):
+        Question.objects.bulk_create(
+            Question(owner=user, title=f"Q{i}", is_public=i % 2 == 0)
+            for i in range(4)
+        )
+        return Question.objects.order_by("pk")
+
+    def test_uses_estimate_for_large_unfiltered_tables(
+        self, monkeypatch, questions
+    ):
+        monkeypatch.setattr(
+            admin_tools,
+            "estimated_count",
+            lambda model, using: ESTIMATED_COUNT_THRESHOLD * 5,
+        )
+
+        assert (
+            EstimatedCountPaginator(questions, 10).count
+            == ESTIMATED_COUNT_THRESHOLD * 5
+        )
+
+    def test_counts_filtered_querysets_exactly(self, monkeypatch, questions):
+        monkeypatch.setattr(
+            admin_tools,
+            "estimated_count",
+            lambda model, using: ESTIMATED_COUNT_THRESHOLD * 5,
+        )
+
+        paginator = EstimatedCountPaginator(
+            questions.filter(is_public=True), 10
+        )
+
+        assert paginator.count == 2
+
+    def test_counts_small_tables_exactly(self, monkeypatch, questions):
+        monkeypatch.setattr(
+            admin_tools, "estimated_count", lambda model, using: 100
+        )
+
+        assert EstimatedCountPaginator(questions, 10).count == 4
+
+    def test_no_estimate_outside_postgres(self, questions):
+        assert admin_tools.estimated_count(Question) is None
+        assert EstimatedCountPaginator(questions, 10).count == 4
+
+
+class TestSearchVectorAdminMixin:
+    class Admin(SearchVectorAdminMixin):
+        pass
+
+    def test_matches_each_word_as_a_prefix_on_postgres(self, monkeypatch):
+        monkeypatch.setattr(
+            admin_tools,
+            "connections",
+            {"default": SimpleNamespace(vendor="postgresql")},
+        )
+
+        queryset, may_have_duplicates = self.Admin().get_search_results(
+            None, Question.objects.all(), " confl  team-work "
+        )
+
+        (lookup,) = queryset.query.where.children
+        assert lookup.lhs.target.name == "search_vector"
+        assert lookup.rhs.source_expressions[0].value == (
+            "confl:* & team:* & work:*"
+        )
+        assert may_have_duplicates is False
+
+    def test_extra_fields_are_searched_too(self, monkeypatch):
+        monkeypatch.setattr(
+            admin_tools,
+            "connections",
+            {"default": SimpleNamespace(vendor="postgresql")},
+        )
+        admin = self.Admin()
+        admin.search_vector_extra_fields = ("title", "owner__username")
+
+        queryset, may_have_duplicates = admin.get_search_results(
+            None, Question.objects.all(), "conflict work"
+        )
+
+        vector, extra = queryset.query.where.children[0].children
+        assert vector.lhs.target.name == "search_vector"
+        # Every word, in any of the extra fields
+        assert len(extra.children) == 2
+        assert {
+            (lookup.lhs.target.name, lookup.rhs)
+            for lookup in extra.children[0].children
+        } == {("title", "conflict"), ("username", "conflict")}
+        assert may_have_duplicates is False
@@ -0,0 +1,150 @@
+"""
+The async views used by the ASGI deployment (``ASYNC_VIEWS``) must render
+the same pages as their sync counterparts without touching the database
+from the event loop.
+"""
+
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404
+
+from answers.views import aanswer_detail, answer_detail
+from questions.views.check_tag_exists import (
+    acheck_tag_exists,
+    check_tag_exists,
+)
+from questions.views.public_question_list import (
+    apublic_question_list,
+    public_question_list,
+)
+from questions.views.question_detail import aquestion_detail, question_detail
+
+
+def _request(factory, user, path="/", **params):
+    request = factory.get(path, params)
+    request.user = user
+
+    async def auser():
+        return user
+
+    request.auser = auser
+    return request
+
+
+def _content(response):
+    if not response.streaming:
+        return response.content.decode()
+    if not response.is_async:
+        return b"".join(response.streaming_content).decode()
+
+    async def consume():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    return async_to_sync(consume)().decode()
+
+
+@pytest.mark.django_db
+class TestAsyncViews:
+    @pytest.fixture
+    def data(self, seed_question_data):
+        return seed_question_data(3)
+
+    @pytest.mark.parametrize("stream", (False, True))
+    def test_public_question_list(self, settings, rf, async_rf, data, stream):
+        settings.STREAM_HTML_RESPONSES = stream
+        sync_response = public_question_list(_request(rf, data.user))
+
+        response = async_to_sync(apublic_question_list)(
+            _request(async_rf, data.user)
+        )
+
+        assert response.status_code == 200
+        content = _content(response)
+        assert "3 pending" in content
+        assert data.pending_question.title in content
+        assert data.public_question.title in content
+        assert content.count("card-body") == _content(sync_response).count(
+            "card-body"
+        )
+
+    def test_public_question_list_filters(self, async_rf, data):
+        request = _request(
+            async_rf,
+            AnonymousUser(),
+            tag=data.public_tag.slug,
+            search="Public",
+            sort="title",
+        )
+
+        response = async_to_sync(apublic_question_list)(request)
+
+        content = _content(response)
+        assert data.public_question.title in content
+        assert "Pending Questions" not in content
+
+    def test_question_detail(self, rf, async_rf, data):
+        sync_content = _content(
+            question_detail(_request(rf, data.user), pk=data.question.pk)
+        )
+
+        response = async_to_sync(aquestion_detail)(
+            _request(async_rf, data.user), pk=data.question.pk
+        )
+
+        assert response.status_code == 200
+        content = _content(response)
+        assert "Situation 2" in content
+        assert content.count("Situation ") == sync_content.count(
+            "Situation "
+        )
+
+    def test_question_detail_hides_private_questions(
+        self, async_rf, data, other_user
+    ):
+        with pytest.raises(Http404):
+            async_to_sync(aquestion_detail)(
+                _request(async_rf, other_user), pk=data.question.pk
+            )
+
+    def test_answer_detail(self, rf, async_rf, data):
+        response = async_to_sync(aanswer_detail)(
+            _request(async_rf, data.user), pk=data.answer.pk
+        )
+
+        assert response.status_code == 200
+        content = _content(response)
+        assert data.answer.situation in content
+        assert data.question.title in content
+        sync_response = answer_detail(
+            _request(rf, data.user), pk=data.answer.pk
+        )
+        assert content.count("Situation") == _content(sync_response).count(
+            "Situation"
+        )
+
+    @pytest.mark.parametrize("lookup", ("public", "personal", "missing"))
+    def test_check_tag_exists(self, rf, async_rf, data, lookup):
+        name = {
+            "public": data.public_tag.name,
+            "personal": data.tag.name,
+            "missing": "no such tag",
+        }[lookup]
+
+        response = async_to_sync(acheck_tag_exists)(
+            _request(async_rf, data.user, name=name)
+        )
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == json.loads(
+            check_tag_exists(_request(rf, data.user, name=name)).content
+        )
+
+    def test_check_tag_exists_requires_login(self, async_rf):
+        response = async_to_sync(acheck_tag_exists)(
+            _request(async_rf, AnonymousUser(), name="x")
+        )
+
+        assert response.status_code == 302
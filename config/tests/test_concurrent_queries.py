@@ -0,0 +1,156 @@
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.paginator import Paginator
+
+from config.concurrent_queries import (
+    afetch_concurrently,
+    apaginate_concurrently,
+    apaginate_ids_concurrently,
+    fetch_concurrently,
+    paginate_concurrently,
+    paginate_ids_concurrently,
+)
+from questions.models import Question, Tag
+
+
+def current_thread_name():
+    return threading.current_thread().name
+
+
+@pytest.fixture
+def questions(user):
+    return Question.objects.bulk_create(
+        Question(owner=user, title=f"Question {i:02}") for i in range(25)
+    )
+
+
+@pytest.mark.django_db
+class TestFetchConcurrentlyInTransaction:
+    def test_evaluates_querysets_and_calls_functions(self, questions):
+        results = fetch_concurrently(
+            titles=Question.objects.order_by("title").values_list(
+                "title", flat=True
+            ),
+            total=Question.objects.count,
+            first=Question.objects.order_by("title").first,
+        )
+
+        assert results["titles"][:2] == ["Question 00", "Question 01"]
+        assert results["total"] == 25
+        assert results["first"] == questions[0]
+
+    def test_runs_on_the_current_connection(self, questions):
+        # Other connections could not see this test's uncommitted rows
+        results = fetch_concurrently(
+            thread=current_thread_name, total=Question.objects.count
+        )
+
+        assert results["thread"] == threading.current_thread().name
+        assert results["total"] == 25
+
+    def test_async_version(self, questions):
+        results = async_to_sync(afetch_concurrently)(
+            total=Question.objects.count, tags=Tag.objects.all()
+        )
+
+        assert results == {"total": 25, "tags": []}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFetchConcurrentlyWithPool:
+    def test_runs_tasks_on_the_pool(self, questions):
+        results = fetch_concurrently(
+            thread=current_thread_name, total=Question.objects.count
+        )
+
+        assert results["thread"].startswith("query-fanout")
+        assert results["total"] == 25
+
+    def test_async_version_uses_the_pool(self, questions):
+        results = async_to_sync(afetch_concurrently)(
+            thread=current_thread_name, total=Question.objects.count
+        )
+
+        assert results["thread"].startswith("query-fanout")
+        assert results["total"] == 25
+
+    def test_disabled_with_zero_workers(self, settings, questions):
+        settings.QUERY_FANOUT_WORKERS = 0
+
+        results = fetch_concurrently(
+            thread=current_thread_name, total=Question.objects.count
+        )
+
+        assert results["thread"] == threading.current_thread().name
+
+
+@pytest.mark.django_db
+class TestPaginateConcurrently:
+    @pytest.mark.parametrize("page", ["2", "1", None, "abc", "0", "-1", "9"])
+    def test_matches_paginator_get_page(self, questions, page):
+        queryset = Question.objects.order_by("title")
+        expected = Paginator(queryset, 10).get_page(page)
+
+        page_obj, results = paginate_concurrently(
+            queryset, 10, page, total=queryset.count
+        )
+
+        assert page_obj.number == expected.number
+        assert page_obj.paginator.count == 25
+        assert isinstance(page_obj.object_list, list)
+        assert page_obj.object_list == list(expected.object_list)
+        assert results == {"total": 25}
+
+    def test_async_version(self, questions):
+        queryset = Question.objects.order_by("title")
+
+        page_obj, results = async_to_sync(apaginate_concurrently)(
+            queryset, 10, "9"
+        )
+
+        assert page_obj.number == 3
+        assert [q.title for q in page_obj.object_list] == [
+            f"Question {i}" for i in range(20, 25)
+        ]
+        assert results == {}
+
+
+@pytest.mark.django_db
+class TestPaginateIdsConcurrently:
+    def test_loads_the_page_rows_in_id_order(
+        self, questions, django_assert_num_queries
+    ):
+        ids = [question.pk for question in reversed(questions)]
+
+        with django_assert_num_queries(1):
+            page_obj, results = paginate_ids_concurrently(
+                ids, Question.objects.order_by("title"), 10, "2"
+            )
+
+        assert page_obj.number == 2
+        assert page_obj.paginator.count == 25
+        assert page_obj.object_list == questions[14:4:-1]
+        assert results == {}
+
+    def test_skips_deleted_rows(self, questions):
+        ids = [question.pk for question in questions]
+        questions[1].delete()
+
+        page_obj, _ = paginate_ids_concurrently(
+            ids, Question.objects.all(), 3, "1", total=Question.objects.count
+        )
+
+        assert page_obj.object_list == [questions[0], questions[2]]
+
+    def test_async_version(self, questions):
+        ids = [question.pk for question in questions]
+
+        page_obj, results = async_to_sync(apaginate_ids_concurrently)(
+            ids, Question.objects.all(), 10, "9", total=Question.objects.count
+        )
+
+        assert page_obj.number == 3
+        assert page_obj.object_list == questions[20:]
+        assert results == {"total": 25}
@@ -0,0 +1,35 @@
+import pytest
+from django.urls import reverse
+
+from answers.models import BasicAnswer
+from questions.models import Question
+
+
+@pytest.mark.django_db
+class TestProfileView:
+    def test_requires_login(self, client):
+        response = client.get(reverse("profile"))
+
+        assert response.status_code == 302
+
+    def test_shows_dashboard(self, authenticated_client, user):
+        question = Question.objects.create(owner=user, title="Q")
+        BasicAnswer.objects.create(question=question, user=user, text="A")
+
+        response = authenticated_client.get(reverse("profile"))
+
+        assert response.status_code == 200
+        assert response.context["questions"]["all"] == 1
+        assert response.context["answers"]["answers_basic"] == 1
+        assert response.context["weekly_peak"] == 1
+        assert "0 STAR &middot; 1 Basic" in response.content.decode()
+
+    def test_cached_figures_need_no_queries(
+        self, authenticated_client, django_assert_max_num_queries
+    ):
+        url = reverse("profile")
+        authenticated_client.get(url)
+
+        # Session and user lookups only
+        with django_assert_max_num_queries(2):
+            authenticated_client.get(url)
@@ -0,0 +1,117 @@
+"""
+N+1 regression tests.
+
+Each view listed in ``query_budgets.QUERY_BUDGETS`` is rendered against a
+small (n=1) and a large (n=50) seeded dataset. The query count must not grow
+with n and must stay within the view's budget.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+
+from answers import urls as answer_urls
+from api import urls as api_urls
+from questions import urls as question_urls
+
+from .query_budgets import QUERY_BUDGETS
+
+SMALL_N = 1
+LARGE_N = 50
+
+
+def _consume(response):
+    if not response.is_async:
+        b"".join(response.streaming_content)
+        return
+
+    # The async view (ASYNC_VIEWS) streams from an async iterator
+    async def consume():
+        async for _ in response.streaming_content:
+            pass
+
+    async_to_sync(consume)()
+
+
+def _count_queries(client, budget, data, streamed=False):
+    """
+    Request the budgeted view for ``data`` and return the SQL issued, also
+    while the response is streamed if ``streamed``.
+    """
+    kwargs_factory = budget.get("kwargs")
+    params_factory = budget.get("params")
+    url = reverse(
+        budget["url_name"],
+        kwargs=kwargs_factory(data) if kwargs_factory else None,
+    )
+    params = params_factory(data) if params_factory else {}
+    send = getattr(client, budget.get("method", "get"))
+
+    client.force_login(data.user)
+    with CaptureQueriesContext(connection) as queries:
+        response = send(url, params)
+        if streamed:
+            _consume(response)
+
+    assert response.status_code < 400, (
+        f"{budget['url_name']} returned {response.status_code}"
+    )
+    return queries
+
+
+def test_every_url_has_a_budget():
+    """New URLs must be added to the manifest."""
+    url_names = {
+        f"{module.app_name}:{pattern.name}"
+        for module in (question_urls, answer_urls, api_urls)
+        for pattern in module.urlpatterns
+        if isinstance(pattern, URLPattern)
+    }
+    budgeted = {budget["url_name"] for budget in QUERY_BUDGETS.values()}
+
+    assert url_names - budgeted == set()
+
+
+def _assert_within_budget(case, client, seed_data, streamed=False):
+    """Check the budget of ``case`` against a small and a large dataset."""
+    budget = QUERY_BUDGETS[case]
+    max_queries = budget["max_streamed_queries" if streamed else "max_queries"]
+    small = _count_queries(client, budget, seed_data(SMALL_N), streamed)
+    large = _count_queries(client, budget, seed_data(LARGE_N), streamed)
+
+    assert len(large) == len(small), (
+        f"{case}: {len(small)} queries at n={SMALL_N} but {len(large)} at "
+        f"n={LARGE_N}:\n"
+        + "\n".join(query["sql"] for query in large.captured_queries)
+    )
+    assert len(large) <= max_queries, (
+        f"{case}: {len(large)} queries exceeds budget of {max_queries}:\n"
+        + "\n".join(query["sql"] for query in large.captured_queries)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("case", sorted(QUERY_BUDGETS))
+def test_query_count_does_not_grow_with_data(
+    case, client, seed_question_data
+):
+    _assert_within_budget(case, client, seed_question_data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "case",
+    sorted(
+        case
+        for case, budget in QUERY_BUDGETS.items()
+        if "max_streamed_queries" in budget
+    ),
+)
+def test_streamed_query_count_does_not_grow_with_data(
+    case, client, settings, seed_question_data
+):
+    settings.STREAM_HTML_RESPONSES = True
+
+    _assert_within_budget(case, client, seed_question_data, streamed=True)
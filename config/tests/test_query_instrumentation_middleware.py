@@ -0,0 +1,148 @@
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.http import HttpResponse
+from django.test import override_settings
+from django.urls import reverse
+
+from config.middleware import (
+    QueryInstrumentationMiddleware,
+    QueryStats,
+    fingerprint_sql,
+)
+from questions.models import Question
+
+
+class TestFingerprintSql:
+    def test_in_lists_of_different_length_share_a_fingerprint(self):
+        short = 'SELECT * FROM "t" WHERE "id" IN (%s, %s)'
+        long = 'SELECT * FROM "t" WHERE "id" IN (%s, %s, %s, %s)'
+        assert fingerprint_sql(short) == fingerprint_sql(long)
+
+    def test_whitespace_is_normalised(self):
+        assert fingerprint_sql("SELECT  1\n FROM t") == "SELECT 1 FROM t"
+
+
+class TestQueryStats:
+    def test_counts_duplicated_statements(self):
+        stats = QueryStats()
+
+        def execute(sql, params, many, context):
+            return None
+
+        for _ in range(3):
+            stats(execute, "SELECT 1", [], False, {})
+        stats(execute, "SELECT 2", [], False, {})
+
+        assert stats.count == 4
+        assert stats.duplicates == 2
+
+    def test_statements_from_several_threads_are_all_counted(self):
+        stats = QueryStats()
+        # Switch threads as often as possible, to interleave the updates
+        # (without the lock, updates are lost on free-threaded builds)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        def execute(sql, params, many, context):
+            return None
+
+        def run(thread):
+            for _ in range(2000):
+                stats(execute, f"SELECT {thread}", [], False, {})
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(run, range(8)))
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert stats.count == 16000
+        assert stats.duplicates == 16000 - 8
+        assert set(stats.fingerprints.values()) == {2000}
+
+
+@pytest.mark.django_db
+class TestQueryInstrumentationMiddleware:
+    @override_settings(SQL_INSTRUMENTATION_SAMPLE_RATE=1.0)
+    def test_sampled_request_gets_server_timing_header(
+        self, authenticated_client, user
+    ):
+        Question.objects.create(
+            owner=user, title="Sampled question", is_public=False
+        )
+
+        response = authenticated_client.get(reverse("questions:list"))
+
+        assert response.status_code == 200
+        assert response["Server-Timing"].startswith("db;dur=")
+        assert "queries" in response["Server-Timing"]
+
+    @override_settings(SQL_INSTRUMENTATION_SAMPLE_RATE=1.0)
+    def test_sampled_request_is_logged_in_logfmt(
+        self, authenticated_client, caplog
+    ):
+        # The "config.sql" logger does not propagate to the root logger, so
+        # attach pytest's capture handler to it directly.
+        sql_logger = logging.getLogger("config.sql")
+        sql_logger.addHandler(caplog.handler)
+        try:
+            with caplog.at_level(logging.INFO, logger="config.sql"):
+                authenticated_client.get(
+                    reverse("questions:list"), HTTP_X_REQUEST_ID="abc123"
+                )
+        finally:
+            sql_logger.removeHandler(caplog.handler)
+
+        record = next(r for r in caplog.records if r.name == "config.sql")
+        message = record.getMessage()
+        assert message.startswith("sql method=GET")
+        assert 'path="/questions/"' in message
+        assert "queries=" in message
+        assert "request_id=abc123" in message
+
+    @override_settings(SQL_INSTRUMENTATION_SAMPLE_RATE=0)
+    def test_unsampled_request_is_left_untouched(self, authenticated_client):
+        response = authenticated_client.get(reverse("questions:list"))
+
+        assert response.status_code == 200
+        assert "Server-Timing" not in response
+
+
+@pytest.mark.django_db(transaction=True)
+class TestQueryInstrumentationWithFanOut:
+    def _reported_queries(self, client):
+        response = client.get(reverse("questions:public_list"))
+        return response["Server-Timing"].split('desc="')[1]
+
+    @override_settings(SQL_INSTRUMENTATION_SAMPLE_RATE=1.0)
+    def test_queries_on_the_pool_are_counted(self, client, settings, user):
+        Question.objects.create(
+            owner=user,
+            title="Public",
+            is_public=True,
+            status=Question.STATUS_APPROVED,
+        )
+        settings.QUERY_FANOUT_WORKERS = 0
+        serial = self._reported_queries(client)
+        settings.QUERY_FANOUT_WORKERS = 4
+
+        assert self._reported_queries(client) == serial
+
+
+@pytest.mark.django_db
+class TestQueryInstrumentationMiddlewareAsync:
+    @override_settings(SQL_INSTRUMENTATION_SAMPLE_RATE=1.0)
+    def test_async_requests_are_measured_without_a_sync_hop(self, rf):
+        async def get_response(request):
+            await Question.objects.acount()
+            return HttpResponse()
+
+        middleware = QueryInstrumentationMiddleware(get_response)
+        response = async_to_sync(middleware)(rf.get("/"))
+
+        assert iscoroutinefunction(middleware)
+        assert response["Server-Timing"].endswith('desc="1 queries"')
@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from config.management.commands.run_load_test import (
+    percentile,
+    process_tree_rss_kib,
+    summarise,
+)
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        samples = list(range(1, 101))
+        assert percentile(samples, 50) == 50
+        assert percentile(samples, 95) == 95
+        assert percentile(samples, 99) == 99
+
+    def test_single_sample(self):
+        assert percentile([7.0], 99) == 7.0
+
+    def test_empty(self):
+        assert percentile([], 50) is None
+
+
+class TestSummarise:
+    def test_reports_latency_throughput_and_errors_per_endpoint(self):
+        results = {
+            "public_list": [(10.0, 200), (20.0, 200), (30.0, 500)],
+            "save_public_question": [(5.0, 302)],
+        }
+
+        report = summarise(results, elapsed=2.0)
+
+        public_list = report["public_list"]
+        assert public_list["requests"] == 3
+        assert public_list["errors"] == 1
+        assert public_list["statuses"] == {"200": 2, "500": 1}
+        assert public_list["throughput_rps"] == 1.5
+        assert public_list["p50_ms"] == 20.0
+        assert public_list["p99_ms"] == 30.0
+        assert report["save_public_question"]["errors"] == 0
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/proc"), reason="requires a /proc filesystem"
+)
+class TestProcessTreeRss:
+    def test_includes_child_processes(self):
+        alone = process_tree_rss_kib(os.getpid())
+        child = subprocess.Popen(
+            [sys.executable, "-c", "import sys; sys.stdin.read()"],
+            stdin=subprocess.PIPE,
+        )
+        try:
+            with_child = process_tree_rss_kib(os.getpid())
+        finally:
+            child.communicate(b"")
+
+        assert alone > 0
+        assert with_child > alone
+
+    def test_unknown_pid(self):
+        assert process_tree_rss_kib(2**22 + 1) is None
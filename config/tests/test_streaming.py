@@ -0,0 +1,155 @@
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import DatabaseError, connection
+from django.http import StreamingHttpResponse
+from django.template import Context, Engine
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from config.streaming import STREAM_ERROR_HTML, StreamedItems
+from questions.models import Question
+from questions.views.public_question_list import (
+    apublic_question_list,
+    public_question_list,
+)
+
+
+@pytest.fixture
+def pending_questions(admin_user):
+    return [
+        Question.objects.create(
+            owner=admin_user,
+            title=f"Pending question {i}",
+            is_public=True,
+            status=Question.STATUS_PENDING,
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.mark.django_db
+class TestRenderStreaming:
+    def test_buffered_when_disabled(self, admin_client, pending_questions):
+        response = admin_client.get(reverse("questions:public_list"))
+
+        assert not response.streaming
+        assert "Pending question 4" in response.content.decode()
+
+    def test_streams_moderation_queue_after_page_shell(
+        self, settings, admin_client, pending_questions
+    ):
+        settings.STREAM_HTML_RESPONSES = True
+
+        response = admin_client.get(reverse("questions:public_list"))
+
+        assert isinstance(response, StreamingHttpResponse)
+        chunks = iter(response.streaming_content)
+        with CaptureQueriesContext(connection) as queries:
+            shell = next(chunks).decode()
+        # The shell is sent without touching the pending rows
+        assert len(queries) == 0
+        assert "5 pending" in shell
+        assert "Pending question" not in shell
+
+        with CaptureQueriesContext(connection) as queries:
+            rest = b"".join(chunks).decode()
+        assert len(queries) == 1
+        for question in pending_questions:
+            assert question.title in rest
+        assert rest.rstrip().endswith("</html>")
+
+    def test_no_moderation_queue_for_regular_users(
+        self, settings, authenticated_client, pending_questions
+    ):
+        settings.STREAM_HTML_RESPONSES = True
+
+        response = authenticated_client.get(reverse("questions:public_list"))
+
+        content = b"".join(response.streaming_content).decode()
+        assert "Pending Questions" not in content
+        assert "<!--stream:" not in content
+
+
+@pytest.mark.django_db
+class TestStreamErrors:
+    """The shell is already sent when a list fails, so the page is finished."""
+
+    @pytest.fixture(autouse=True)
+    def fail_after_one_chunk(self, settings, monkeypatch):
+        settings.STREAM_HTML_RESPONSES = True
+
+        def render_chunks(self):
+            yield "[first card]"
+            raise DatabaseError("connection lost")
+
+        async def arender_chunks(self):
+            yield "[first card]"
+            raise DatabaseError("connection lost")
+
+        monkeypatch.setattr(StreamedItems, "render_chunks", render_chunks)
+        monkeypatch.setattr(StreamedItems, "arender_chunks", arender_chunks)
+
+    def _assert_completed_with_notice(self, content, caplog):
+        assert "[first card]" + STREAM_ERROR_HTML in content
+        assert content.rstrip().endswith("</html>")
+        (record,) = caplog.records
+        assert record.name == "config.streaming"
+        assert record.exc_info[0] is DatabaseError
+
+    def test_sync_stream(self, rf, admin_user, pending_questions, caplog):
+        request = rf.get(reverse("questions:public_list"))
+        request.user = admin_user
+        response = public_question_list(request)
+
+        with caplog.at_level(logging.ERROR, logger="config.streaming"):
+            content = b"".join(response.streaming_content).decode()
+
+        self._assert_completed_with_notice(content, caplog)
+
+    def test_async_stream(
+        self, async_rf, admin_user, pending_questions, caplog
+    ):
+        request = async_rf.get(reverse("questions:public_list"))
+        request.user = admin_user
+
+        async def auser():
+            return admin_user
+
+        async def consume():
+            response = await apublic_question_list(request)
+            return b"".join(
+                [chunk async for chunk in response.streaming_content]
+            )
+
+        request.auser = auser
+        with caplog.at_level(logging.ERROR, logger="config.streaming"):
+            content = async_to_sync(consume)().decode()
+
+        self._assert_completed_with_notice(content, caplog)
+
+
+@pytest.mark.django_db
+class TestStreamedItems:
+    def test_len_uses_count_query(self, pending_questions):
+        items = StreamedItems(Question.objects.all())
+
+        with CaptureQueriesContext(connection) as queries:
+            assert len(items) == 5
+            assert items
+        assert len(queries) == 1
+        assert "COUNT" in queries[0]["sql"]
+
+    def test_render_chunks_yields_one_string_per_chunk(
+        self, pending_questions
+    ):
+        items = StreamedItems(Question.objects.order_by("pk"), chunk_size=2)
+        component = Engine().from_string("[{{ question.title }}]")
+        items.placeholder(Context(), component, "question")
+
+        chunks = list(items.render_chunks())
+
+        assert len(chunks) == 3
+        assert chunks[0] == "[Pending question 0][Pending question 1]"
+        assert chunks[-1] == "[Pending question 4]"
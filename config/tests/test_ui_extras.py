@@ -0,0 +1,52 @@
+import pytest
+from django.template import Context, Engine, TemplateSyntaxError
+
+from config.templatetags.ui_extras import prefixed_id
+
+engine = Engine(
+    loaders=[
+        (
+            "django.template.loaders.locmem.Loader",
+            {"card.html": "[{{ item }}:{{ label }}]"},
+        )
+    ],
+    libraries={"ui_extras": "config.templatetags.ui_extras"},
+)
+
+
+class TestPrefixedId:
+    def test_joins_prefix_and_value(self):
+        assert prefixed_id(12, "user_question") == "user_question_12"
+
+    def test_falls_back_to_default_prefix(self):
+        assert prefixed_id(3, "") == "tag_modal_3"
+
+
+class TestRenderEach:
+    def render(self, source, **context):
+        return engine.from_string(
+            "{% load ui_extras %}" + source
+        ).render(Context(context))
+
+    def test_renders_component_for_each_item(self):
+        output = self.render(
+            '{% render_each items "card.html" as item %}',
+            items=[1, 2, 3],
+            label="x",
+        )
+        assert output == "[1:x][2:x][3:x]"
+
+    def test_does_not_leak_loop_variable(self):
+        output = self.render(
+            '{% render_each items "card.html" as item %}{{ item }}',
+            items=[1],
+            item="outer",
+        )
+        assert output == "[1:]outer"
+
+    def test_empty_or_missing_items_render_nothing(self):
+        assert self.render('{% render_each items "card.html" as item %}') == ""
+
+    def test_rejects_malformed_usage(self):
+        with pytest.raises(TemplateSyntaxError):
+            self.render('{% render_each items "card.html" %}')
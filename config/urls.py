@@ -28,6 +28,7 @@ urlpatterns = [
     path("profile/", views.profile, name="profile"),
     path("questions/", include("questions.urls")),
     path("answers/", include("answers.urls")),
+    path("api/v1/", include("api.urls")),
 ]
 
 if settings.DEBUG:
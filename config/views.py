@@ -1,6 +1,8 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 
+from questions.stats import profile_stats, question_stats
+
 
 def home(request):
     """Home page view"""
@@ -9,11 +11,20 @@ def home(request):
 
 @login_required
 def profile(request):
-    """User profile view showing favorited songs"""
-    # This will be implemented when the Favorite model is available
-    # For now, just show basic profile info
+    """
+    User profile dashboard: question and answer totals, answers per week,
+    most used tags and the average rating of the user's questions. The
+    figures are cached per user (see questions.stats), so the page costs a
+    few aggregate queries at most, however much the user has written.
+    """
+    answers = profile_stats(request.user)
+    weekly_peak = max(
+        (count for _, count in answers["answers_per_week"]), default=0
+    )
     context = {
         "user": request.user,
-        "favorites": [],  # Will be populated when favorites are implemented
+        "questions": question_stats(request.user),
+        "answers": answers,
+        "weekly_peak": weekly_peak,
     }
     return render(request, "account/profile.html", context)
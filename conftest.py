@@ -5,12 +5,25 @@ This file provides common fixtures that can be used across all test modules,
 reducing duplication and making tests more maintainable.
 """
 
+from types import SimpleNamespace
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache.
+
+    Cached per-user data would otherwise outlive the rolled-back rows it
+    was computed from, and SQLite reuses their ids.
+    """
+    cache.clear()
+
+
 # User Fixtures
 # These use function scope (default) because database state should be
 # isolated between tests. However, centralizing them here avoids code
@@ -82,6 +95,121 @@ def admin_client(client, admin_user):
     return client
 
 
+# Dataset Fixtures
+
+
+@pytest.fixture
+def seed_question_data(db):
+    """Return a factory that seeds a dataset scaled by ``n``.
+
+    Each call creates its own users so it can be invoked several times in
+    one test (e.g. at n=1 and n=50) to compare query counts. The returned
+    namespace exposes the objects views are usually requested for:
+
+    - ``user``: superuser owning ``n`` private questions, each linked to
+      ``n`` tags and rated with a vote
+    - ``question``: the user's first private question, with ``n`` STAR and
+      ``n`` basic answers
+    - ``answer``: one of the STAR answers on ``question``
+    - ``tag``/``public_tag``: one of the user's ``n`` personal tags and one
+      of the ``n`` public tags
+    - ``public_question``: the first of ``n`` approved public questions,
+      each linked to ``n`` public tags
+    - ``pending_question``: the first of ``n`` pending public questions
+    """
+    from answers.models import BasicAnswer, StarAnswer
+    from questions.models import Question, QuestionVote, Tag
+
+    def seed(n):
+        user = User.objects.create_superuser(
+            username=f"seed_owner_{n}",
+            email=f"seed_owner_{n}@example.com",
+            password="testpass123",
+        )
+        author = User.objects.create_user(
+            username=f"seed_author_{n}", password="testpass123"
+        )
+
+        personal_tags = Tag.objects.bulk_create(
+            Tag(name=f"seed-{n}-{i}", slug=f"seed-{n}-{i}", owner=user)
+            for i in range(n)
+        )
+        public_tags = Tag.objects.bulk_create(
+            Tag(name=f"public-{n}-{i}", slug=f"public-{n}-{i}", is_public=True)
+            for i in range(n)
+        )
+
+        private_questions = Question.objects.bulk_create(
+            Question(
+                owner=user,
+                title=f"Private question {i}",
+                body="Describe a time you handled a difficult deadline.",
+                is_public=False,
+                status=Question.STATUS_APPROVED,
+            )
+            for i in range(n)
+        )
+        public_questions = Question.objects.bulk_create(
+            Question(
+                owner=author,
+                title=f"Public question {n}-{i}",
+                body="Tell me about a time you led a team.",
+                is_public=True,
+                status=status,
+            )
+            for i in range(n)
+            for status in (Question.STATUS_APPROVED, Question.STATUS_PENDING)
+        )
+
+        Through = Question.tags.through
+        Through.objects.bulk_create(
+            [
+                Through(question_id=question.pk, tag_id=tag.pk)
+                for question in private_questions
+                for tag in personal_tags
+            ]
+            + [
+                Through(question_id=question.pk, tag_id=tag.pk)
+                for question in public_questions
+                for tag in public_tags
+            ]
+        )
+        QuestionVote.objects.bulk_create(
+            QuestionVote(user=user, question=question, rating=i % 5 + 1)
+            for i, question in enumerate(private_questions)
+        )
+
+        question = private_questions[0]
+        answers = []
+        for i in range(n):
+            answers.append(
+                StarAnswer.objects.create(
+                    question=question,
+                    user=user,
+                    situation=f"Situation {i}",
+                    task=f"Task {i}",
+                    action=f"Action {i}",
+                    result=f"Result {i}",
+                )
+            )
+            BasicAnswer.objects.create(
+                question=question, user=user, text=f"Basic answer {i}"
+            )
+
+        return SimpleNamespace(
+            n=n,
+            user=user,
+            question=question,
+            answer=answers[0],
+            public_question=public_questions[0],
+            pending_question=public_questions[1],
+            tag=personal_tags[0],
+            public_tag=public_tags[0],
+        )
+
+    return seed
+
+
 # Note on Fixture Scopes:
 #
 # We're intentionally NOT using broader scopes (session/module) for database
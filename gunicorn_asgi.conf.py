@@ -0,0 +1,27 @@
+# Gunicorn configuration for the ASGI deployment:
+#
+#   gunicorn --config gunicorn_asgi.conf.py config.asgi
+#
+# Everything is inherited from `gunicorn.conf.py` except the worker class. Each
+# worker runs uvicorn's event loop instead of a pool of threads, so a worker
+# can hold many concurrent connections while the async views
+# (`settings.ASYNC_VIEWS`, enabled by `config/asgi.py`) wait on the database.
+# Sync views still work; Django runs them in a thread pool.
+#
+# Compare against the gthread setup with `manage.py run_load_test --server`.
+
+import runpy
+from pathlib import Path
+
+globals().update(
+    {
+        name: value
+        for name, value in runpy.run_path(
+            str(Path(__file__).with_name("gunicorn.conf.py"))
+        ).items()
+        if not name.startswith("__")
+    }
+)
+
+# https://github.com/Kludex/uvicorn-worker
+worker_class = "uvicorn_worker.UvicornWorker"
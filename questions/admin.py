@@ -1,27 +1,129 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.utils import timezone
+
+from config.admin_tools import ScalableModelAdmin, SearchVectorModelAdmin
+
+from . import stats
 from .models import Tag, Question, QuestionVote
+from .services import TagService
+
+
+class PublicTagFilter(admin.SimpleListFilter):
+    """Filter by public tag. Personal tags are too many to list."""
+
+    title = "public tag"
+    parameter_name = "tag"
+
+    def lookups(self, request, model_admin):
+        return Tag.objects.filter(is_public=True).values_list("slug", "name")
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(
+                tags__is_public=True, tags__slug=self.value()
+            )
+        return queryset
 
 
 @admin.register(Tag)
-class TagAdmin(admin.ModelAdmin):
+class TagAdmin(ScalableModelAdmin):
     list_display = ("name", "slug", "is_public", "owner", "created_at")
     list_filter = ("is_public", "created_at")
+    list_select_related = ("owner",)
     search_fields = ("name", "owner__username")
+    autocomplete_fields = ("owner",)
     prepopulated_fields = {"slug": ("name",)}
     readonly_fields = ("created_at",)
+    actions = ("promote_to_public", "merge_duplicates")
+
+    @admin.action(description="Promote selected tags to public")
+    def promote_to_public(self, request, queryset):
+        promoted, merged = TagService.promote_to_public(queryset)
+        self.message_user(
+            request,
+            f"Promoted {promoted} tag(s) to public and merged {merged} "
+            "into public tags of the same name.",
+            messages.SUCCESS,
+        )
+
+    @admin.action(description="Merge selected tags with the same name")
+    def merge_duplicates(self, request, queryset):
+        merged = TagService.merge_duplicates(queryset)
+        self.message_user(
+            request, f"Merged {merged} duplicate tag(s).", messages.SUCCESS
+        )
 
 
 @admin.register(Question)
-class QuestionAdmin(admin.ModelAdmin):
+class QuestionAdmin(SearchVectorModelAdmin):
     list_display = ("title", "owner", "status", "is_public", "created_at")
-    list_filter = ("status", "is_public", "created_at", "tags")
+    list_filter = ("status", "is_public", "created_at", PublicTagFilter)
+    list_select_related = ("owner",)
+    # Fallback for databases without full-text search, see
+    # SearchVectorAdminMixin
     search_fields = ("title", "body")
-    filter_horizontal = ("tags",)
+    autocomplete_fields = ("owner", "tags")
     readonly_fields = ("created_at", "updated_at", "search_vector")
+    actions = ("approve_questions", "deny_questions", "make_private")
+
+    # Each action is a single UPDATE over the selection. Private questions
+    # are not moderated, so approve and deny only change public ones.
+    # update() sends no signals, so the owners' cached stats are dropped
+    # here. Their ids are read before the UPDATE: the selection keeps the
+    # changelist filters (e.g. "Status: Pending"), which the updated rows
+    # may no longer match.
+
+    @staticmethod
+    def _owner_ids(queryset):
+        return list(queryset.values_list("owner_id", flat=True).distinct())
+
+    @admin.action(description="Approve selected public questions")
+    def approve_questions(self, request, queryset):
+        owner_ids = self._owner_ids(queryset)
+        updated = (
+            queryset.filter(is_public=True)
+            .exclude(status=Question.STATUS_APPROVED)
+            .update(status=Question.STATUS_APPROVED, updated_at=timezone.now())
+        )
+        stats.invalidate(owner_ids, public=bool(updated))
+        self.message_user(
+            request, f"Approved {updated} question(s).", messages.SUCCESS
+        )
+
+    @admin.action(description="Deny selected public questions")
+    def deny_questions(self, request, queryset):
+        owner_ids = self._owner_ids(queryset)
+        updated = (
+            queryset.filter(is_public=True)
+            .exclude(status=Question.STATUS_DENIED)
+            .update(status=Question.STATUS_DENIED, updated_at=timezone.now())
+        )
+        stats.invalidate(owner_ids, public=bool(updated))
+        self.message_user(
+            request, f"Denied {updated} question(s).", messages.SUCCESS
+        )
+
+    @admin.action(description="Make selected questions private")
+    def make_private(self, request, queryset):
+        owner_ids = self._owner_ids(queryset)
+        # Private questions are always approved, as in question_create
+        updated = queryset.filter(is_public=True).update(
+            is_public=False,
+            status=Question.STATUS_APPROVED,
+            updated_at=timezone.now(),
+        )
+        stats.invalidate(owner_ids, public=bool(updated))
+        self.message_user(
+            request,
+            f"Made {updated} question(s) private.",
+            messages.SUCCESS,
+        )
 
 
 @admin.register(QuestionVote)
-class QuestionVoteAdmin(admin.ModelAdmin):
+class QuestionVoteAdmin(ScalableModelAdmin):
     list_display = ("user", "question", "rating", "created_at")
     list_filter = ("rating", "created_at")
+    list_select_related = ("user", "question")
+    autocomplete_fields = ("user", "question")
     readonly_fields = ("created_at",)
@@ -0,0 +1,199 @@
+"""
+Export a user's question collection as NDJSON or CSV.
+
+Used by the ``questions:export`` view and the ``export_questions`` management
+command. Questions are read with ``QuerySet.iterator(chunk_size=...)`` and
+their tags and answers are prefetched one chunk at a time, so memory use
+depends on the chunk size, not on the size of the collection. Output is
+produced incrementally and can be gzip-compressed as it is generated.
+
+NDJSON has one line per question, with its tags and answers nested. CSV has
+one row per answer, repeating the question columns; questions without
+answers get a single row with empty answer columns.
+"""
+
+import csv
+import io
+import json
+import zlib
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+from answers.models import Answer
+from questions.models import Question, Tag
+
+try:
+    import orjson
+except ModuleNotFoundError:  # optional, falls back to the json module
+    orjson = None
+
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+FORMATS = (FORMAT_NDJSON, FORMAT_CSV)
+
+CONTENT_TYPES = {
+    FORMAT_NDJSON: "application/x-ndjson",
+    FORMAT_CSV: "text/csv",
+}
+
+# Questions fetched per round trip; each chunk costs one query for its tags
+# and one for its answers.
+EXPORT_CHUNK_SIZE = 500
+
+CSV_COLUMNS = (
+    "question_id",
+    "title",
+    "body",
+    "is_public",
+    "status",
+    "created_at",
+    "tags",
+    "answer_id",
+    "answer_type",
+    "answer_is_public",
+    "answer_created_at",
+    "answer_updated_at",
+    "situation",
+    "task",
+    "action",
+    "result",
+    "text",
+)
+
+
+def export_queryset(user):
+    """Return the user's questions with their tags and answers prefetched."""
+    return (
+        Question.objects.filter(owner=user)
+        .order_by("created_at", "id")
+        .prefetch_related(
+            Prefetch(
+                "tags",
+                queryset=Tag.objects.order_by("name").only("id", "name"),
+            ),
+            Prefetch(
+                "answers",
+                queryset=Answer.objects.filter(user=user).order_by(
+                    "created_at", "id"
+                ),
+            ),
+        )
+    )
+
+
+def _answer_record(answer):
+    record = {
+        "id": answer.pk,
+        "answer_type": answer.answer_type,
+        "is_public": answer.is_public,
+        "created_at": answer.created_at,
+        "updated_at": answer.updated_at,
+    }
+    for field in answer.content_fields:
+        record[field] = getattr(answer, field)
+    return record
+
+
+def question_record(question):
+    """Return the exported representation of a prefetched question."""
+    return {
+        "id": question.pk,
+        "title": question.title,
+        "body": question.body,
+        "is_public": question.is_public,
+        "status": question.status,
+        "created_at": question.created_at,
+        "tags": [tag.name for tag in question.tags.all()],
+        "answers": [
+            _answer_record(answer) for answer in question.answers.all()
+        ],
+    }
+
+
+def _ndjson_lines(records):
+    for record in records:
+        if orjson is not None:
+            yield orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = json.dumps(
+                record, cls=DjangoJSONEncoder, separators=(",", ":")
+            )
+            yield f"{line}\n".encode()
+
+
+def _csv_rows(record):
+    question = [
+        record["id"],
+        record["title"],
+        record["body"],
+        record["is_public"],
+        record["status"],
+        record["created_at"].isoformat(),
+        ", ".join(record["tags"]),
+    ]
+    if not record["answers"]:
+        yield question + [""] * (len(CSV_COLUMNS) - len(question))
+    for answer in record["answers"]:
+        yield question + [
+            answer["id"],
+            answer["answer_type"],
+            answer["is_public"],
+            answer["created_at"].isoformat(),
+            answer["updated_at"].isoformat(),
+            answer.get("situation", ""),
+            answer.get("task", ""),
+            answer.get("action", ""),
+            answer.get("result", ""),
+            answer.get("text", ""),
+        ]
+
+
+def _csv_lines(records):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    yield buffer.getvalue().encode()
+    for record in records:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_csv_rows(record))
+        yield buffer.getvalue().encode()
+
+
+def _gzip(blocks):
+    """
+    Compress byte blocks into a gzip stream as they are produced. Each block
+    is flushed so the client can decompress it as soon as it arrives.
+    """
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for block in blocks:
+        yield compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def iter_export(
+    user, fmt=FORMAT_NDJSON, compress=False, chunk_size=EXPORT_CHUNK_SIZE
+):
+    """
+    Yield the user's export as byte blocks, one block per chunk of
+    questions (gzip-compressed when ``compress`` is true).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format: {fmt}")
+
+    questions = export_queryset(user).iterator(chunk_size=chunk_size)
+    records = (question_record(question) for question in questions)
+    lines = (_ndjson_lines if fmt == FORMAT_NDJSON else _csv_lines)(records)
+
+    # Join the lines of each chunk so the response (or file) is written in a
+    # few large blocks rather than one small write per question
+    blocks = iter(lambda: b"".join(islice(lines, chunk_size)), b"")
+    return _gzip(blocks) if compress else blocks
+
+
+def export_filename(user, fmt, compress=False):
+    """Return the download filename for an export."""
+    suffix = ".gz" if compress else ""
+    return f"{user.get_username()}-questions.{fmt}{suffix}"
@@ -78,15 +78,8 @@ class QuestionForm(forms.ModelForm):
 
             # Handle tags - only after instance is saved (needs ID for M2M)
             if self.user:
-                tags_str = self.cleaned_data.get("tags_input", "")
-                tag_names = [
-                    name.strip()
-                    for name in tags_str.split(",")
-                    if name.strip()
-                ]
-
                 tags_to_add = []
-                for tag_name in tag_names:
+                for tag_name in self.tag_names():
                     tag = self._get_or_create_tag(tag_name)
                     if tag:
                         tags_to_add.append(tag)
@@ -95,6 +88,11 @@ class QuestionForm(forms.ModelForm):
 
         return instance
 
+    def tag_names(self):
+        """Return the tag names entered in ``tags_input``."""
+        tags_str = self.cleaned_data.get("tags_input", "")
+        return [name.strip() for name in tags_str.split(",") if name.strip()]
+
     def _get_or_create_tag(self, tag_name):
         """
         Efficiently get or create a tag following business logic rules.
@@ -0,0 +1,344 @@
+"""
+Bulk import of questions, tags and answers from NDJSON or CSV.
+
+Used by the ``questions:import`` view and the ``import_questions`` management
+command. It reads the formats written by ``questions.export``, so an export
+can be imported into another account. Only ``title`` is required; ``id``
+columns are ignored (CSV rows sharing a ``question_id`` are grouped into
+one question).
+
+Files are parsed as a stream and processed in batches. For each batch, rows
+are validated, tags are resolved (and created) with a few set-based queries
+(``TagService.resolve_names``),
+and questions, tag links and answers are inserted with ``bulk_create``.
+post_save signals do not fire, so search vectors are computed with one
+UPDATE per table once every batch is in. Invalid rows are reported with
+their line number and skipped; the rest of the batch is still imported.
+"""
+
+import csv
+import gzip
+import io
+import json
+import time
+from itertools import groupby, islice
+
+from django.contrib.postgres.search import SearchVector
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+
+from answers import bulk as answers_bulk
+from answers.models import Answer
+from questions.export import FORMAT_CSV, FORMAT_NDJSON, FORMATS
+from questions.models import Question, Tag
+from questions import stats
+from questions.services import QuestionService, TagService
+
+# Rows validated and inserted together, in one transaction
+IMPORT_BATCH_SIZE = 500
+
+# Per-row errors kept for the report; the total is always counted
+MAX_REPORTED_ERRORS = 100
+
+
+TRUTHY_VALUES = {"true", "1", "yes", "on"}
+
+
+class ImportReport:
+    """Counts, timing and per-row errors of an import."""
+
+    def __init__(self):
+        self.rows = 0
+        self.questions = 0
+        self.answers = 0
+        self.tags_created = 0
+        self.error_count = 0
+        self.errors = []
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def add_error(self, line, message):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+    def as_dict(self):
+        return {
+            "rows": self.rows,
+            "questions": self.questions,
+            "answers": self.answers,
+            "tags_created": self.tags_created,
+            "error_count": self.error_count,
+            "errors": [
+                {"line": line, "error": message}
+                for line, message in self.errors
+            ],
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+        }
+
+
+def detect_format(filename):
+    """Return the format and whether the file is gzip-compressed."""
+    name = filename.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[: -len(".gz")]
+    if name.endswith(".csv"):
+        return FORMAT_CSV, compressed
+    if name.endswith((".ndjson", ".jsonl", ".json")):
+        return FORMAT_NDJSON, compressed
+    raise ValueError(
+        "Unsupported file type; expected .ndjson, .jsonl or .csv "
+        "(optionally .gz)"
+    )
+
+
+def _text_stream(file, compressed):
+    """Wrap a binary file object as a text stream, decompressing on the fly."""
+    if compressed:
+        file = gzip.GzipFile(fileobj=file, mode="rb")
+    return io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+
+
+def _ndjson_records(stream):
+    """Yield (line, record or error message) for each non-blank line."""
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_number, f"Invalid JSON: {exc}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, "Expected a JSON object"
+            continue
+        yield line_number, record
+
+
+def _csv_records(stream):
+    """
+    Yield (line, record) per question, grouping consecutive rows that share
+    a ``question_id``. Rows without one are a question each.
+    """
+    reader = csv.DictReader(stream)
+    rows = ((reader.line_num, row) for row in reader)
+
+    def key(numbered_row):
+        line_number, row = numbered_row
+        return row.get("question_id") or f"line:{line_number}"
+
+    for _, group in groupby(rows, key=key):
+        group = list(group)
+        line_number, first = group[0]
+        yield line_number, {
+            "title": first.get("title"),
+            "body": first.get("body") or "",
+            "is_public": first.get("is_public"),
+            "tags": (first.get("tags") or "").split(","),
+            "answers": [
+                {
+                    "answer_type": row["answer_type"],
+                    "is_public": row.get("answer_is_public"),
+                    **{
+                        field: row.get(field)
+                        for field in Answer.CONTENT_FIELDS.get(
+                            row["answer_type"].upper(), ()
+                        )
+                    },
+                }
+                for _, row in group
+                if row.get("answer_type")
+            ],
+        }
+
+
+def _as_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value or "").strip().lower() in TRUTHY_VALUES
+
+
+def _validation_message(error, prefix=""):
+    return "; ".join(
+        f"{prefix}{field}: {' '.join(messages)}"
+        for field, messages in error.message_dict.items()
+    )
+
+
+class _Importer:
+    def __init__(self, user, batch_size, report):
+        self.user = user
+        self.batch_size = batch_size
+        self.report = report
+        # Tags resolved by TagService.resolve_names, kept across batches
+        self.tags = {}
+
+    def run(self, records):
+        while batch := list(islice(records, self.batch_size)):
+            self.report.rows += len(batch)
+            valid = []
+            for line_number, record in batch:
+                if isinstance(record, str):
+                    self.report.add_error(line_number, record)
+                    continue
+                try:
+                    valid.append(self._build(record))
+                except ValidationError as exc:
+                    self.report.add_error(line_number, exc.messages[0])
+            if valid:
+                self._insert(valid)
+
+    def _build(self, record):
+        """Validate a record and return its unsaved rows."""
+        is_public = _as_bool(record.get("is_public"))
+        question = Question(
+            owner=self.user,
+            title=str(record.get("title") or "").strip(),
+            body=str(record.get("body") or ""),
+            is_public=is_public,
+            status=QuestionService.initial_status(self.user, is_public),
+        )
+        try:
+            question.clean_fields(exclude=["owner"])
+        except ValidationError as exc:
+            raise ValidationError(_validation_message(exc))
+
+        tag_names = record.get("tags") or []
+        if not isinstance(tag_names, list):
+            raise ValidationError("tags: Expected a list of names.")
+        # Tag names are matched case-insensitively; keep the first spelling
+        unique_names = {}
+        for name in map(str.strip, map(str, tag_names)):
+            if name:
+                unique_names.setdefault(name.lower(), name)
+        tag_names = list(unique_names.values())
+        max_length = Tag._meta.get_field("name").max_length
+        for name in tag_names:
+            if len(name) > max_length:
+                raise ValidationError(
+                    f"tags: {name[:20]!r}... is longer than "
+                    f"{max_length} characters."
+                )
+
+        answers = record.get("answers") or []
+        if not isinstance(answers, list):
+            raise ValidationError("answers: Expected a list of objects.")
+        return question, tag_names, [
+            self._build_answer(number, answer)
+            for number, answer in enumerate(answers, start=1)
+        ]
+
+    def _build_answer(self, number, data):
+        prefix = f"answer {number} "
+        if not isinstance(data, dict):
+            raise ValidationError(f"answer {number}: Expected an object.")
+        answer_type = str(data.get("answer_type") or "").upper()
+        if answer_type not in Answer.CONTENT_FIELDS:
+            raise ValidationError(
+                f"{prefix}answer_type: Must be STAR or BASIC."
+            )
+        answer = Answer(
+            user=self.user,
+            answer_type=answer_type,
+            is_public=_as_bool(data.get("is_public")),
+            **{
+                field: str(data.get(field) or "").strip()
+                for field in Answer.CONTENT_FIELDS[answer_type]
+            },
+        )
+        try:
+            answer.clean_fields(exclude=["question", "user"])
+        except ValidationError as exc:
+            raise ValidationError(_validation_message(exc, prefix))
+        return answer
+
+    @transaction.atomic
+    def _insert(self, rows):
+        _, created = TagService.resolve_names(
+            self.user,
+            (name for _, names, _ in rows for name in names),
+            resolved=self.tags,
+        )
+        self.report.tags_created += created
+        if connection.vendor == "postgresql":
+            for question, names, _ in rows:
+                question.tag_ids = sorted(
+                    {self.tags[name.lower()][0] for name in names}
+                )
+        questions = Question.objects.bulk_create(
+            [question for question, _, _ in rows]
+        )
+
+        Through = Question.tags.through
+        links = []
+        answers = []
+        for question, (_, names, question_answers) in zip(questions, rows):
+            links.extend(
+                Through(
+                    question_id=question.pk,
+                    tag_id=self.tags[name.lower()][0],
+                )
+                for name in names
+            )
+            for answer in question_answers:
+                answer.question_id = question.pk
+                answers.append(answer)
+        Through.objects.bulk_create(links)
+        Answer.objects.bulk_create(answers)
+
+        self.report.questions += len(questions)
+        self.report.answers += len(answers)
+
+
+def _update_search_vectors(user):
+    """Compute the search vectors bulk_create left empty - set-based."""
+    if connection.vendor != "postgresql":
+        return
+    Question.objects.filter(owner=user, search_vector=None).update(
+        search_vector=SearchVector("title", weight="A")
+        + SearchVector("body", weight="B")
+    )
+    answers_bulk.update_search_vectors(user_id=user.pk, only_missing=True)
+
+
+def import_questions(
+    user,
+    file,
+    fmt=FORMAT_NDJSON,
+    compressed=False,
+    batch_size=IMPORT_BATCH_SIZE,
+):
+    """
+    Import questions, tags and answers for ``user`` from a binary file
+    object. Returns an ``ImportReport``.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown import format: {fmt}")
+
+    report = ImportReport()
+    started = time.perf_counter()
+
+    stream = _text_stream(file, compressed)
+    records = (_csv_records if fmt == FORMAT_CSV else _ndjson_records)(stream)
+    try:
+        _Importer(user, batch_size, report).run(records)
+    except (OSError, EOFError, UnicodeDecodeError, csv.Error) as exc:
+        # Unreadable input (bad or truncated gzip data, encoding, ...): keep
+        # what was imported and report where reading stopped
+        report.add_error(None, f"Could not read file: {exc}")
+    finally:
+        # Leave the caller's file open
+        raw = stream.detach()
+        if compressed:
+            raw.close()
+
+    _update_search_vectors(user)
+    # Only superusers' public questions are approved (and listed) at once
+    stats.invalidate([user.pk], public=user.is_superuser)
+    report.elapsed = time.perf_counter() - started
+    return report
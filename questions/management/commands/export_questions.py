@@ -0,0 +1,88 @@
+"""
+Management command to export a user's questions, tags and answers.
+
+Examples:
+    python manage.py export_questions alice > alice.ndjson
+    python manage.py export_questions alice --format csv --gzip \\
+        --output alice.csv.gz
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from questions.export import (
+    EXPORT_CHUNK_SIZE,
+    FORMAT_NDJSON,
+    FORMATS,
+    iter_export,
+)
+
+
+class Command(BaseCommand):
+    help = "Export a user's questions, tags and answers as NDJSON or CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Owner of the questions")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default=FORMAT_NDJSON,
+            help="Output format (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Compress the output with gzip",
+        )
+        parser.add_argument(
+            "--output",
+            "-o",
+            help="File to write to (default: standard output)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=EXPORT_CHUNK_SIZE,
+            help="Questions fetched per query (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get_by_natural_key(options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['username']!r} does not exist")
+
+        blocks = iter_export(
+            user,
+            options["format"],
+            compress=options["gzip"],
+            chunk_size=options["chunk_size"],
+        )
+
+        if options["output"]:
+            with open(options["output"], "wb") as output:
+                written = self._write(blocks, output)
+            self.stderr.write(
+                self.style.SUCCESS(
+                    f"Wrote {written} bytes to {options['output']}"
+                )
+            )
+        elif hasattr(self.stdout._out, "buffer"):
+            # Write bytes to the binary stream under self.stdout, which is a
+            # text stream, since the output may be compressed
+            self.stdout.flush()
+            self._write(blocks, self.stdout._out.buffer)
+            self.stdout._out.buffer.flush()
+        elif options["gzip"]:
+            raise CommandError("--gzip needs --output or a binary stdout")
+        else:
+            for block in blocks:
+                self.stdout.write(block.decode(), ending="")
+
+    def _write(self, blocks, output):
+        written = 0
+        for block in blocks:
+            output.write(block)
+            written += len(block)
+        return written
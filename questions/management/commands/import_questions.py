@@ -0,0 +1,85 @@
+"""
+Management command to import questions, tags and answers for a user.
+
+Examples:
+    python manage.py import_questions alice questions.ndjson
+    python manage.py import_questions alice export.csv.gz --batch-size 1000
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from questions.export import FORMATS
+from questions.imports import (
+    IMPORT_BATCH_SIZE,
+    detect_format,
+    import_questions,
+)
+
+
+class Command(BaseCommand):
+    help = "Import questions, tags and answers from NDJSON or CSV"
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Owner of the imported rows")
+        parser.add_argument(
+            "path", help="File to import (.ndjson, .jsonl or .csv, or .gz)"
+        )
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            help="Input format (default: from the file extension)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="Rows validated and inserted together (default: "
+            "%(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get_by_natural_key(options["username"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['username']!r} does not exist")
+
+        path = options["path"]
+        if options["format"]:
+            fmt = options["format"]
+            compressed = path.lower().endswith(".gz")
+        else:
+            try:
+                fmt, compressed = detect_format(path)
+            except ValueError as exc:
+                raise CommandError(str(exc))
+
+        try:
+            with open(path, "rb") as file:
+                report = import_questions(
+                    user,
+                    file,
+                    fmt,
+                    compressed,
+                    batch_size=options["batch_size"],
+                )
+        except OSError as exc:
+            raise CommandError(f"Could not open {path}: {exc}")
+
+        for line, message in report.errors:
+            self.stderr.write(f"line {line}: {message}")
+        if report.error_count > len(report.errors):
+            self.stderr.write(
+                f"... and {report.error_count - len(report.errors)} more"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {report.questions} questions and "
+                f"{report.answers} answers from {report.rows} rows "
+                f"({report.tags_created} new tags, {report.error_count} "
+                f"errors) in {report.elapsed:.1f}s "
+                f"({report.rows_per_second:.0f} rows/sec)"
+            )
+        )
@@ -0,0 +1,320 @@
+"""
+Management command to generate a large synthetic dataset for load testing
+and benchmarking.
+
+Rows are written with ``bulk_create`` in large batches (post_save signals do
+not fire), so search vectors are populated in bulk at the end using the
+``update_question_search_vectors`` and ``update_answer_search_vectors``
+commands, and the question tag id arrays with
+``QuestionService.refresh_tag_ids``.
+"""
+
+import random
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from answers.models import Answer
+from questions.models import Question, QuestionVote, Tag
+from questions.services import QuestionService
+
+User = get_user_model()
+
+WORDS = (
+    "team project deadline stakeholder customer release migration "
+    "incident budget risk feedback conflict priority roadmap process "
+    "quality metric launch design review mentor junior senior manager "
+    "decision trade-off scope requirement estimate delay outage data "
+    "analysis report presentation meeting client vendor contract "
+    "improvement automation testing deployment support escalation "
+    "resolved delivered reduced increased improved negotiated led "
+    "coordinated planned organised learned agreed measured shipped"
+).split()
+
+PUBLIC_STATUSES = (
+    Question.STATUS_APPROVED,
+    Question.STATUS_APPROVED,
+    Question.STATUS_PENDING,
+    Question.STATUS_DENIED,
+)
+
+
+def _text(rng, min_words, max_words):
+    """Return a pseudo-sentence of between ``min_words`` and ``max_words``."""
+    words = rng.choices(WORDS, k=rng.randint(min_words, max_words))
+    return " ".join(words).capitalize() + "."
+
+
+class Command(BaseCommand):
+    help = "Generate a large synthetic dataset for benchmarks and load tests"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=100, help="Number of users"
+        )
+        parser.add_argument(
+            "--public-tags", type=int, default=50, help="Number of public tags"
+        )
+        parser.add_argument(
+            "--tags-per-user",
+            type=int,
+            default=5,
+            help="Personal tags created for each user",
+        )
+        parser.add_argument(
+            "--questions-per-user",
+            type=int,
+            default=50,
+            help="Questions created for each user",
+        )
+        parser.add_argument(
+            "--public-ratio",
+            type=float,
+            default=0.2,
+            help="Fraction of questions submitted as public",
+        )
+        parser.add_argument(
+            "--max-tags-per-question",
+            type=int,
+            default=4,
+            help="Upper bound of tags linked to each question",
+        )
+        parser.add_argument(
+            "--max-answers-per-question",
+            type=int,
+            default=3,
+            help="Upper bound of answers on each private question",
+        )
+        parser.add_argument(
+            "--star-ratio",
+            type=float,
+            default=0.7,
+            help="Fraction of answers written in the STAR format",
+        )
+        parser.add_argument(
+            "--max-votes-per-question",
+            type=int,
+            default=5,
+            help="Upper bound of votes on each approved public question",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows written per bulk INSERT",
+        )
+        parser.add_argument(
+            "--prefix",
+            default="bench",
+            help="Prefix for generated usernames and tag names",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Random seed for repeatability"
+        )
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Delete users previously generated with the same prefix",
+        )
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.counts = dict.fromkeys(
+            ("users", "tags", "questions", "tag links", "answers", "votes"), 0
+        )
+        prefix = options["prefix"]
+
+        existing = User.objects.filter(username__startswith=f"{prefix}_")
+        if existing.exists():
+            if not options["flush"]:
+                raise CommandError(
+                    f'Users prefixed "{prefix}_" already exist. Use --flush '
+                    "to delete them or choose another --prefix."
+                )
+            self.stdout.write("Deleting previously generated data...")
+            existing.delete()
+            Tag.objects.filter(
+                is_public=True, name__startswith=f"{prefix} "
+            ).delete()
+
+        started = time.perf_counter()
+
+        user_ids = self._create_users()
+        public_tag_ids, personal_tag_ids = self._create_tags(user_ids)
+        self._create_questions(user_ids, public_tag_ids, personal_tag_ids)
+
+        if connection.vendor == "postgresql":
+            call_command("update_question_search_vectors", stdout=self.stdout)
+            call_command("update_answer_search_vectors", stdout=self.stdout)
+            QuestionService.refresh_tag_ids()
+
+        elapsed = time.perf_counter() - started
+        total = sum(self.counts.values())
+        summary = ", ".join(
+            f"{count} {name}" for name, count in self.counts.items()
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {summary} in {elapsed:.1f}s "
+                f"({total / max(elapsed, 1e-9):.0f} rows/sec)"
+            )
+        )
+
+    def _bulk_create(self, model, objs):
+        return model.objects.bulk_create(objs, batch_size=self.batch_size)
+
+    def _create_users(self):
+        prefix = self.options["prefix"]
+        # Hash once; every generated user shares the same password.
+        password = make_password("benchmark-password")
+        users = self._bulk_create(
+            User,
+            [
+                User(
+                    username=f"{prefix}_{i}",
+                    email=f"{prefix}_{i}@example.com",
+                    password=password,
+                )
+                for i in range(self.options["users"])
+            ],
+        )
+        self.counts["users"] += len(users)
+        return [user.pk for user in users]
+
+    def _create_tags(self, user_ids):
+        prefix = self.options["prefix"]
+        public_tags = self._bulk_create(
+            Tag,
+            [
+                Tag(
+                    name=f"{prefix} topic {i}",
+                    slug=f"{prefix}-topic-{i}",
+                    is_public=True,
+                )
+                for i in range(self.options["public_tags"])
+            ],
+        )
+
+        personal_tags = self._bulk_create(
+            Tag,
+            [
+                Tag(
+                    name=f"{prefix} personal {i}",
+                    slug=f"{prefix}-personal-{i}",
+                    owner_id=user_id,
+                )
+                for user_id in user_ids
+                for i in range(self.options["tags_per_user"])
+            ],
+        )
+        personal_tag_ids = {}
+        for tag in personal_tags:
+            personal_tag_ids.setdefault(tag.owner_id, []).append(tag.pk)
+
+        self.counts["tags"] += len(public_tags) + len(personal_tags)
+        return [tag.pk for tag in public_tags], personal_tag_ids
+
+    def _create_questions(self, user_ids, public_tag_ids, personal_tag_ids):
+        rng = self.rng
+        pending = []
+        for user_id in user_ids:
+            for _ in range(self.options["questions_per_user"]):
+                is_public = rng.random() < self.options["public_ratio"]
+                pending.append(
+                    Question(
+                        owner_id=user_id,
+                        title=_text(rng, 6, 14).rstrip(".") + "?",
+                        body=_text(rng, 10, 60) if rng.random() < 0.5 else "",
+                        is_public=is_public,
+                        status=(
+                            rng.choice(PUBLIC_STATUSES)
+                            if is_public
+                            else Question.STATUS_APPROVED
+                        ),
+                    )
+                )
+                if len(pending) >= self.batch_size:
+                    self._flush_questions(
+                        pending, user_ids, public_tag_ids, personal_tag_ids
+                    )
+                    pending = []
+        if pending:
+            self._flush_questions(
+                pending, user_ids, public_tag_ids, personal_tag_ids
+            )
+
+    @transaction.atomic
+    def _flush_questions(
+        self, questions, user_ids, public_tag_ids, personal_tag_ids
+    ):
+        """Insert a batch of questions with their tag links, answers and
+        votes."""
+        rng = self.rng
+        questions = self._bulk_create(Question, questions)
+        self.counts["questions"] += len(questions)
+
+        Through = Question.tags.through
+        links = []
+        answers = []
+        votes = []
+        for question in questions:
+            # Public questions may only use public tags.
+            candidates = public_tag_ids
+            if not question.is_public:
+                candidates = candidates + personal_tag_ids.get(
+                    question.owner_id, []
+                )
+            k = min(
+                rng.randint(0, self.options["max_tags_per_question"]),
+                len(candidates),
+            )
+            links.extend(
+                Through(question_id=question.pk, tag_id=tag_id)
+                for tag_id in rng.sample(candidates, k)
+            )
+
+            # Business rule: public questions do not have answers.
+            if not question.is_public:
+                for _ in range(
+                    rng.randint(0, self.options["max_answers_per_question"])
+                ):
+                    answers.append(self._build_answer(question))
+            elif question.status == Question.STATUS_APPROVED:
+                k = min(
+                    rng.randint(0, self.options["max_votes_per_question"]),
+                    len(user_ids),
+                )
+                votes.extend(
+                    QuestionVote(
+                        user_id=user_id,
+                        question_id=question.pk,
+                        rating=rng.randint(1, 5),
+                    )
+                    for user_id in rng.sample(user_ids, k)
+                )
+
+        self.counts["tag links"] += len(self._bulk_create(Through, links))
+        self.counts["votes"] += len(self._bulk_create(QuestionVote, votes))
+        self._insert_answers(answers)
+
+    def _build_answer(self, question):
+        rng = self.rng
+        answer = Answer(question_id=question.pk, user_id=question.owner_id)
+        if rng.random() < self.options["star_ratio"]:
+            answer.answer_type = Answer.ANSWER_TYPE_STAR
+            words = (30, 120)
+        else:
+            answer.answer_type = Answer.ANSWER_TYPE_BASIC
+            words = (40, 200)
+        for field in answer.content_fields:
+            setattr(answer, field, _text(rng, *words))
+        return answer
+
+    def _insert_answers(self, answers):
+        self.counts["answers"] += len(self._bulk_create(Answer, answers))
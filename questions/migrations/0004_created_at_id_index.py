@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('questions', '0003_auto_generate_tag_slugs'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['-created_at', '-id'], name='questions_q_created_79cadc_idx'),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:39
+
+import django.contrib.postgres.indexes
+import questions.models
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+BATCH_SIZE = 10_000
+
+
+def fill_tag_ids(apps, schema_editor):
+    """
+    Copy the existing tag links into the array (PostgreSQL only), in
+    primary key ranges of ``BATCH_SIZE``. The migration is not atomic, so
+    each UPDATE commits on its own and only locks its range of rows,
+    briefly, while the site keeps serving. Filled rows are skipped, so the
+    copy can be re-run.
+    """
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT MIN(id), MAX(id) FROM questions_question")
+        low, high = cursor.fetchone()
+        if low is None:
+            return
+        for start in range(low, high + 1, BATCH_SIZE):
+            cursor.execute(
+                "UPDATE questions_question SET tag_ids = ARRAY("
+                "SELECT tag_id FROM questions_question_tags "
+                "WHERE question_id = questions_question.id ORDER BY tag_id) "
+                "WHERE id >= %s AND id < %s AND tag_ids IS NULL",
+                [start, start + BATCH_SIZE],
+            )
+
+
+class AddIndexConcurrentlyOnPostgres(AddIndexConcurrently):
+    """
+    Build the index with CREATE INDEX CONCURRENTLY on PostgreSQL, so writes
+    are not blocked while it builds; a plain index elsewhere (SQLite in
+    tests).
+    """
+
+    def database_forwards(self, app_label, schema_editor, *args):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_forwards(app_label, schema_editor, *args)
+        else:
+            migrations.AddIndex.database_forwards(
+                self, app_label, schema_editor, *args
+            )
+
+    def database_backwards(self, app_label, schema_editor, *args):
+        if schema_editor.connection.vendor == "postgresql":
+            super().database_backwards(app_label, schema_editor, *args)
+        else:
+            migrations.AddIndex.database_backwards(
+                self, app_label, schema_editor, *args
+            )
+
+
+class Migration(migrations.Migration):
+
+    # The backfill commits batch by batch, and CREATE INDEX CONCURRENTLY
+    # cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('questions', '0004_created_at_id_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='tag_ids',
+            field=questions.models.IdArrayField(base_field=models.BigIntegerField(), blank=True, editable=False, null=True, size=None),
+        ),
+        migrations.RunPython(fill_tag_ids, migrations.RunPython.noop),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='question',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tag_ids'], name='questions_q_tag_ids_174707_gin'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.conf import settings
-from django.db import models
+from django.db import connections, models
+from django.db.models.functions import Coalesce
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
 from django.utils import timezone
@@ -8,6 +10,23 @@ from django.utils.text import slugify
 User = settings.AUTH_USER_MODEL
 
 
+class IdArrayField(ArrayField):
+    """
+    ``bigint[]`` column of ids. Other databases only ever store NULL in it,
+    so the ``::bigint[]`` cast ArrayField adds to parameters is left out
+    there.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("base_field", models.BigIntegerField())
+        super().__init__(**kwargs)
+
+    def get_placeholder(self, value, compiler, connection):
+        if connection.vendor != "postgresql":
+            return "%s"
+        return super().get_placeholder(value, compiler, connection)
+
+
 class Tag(models.Model):
     name = models.CharField(max_length=50)
     slug = models.SlugField(max_length=60, blank=True)
@@ -62,6 +81,73 @@ class QuestionQuerySet(models.QuerySet):
             models.Q(owner=user) | models.Q(is_public=True, status="APPROVED")
         )
 
+    def tagged(self, slugs, mode="all"):
+        """Filter by tag slugs (case-insensitive).
+
+        Keeps questions with all of the tags, or with any of them when
+        ``mode`` is ``"any"``. On PostgreSQL every slug is an ``&&`` probe of
+        the GIN-indexed ``tag_ids`` array against the ids of the tags with
+        that slug (resolved in a subquery), so there is no join and no
+        DISTINCT. Other databases join the tag links instead.
+        """
+        slugs = [slug for slug in slugs if slug]
+        if not slugs:
+            return self
+
+        if connections[self.db].vendor == "postgresql":
+
+            def with_any_tag(group):
+                matches = models.Q()
+                for slug in group:
+                    matches |= models.Q(slug__iexact=slug)
+                ids = Tag.objects.filter(matches).values("pk")
+                return models.Q(tag_ids__overlap=ids)
+
+            if mode == Question.TAG_MODE_ANY:
+                return self.filter(with_any_tag(slugs))
+            questions = self
+            for slug in slugs:
+                questions = questions.filter(with_any_tag([slug]))
+            return questions
+
+        # Join fallback; the links can match several times per question
+        if mode == Question.TAG_MODE_ANY:
+            matches = models.Q()
+            for slug in slugs:
+                matches |= models.Q(tags__slug__iexact=slug)
+            return self.filter(matches).distinct()
+        questions = self
+        for slug in slugs:
+            # A separate filter() call joins the links once per slug
+            questions = questions.filter(tags__slug__iexact=slug)
+        return questions.distinct()
+
+    def with_tag_preview(self, limit):
+        """Prepare questions for card rendering.
+
+        Annotates ``tag_count`` and prefetches only the first ``limit`` tags
+        (by name) into ``visible_tags``, so cards never load a question's
+        full tag list.
+        """
+        tag_links = (
+            self.model.tags.through.objects.filter(
+                question_id=models.OuterRef("pk")
+            )
+            .order_by()
+            .values("question_id")
+            .annotate(count=models.Count("pk"))
+            .values("count")
+        )
+        return self.annotate(
+            tag_count=Coalesce(models.Subquery(tag_links), 0)
+        ).prefetch_related(
+            models.Prefetch(
+                "tags",
+                queryset=Tag.objects.order_by("name")[:limit],
+                to_attr="visible_tags",
+            )
+        )
+
 
 class QuestionManager(models.Manager):
     def get_queryset(self):
@@ -80,6 +166,10 @@ class Question(models.Model):
         (STATUS_APPROVED, "Approved"),
         (STATUS_DENIED, "Denied"),
     ]
+    # Tag filter modes of QuestionQuerySet.tagged()
+    TAG_MODE_ALL = "all"
+    TAG_MODE_ANY = "any"
+    TAG_MODES = (TAG_MODE_ALL, TAG_MODE_ANY)
 
     owner = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="questions"
@@ -98,18 +188,59 @@ class Question(models.Model):
     # Postgres full-text search vector (title + body)
     search_vector = SearchVectorField(null=True, editable=False)
 
+    # Postgres copy of the ids of ``tags``, so tag filters are GIN index
+    # probes instead of joins. Maintained from the tag links on every change
+    # (see questions.signals and QuestionService.refresh_tag_ids); ids of
+    # deleted tags may linger, which no filter can match.
+    tag_ids = IdArrayField(null=True, blank=True, editable=False)
+
     objects = QuestionManager()
 
     class Meta:
         indexes = [
             GinIndex(fields=["search_vector"]),
+            GinIndex(fields=["tag_ids"]),
             models.Index(fields=["status", "is_public"]),
+            # Keyset pagination of the JSON API
+            models.Index(fields=["-created_at", "-id"]),
         ]
         ordering = ["-created_at"]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        """
+        Leave ``tag_ids`` out of updates unless asked for: it is maintained
+        in the database from the tag links, so this instance's copy may be
+        stale.
+        """
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            # Like a plain save(), deferred fields are not written either
+            deferred = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.attname
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred
+                and field.name != "tag_ids"
+            ]
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        question = super().from_db(db, field_names, values)
+        # Whether the question was on the public list when loaded, so a
+        # save can tell when it leaves it (see questions.signals). Unknown
+        # with deferred fields, so assumed.
+        loaded = dict(zip(field_names, values))
+        question.was_visible_publicly = (
+            loaded.get("is_public", True)
+            and loaded.get("status", cls.STATUS_APPROVED)
+            == cls.STATUS_APPROVED
+        )
+        return question
+
     @property
     def is_visible_publicly(self):
         """Business rule: visible publicly only if approved and
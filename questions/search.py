@@ -0,0 +1,297 @@
+"""
+Search helpers for the question lists.
+
+``attach_snippets`` shows why each question of a result page matched: the
+title, the body and (on the personal list) the user's best matching answer,
+with the search terms highlighted. On PostgreSQL the snippets come from
+``ts_headline``, which re-parses every document it is given, so it runs in
+one query over the ids of the current page only - never over the full
+result set. Other databases (SQLite in tests) get a plain substring
+highlight of the already loaded title and body, without a query.
+
+``result_ids`` caches the ordered ids of a search's results, so paging
+through them, or repeating a popular public search, does not re-run the
+search: pages are sliced from the list (see
+``config.concurrent_queries.paginate_ids_concurrently``). Lists are cached
+briefly, per scope (a user's own list, or the public one) and normalized
+filters, under a version of the scope that ``invalidate_results`` bumps on
+writes. Only one worker stores a missing list; the others compute it for
+their own request meanwhile rather than wait for it.
+"""
+
+import hashlib
+import json
+import re
+import time
+from functools import partial
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+)
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Concat
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+from answers.models import Answer
+
+from .models import Question
+
+# ts_headline wraps matches in these; the text is HTML-escaped before they
+# are turned into <mark> tags, so user content is never marked safe as is
+START_SEL = "\x02"
+STOP_SEL = "\x03"
+
+HEADLINE_OPTIONS = {
+    "start_sel": START_SEL,
+    "stop_sel": STOP_SEL,
+    "min_words": 8,
+    "max_words": 25,
+    "max_fragments": 2,
+    # Quoted, so ts_headline keeps the surrounding spaces
+    "fragment_delimiter": '" … "',
+}
+
+# Words of context kept around a match by the substring fallback
+FALLBACK_CONTEXT_WORDS = 10
+
+# Writes bump the version of the scopes they affect; the timeout bounds the
+# staleness of changes that do not (e.g. tag renames)
+RESULT_IDS_TIMEOUT = 60
+
+# Larger results are paginated with queries as before, rather than cached
+RESULT_IDS_MAX = 1000
+
+# A worker computing a missing list holds a lock for at most this long
+RESULT_IDS_LOCK_TIMEOUT = 10
+
+PUBLIC_SCOPE = "public"
+
+_VERSION_KEY = "questions:search:version:{}"
+_IDS_KEY = "questions:search:ids:{}:{}:{}"
+
+# Stored instead of a list that is larger than RESULT_IDS_MAX
+_TOO_LARGE = "too-large"
+
+
+class Snippets:
+    """Highlighted HTML of a question's matching title, body and answer."""
+
+    def __init__(self, title=None, body=None, answer=None):
+        self.title = _highlighted(title)
+        self.body = _highlighted(body)
+        self.answer = _highlighted(answer)
+
+
+def _highlighted(headline):
+    """Return the headline as safe HTML, or None when nothing matched."""
+    if not headline or START_SEL not in headline:
+        return None
+    return mark_safe(
+        escape(headline)
+        .replace(START_SEL, "<mark>")
+        .replace(STOP_SEL, "</mark>")
+    )
+
+
+def _headlines(question_ids, search_query, user):
+    """
+    Return {question id: (title, body, answer headline)} for the page -
+    single query. The answer headline is from the user's best ranked
+    matching answer of each question.
+    """
+    search = SearchQuery(search_query, search_type="websearch")
+    headlines = {
+        "title_headline": SearchHeadline(
+            "title", search, **HEADLINE_OPTIONS
+        ),
+        "body_headline": SearchHeadline("body", search, **HEADLINE_OPTIONS),
+    }
+    if user is not None:
+        content = Concat(
+            *(
+                part
+                for field in ("situation", "task", "action", "result", "text")
+                for part in (field, Value(" "))
+            )
+        )
+        best_answer = (
+            Answer.objects.filter(
+                question_id=OuterRef("pk"), user=user, search_vector=search
+            )
+            .order_by(SearchRank("search_vector", search).desc())
+            .annotate(
+                headline=SearchHeadline(content, search, **HEADLINE_OPTIONS)
+            )
+            .values("headline")[:1]
+        )
+        headlines["answer_headline"] = Subquery(best_answer)
+    else:
+        headlines["answer_headline"] = Value(None)
+
+    rows = (
+        Question.objects.filter(pk__in=question_ids)
+        .order_by()
+        .annotate(**headlines)
+        .values_list("pk", *headlines)
+    )
+    return {pk: row for pk, *row in rows}
+
+
+def _substring_headline(text, search_query):
+    """
+    Mark case-insensitive occurrences of the search phrase in ``text``,
+    keeping some words of context around the first one.
+    """
+    pattern = re.compile(re.escape(search_query), re.IGNORECASE)
+    match = pattern.search(text or "")
+    if not match:
+        return None
+    # The first piece after (and last before) the match is the rest of the
+    # word it is in, so each side keeps one more piece than words
+    keep = FALLBACK_CONTEXT_WORDS + 1
+    before = text[: match.start()].split(" ")
+    after = text[match.end():].split(" ")
+    excerpt = (
+        ("… " if len(before) > keep else "")
+        + " ".join(before[-keep:])
+        + match.group()
+        + " ".join(after[:keep])
+        + (" …" if len(after) > keep else "")
+    )
+    return pattern.sub(
+        lambda found: f"{START_SEL}{found.group()}{STOP_SEL}", excerpt
+    )
+
+
+def attach_snippets(questions, search_query, user=None):
+    """
+    Set ``snippets`` (a ``Snippets``) on each of the page's ``questions``.
+    ``user`` adds snippets of their matching answers (PostgreSQL only, like
+    answer search itself).
+    """
+    if not search_query or not questions:
+        return
+
+    if connection.vendor == "postgresql":
+        headlines = _headlines(
+            [question.pk for question in questions], search_query, user
+        )
+        for question in questions:
+            question.snippets = Snippets(*headlines.get(question.pk, ()))
+        return
+
+    for question in questions:
+        question.snippets = Snippets(
+            _substring_headline(question.title, search_query),
+            _substring_headline(question.body, search_query),
+        )
+
+
+def user_scope(user):
+    """Return the result scope of the user's own question list."""
+    return f"user:{user.pk}"
+
+
+def _version(scope):
+    key = _VERSION_KEY.format(scope)
+    version = cache.get(key)
+    if version is None:
+        # Started from the clock, so that a version lost from the cache
+        # never comes back to a number lists were cached under before
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key)
+    return version
+
+
+def _bump_versions(keys):
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # No version: nothing is cached under the scope
+            pass
+
+
+def invalidate_results(user_ids, public=False):
+    """
+    Expire the cached result lists of the users' own lists, and of the
+    public list if ``public``, now and again when the current transaction
+    commits.
+    """
+    scopes = {f"user:{user_id}" for user_id in user_ids}
+    if public:
+        scopes.add(PUBLIC_SCOPE)
+    keys = [_VERSION_KEY.format(scope) for scope in scopes]
+    if keys:
+        _bump_versions(keys)
+        transaction.on_commit(partial(_bump_versions, keys))
+
+
+def _ids_key(scope, filters):
+    """
+    Return the cache key of a result list. ``filters`` are normalized:
+    searches and tag slugs are case-insensitive, tags are a set, and the
+    tag match mode only matters with several tags.
+    """
+    filters = dict(filters)
+    filters["search"] = filters.get("search", "").lower()
+    tags = sorted({tag.lower() for tag in filters.pop("tags", ())})
+    mode = filters.pop("tag_mode", None)
+    filters["tags"] = tags
+    filters["tag_mode"] = mode if len(tags) > 1 else None
+    digest = hashlib.sha256(
+        json.dumps(filters, sort_keys=True).encode()
+    ).hexdigest()
+    return _IDS_KEY.format(scope, _version(scope), digest)
+
+
+def _compute_ids(queryset):
+    ids = list(
+        queryset.prefetch_related(None).values_list("pk", flat=True)[
+            : RESULT_IDS_MAX + 1
+        ]
+    )
+    return _TOO_LARGE if len(ids) > RESULT_IDS_MAX else ids
+
+
+def _single_flight(key, compute):
+    """
+    Return the cached value of ``key``, computing it if missing. Only the
+    worker that gets the lock stores it; the others compute it without
+    waiting, since waiting would hold a thread (and, with the database
+    cache, poll with queries) for about as long as computing.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock = f"{key}:lock"
+    if not cache.add(lock, 1, RESULT_IDS_LOCK_TIMEOUT):
+        return compute()
+
+    try:
+        # Set by the previous holder between our get and add
+        value = cache.get(key)
+        if value is None:
+            value = compute()
+            cache.set(key, value, RESULT_IDS_TIMEOUT)
+    finally:
+        cache.delete(lock)
+    return value
+
+
+def result_ids(scope, filters, queryset):
+    """
+    Return the ordered ids of the (ordered) ``queryset`` of results, from
+    the cache when the same ``filters`` were used in ``scope`` recently.
+    Returns None when there are more than ``RESULT_IDS_MAX`` of them.
+    """
+    ids = _single_flight(
+        _ids_key(scope, filters), partial(_compute_ids, queryset)
+    )
+    return None if ids == _TOO_LARGE else ids
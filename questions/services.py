@@ -0,0 +1,460 @@
+"""
+Set-based write operations on questions and tags.
+
+These run a fixed number of SQL statements however many rows they touch, so
+they are safe to use on selections of any size (admin actions, bulk
+operations).
+"""
+
+from django.contrib.postgres.search import SearchVector
+from django.db import connection, transaction
+from django.db.models import Q, Value
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.text import slugify
+
+from answers.models import Answer
+
+from . import stats
+from .models import Question, QuestionVote, Tag
+
+
+def _in_clause(column, ids):
+    """
+    Return SQL and params matching ``column`` against ``ids``. PostgreSQL
+    gets a single array parameter, so the statement does not grow (or hit
+    the parameter limit) with the number of ids.
+    """
+    if connection.vendor == "postgresql":
+        return f"{column} = ANY(%s)", [list(ids)]
+    return f"{column} IN ({', '.join(['%s'] * len(ids))})", list(ids)
+
+
+def _any_visible_publicly(rows):
+    """Return whether any (owner_id, is_public, status) row is listed."""
+    return any(
+        is_public and status == Question.STATUS_APPROVED
+        for _, is_public, status in rows
+    )
+
+
+class QuestionService:
+    """Write operations on questions."""
+
+    @staticmethod
+    def initial_status(user, is_public):
+        """
+        Return the status of a new question: public questions from regular
+        users wait for moderation, everything else is approved.
+        """
+        if is_public and not user.is_superuser:
+            return Question.STATUS_PENDING
+        return Question.STATUS_APPROVED
+
+    @classmethod
+    @transaction.atomic
+    def create(
+        cls, owner, title, body="", is_public=False, tag_names=(), tag_ids=()
+    ):
+        """
+        Create a question with its final status and search vector in a
+        single INSERT, then link its tags with one bulk INSERT.
+
+        ``tag_names`` are resolved like ``QuestionForm`` does (creating
+        missing personal tags in bulk); ``tag_ids`` are linked as they are.
+        The post_save search vector handler does not run: the vector (and
+        the ``tag_ids`` array) is computed from the inserted values in the
+        INSERT itself.
+        """
+        tag_ids = list(dict.fromkeys(tag_ids))
+        if tag_names:
+            resolved, _ = TagService.resolve_names(owner, tag_names)
+            tag_ids.extend(
+                tag_id
+                for tag_id, _ in resolved.values()
+                if tag_id not in tag_ids
+            )
+
+        question = Question(
+            owner=owner,
+            title=title,
+            body=body,
+            is_public=is_public,
+            status=cls.initial_status(owner, is_public),
+        )
+        if connection.vendor == "postgresql":
+            question.search_vector = SearchVector(
+                Value(title), weight="A"
+            ) + SearchVector(Value(body), weight="B")
+            question.tag_ids = sorted(tag_ids)
+        Question.objects.bulk_create([question])
+        # Leave the vector deferred, so a later save() of the instance
+        # does not write the expression back with stale values
+        del question.search_vector
+
+        if tag_ids:
+            Through = Question.tags.through
+            Through.objects.bulk_create(
+                Through(question_id=question.pk, tag_id=tag_id)
+                for tag_id in tag_ids
+            )
+        stats.invalidate([owner.pk], public=question.is_visible_publicly)
+        return question
+
+    @staticmethod
+    def delete(question_ids):
+        """
+        Delete questions with their votes, answers and tag links.
+
+        Django's deletion collector would load every related row into Python
+        first; this issues one DELETE per table instead, children first.
+        Nothing listens to delete signals for these models; the cached
+        stats of the owners and answer authors are dropped here. Returns
+        the number of deleted questions, answers, votes and tag links.
+        """
+        question_ids = list(question_ids)
+        if not question_ids:
+            return dict.fromkeys(
+                ("questions", "answers", "votes", "tag_links"), 0
+            )
+
+        in_questions, params = _in_clause("question_id", question_ids)
+
+        counts = {}
+        with transaction.atomic(), connection.cursor() as cursor:
+
+            def delete(table, where):
+                cursor.execute(f"DELETE FROM {table} WHERE {where}", params)
+                return cursor.rowcount
+
+            counts["votes"] = delete(
+                QuestionVote._meta.db_table, in_questions
+            )
+            # Authors of the answers lose them from their stats too
+            cursor.execute(
+                f"DELETE FROM {Answer._meta.db_table} "
+                f"WHERE {in_questions} RETURNING user_id",
+                params,
+            )
+            author_ids = [user_id for user_id, in cursor.fetchall()]
+            counts["answers"] = len(author_ids)
+            counts["tag_links"] = delete(
+                Question.tags.through._meta.db_table, in_questions
+            )
+            cursor.execute(
+                f"DELETE FROM {Question._meta.db_table} "
+                f"WHERE {_in_clause('id', question_ids)[0]} "
+                "RETURNING owner_id, is_public, status",
+                params,
+            )
+            deleted = cursor.fetchall()
+        counts["questions"] = len(deleted)
+        stats.invalidate(
+            [*(owner_id for owner_id, _, _ in deleted), *author_ids],
+            public=_any_visible_publicly(deleted),
+        )
+        return counts
+
+    @staticmethod
+    def make_private(question_ids):
+        """
+        Make the public questions among ``question_ids`` private - single
+        UPDATE. Private questions are always approved, as in
+        ``question_create``. Returns the number of questions changed.
+        """
+        question_ids = list(question_ids)
+        if not question_ids:
+            return 0
+        in_questions, params = _in_clause("id", question_ids)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {Question._meta.db_table} "
+                "SET is_public = %s, status = %s, updated_at = %s "
+                f"WHERE {in_questions} AND is_public = %s "
+                "RETURNING owner_id",
+                [
+                    False,
+                    Question.STATUS_APPROVED,
+                    timezone.now(),
+                    *params,
+                    True,
+                ],
+            )
+            owner_ids = [owner_id for owner_id, in cursor.fetchall()]
+        # Only public questions changed; the pending and denied ones among
+        # them were not listed, but are not told apart from approved ones
+        stats.invalidate(owner_ids, public=bool(owner_ids))
+        return len(owner_ids)
+
+    @staticmethod
+    def refresh_tag_ids(question_ids=None, having_tag_ids=None):
+        """
+        Recompute ``Question.tag_ids`` from the tag links with one UPDATE,
+        for the given questions, the questions whose array contains any of
+        ``having_tag_ids``, or all questions. PostgreSQL only: elsewhere tag
+        filters join the links. Returns the number of questions updated.
+        """
+        if connection.vendor != "postgresql":
+            return 0
+        conditions = []
+        params = []
+        if question_ids is not None:
+            question_ids = list(question_ids)
+            if not question_ids:
+                return 0
+            condition, ids = _in_clause("id", question_ids)
+            conditions.append(condition)
+            params.extend(ids)
+        if having_tag_ids is not None:
+            conditions.append("tag_ids && %s::bigint[]")
+            params.append(list(having_tag_ids))
+
+        questions = Question._meta.db_table
+        through = Question.tags.through._meta.db_table
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {questions} SET tag_ids = ARRAY("
+                f"SELECT tag_id FROM {through} "
+                f"WHERE {through}.question_id = {questions}.id "
+                "ORDER BY tag_id)" + where,
+                params,
+            )
+            return cursor.rowcount
+
+    @staticmethod
+    def retag(question_ids, tags, replace=False):
+        """
+        Add tags to questions, or replace their tags, with one set-based
+        INSERT ... SELECT (after a DELETE when replacing). ``tags`` is a
+        mapping returned by ``TagService.resolve_names``. Personal tags are
+        only added to private questions, since public questions use public
+        tags only. Returns the number of tag links added and removed.
+        """
+        question_ids = list(question_ids)
+        if not question_ids:
+            return 0, 0
+
+        questions = Question._meta.db_table
+        through = Question.tags.through._meta.db_table
+        in_questions, params = _in_clause(f"{questions}.id", question_ids)
+        added = removed = 0
+        with transaction.atomic(), connection.cursor() as cursor:
+            if replace:
+                cursor.execute(
+                    f"DELETE FROM {through} WHERE "
+                    + _in_clause("question_id", question_ids)[0],
+                    params,
+                )
+                removed = cursor.rowcount
+
+            tag_ids = [tag_id for tag_id, _ in tags.values()]
+            if tag_ids:
+                in_tags, tag_params = _in_clause("tags.id", tag_ids)
+                cursor.execute(
+                    f"""
+                    INSERT INTO {through} (question_id, tag_id)
+                    SELECT {questions}.id, tags.id
+                    FROM {questions} CROSS JOIN {Tag._meta.db_table} AS tags
+                    WHERE {in_tags} AND {in_questions}
+                    AND (tags.is_public = %s OR {questions}.is_public = %s)
+                    AND NOT EXISTS (
+                        SELECT 1 FROM {through} AS existing
+                        WHERE existing.question_id = {questions}.id
+                        AND existing.tag_id = tags.id
+                    )
+                    """,
+                    [*tag_params, *params, True, False],
+                )
+                added = cursor.rowcount
+
+            cursor.execute(
+                "SELECT DISTINCT owner_id, is_public, status "
+                f"FROM {questions} WHERE {in_questions}",
+                params,
+            )
+            owners = cursor.fetchall()
+            stats.invalidate(
+                [owner_id for owner_id, _, _ in owners],
+                public=_any_visible_publicly(owners),
+            )
+        QuestionService.refresh_tag_ids(question_ids)
+        return added, removed
+
+
+class TagService:
+    """Resolve, promote and merge tags, rewriting question links in bulk."""
+
+    @staticmethod
+    def resolve_names(user, names, resolved=None, create=True):
+        """
+        Find or create the tags for ``names`` with the same priority as
+        ``QuestionForm``: a public tag, then the user's personal tag
+        (matched case-insensitively), else a new personal tag. Missing tags
+        are created with one bulk INSERT.
+
+        Returns ``{lower-cased name: (tag id, is_public)}`` and the number
+        of tags created (tags another request created first are not
+        counted). Pass ``resolved`` to reuse (and extend) the mapping of an
+        earlier call; names already in it are not looked up again. With
+        ``create=False``, missing tags are left out instead of created.
+        """
+        resolved = {} if resolved is None else resolved
+        missing = {}
+        for name in names:
+            missing.setdefault(name.lower(), name)
+        missing = {
+            lower_name: name
+            for lower_name, name in missing.items()
+            if lower_name not in resolved
+        }
+        if not missing:
+            return resolved, 0
+
+        created_at = {}
+
+        def lookup():
+            rows = (
+                Tag.objects.annotate(lower_name=Lower("name"))
+                .filter(lower_name__in=missing)
+                .filter(Q(is_public=True) | Q(owner=user, is_public=False))
+                .values_list("lower_name", "id", "is_public", "created_at")
+            )
+            # Public tags win over personal tags of the same name
+            for lower_name, tag_id, is_public, created in sorted(
+                rows, key=lambda row: row[2]
+            ):
+                resolved[lower_name] = (tag_id, is_public)
+                created_at[lower_name] = created
+
+        lookup()
+        if not create:
+            return resolved, 0
+        now = timezone.now()
+        to_create = {
+            lower_name: Tag(
+                name=name, slug=slugify(name), owner=user, created_at=now
+            )
+            for lower_name, name in missing.items()
+            if lower_name not in resolved
+        }
+        if not to_create:
+            return resolved, 0
+        # Conflicts are tags created concurrently; lookup() finds them,
+        # and tells them from ours by their creation time
+        Tag.objects.bulk_create(to_create.values(), ignore_conflicts=True)
+        lookup()
+        created = sum(created_at.get(name) == now for name in to_create)
+        return resolved, created
+
+    @classmethod
+    @transaction.atomic
+    def promote_to_public(cls, tags):
+        """
+        Make the given personal tags public. Tags named like an existing
+        public tag (case-insensitively), or like another selected tag, are
+        merged into it instead. Returns ``(promoted, merged)`` counts.
+        """
+        tags = list(tags.filter(is_public=False).order_by("pk"))
+        names = {tag.name.lower() for tag in tags}
+        targets = dict(
+            Tag.objects.annotate(lower_name=Lower("name"))
+            .filter(is_public=True, lower_name__in=names)
+            .order_by("-pk")
+            .values_list("lower_name", "pk")
+        )
+
+        promoted = []
+        merges = {}
+        for tag in tags:
+            target = targets.setdefault(tag.name.lower(), tag.pk)
+            if target == tag.pk:
+                promoted.append(tag.pk)
+            else:
+                merges[tag.pk] = target
+
+        Tag.objects.filter(pk__in=promoted).update(is_public=True, owner=None)
+        cls._merge(merges)
+        return len(promoted), len(merges)
+
+    @classmethod
+    @transaction.atomic
+    def merge_duplicates(cls, tags):
+        """
+        Merge tags with the same name (case-insensitively) into one. A
+        public tag absorbs all its duplicates; personal tags are only merged
+        with the same owner's. The oldest tag of each group is kept.
+        Returns the number of tags merged away.
+        """
+        tags = list(tags.order_by("pk"))
+        public = {
+            tag.name.lower(): tag.pk for tag in reversed(tags) if tag.is_public
+        }
+
+        targets = {}
+        merges = {}
+        for tag in tags:
+            name = tag.name.lower()
+            target = public.get(name) or targets.setdefault(
+                (name, tag.owner_id), tag.pk
+            )
+            if target != tag.pk:
+                merges[tag.pk] = target
+
+        cls._merge(merges)
+        return len(merges)
+
+    @staticmethod
+    def _merge(merges):
+        """
+        Move the question links of each source tag in ``merges`` (source id
+        -> target id) to its target and delete the sources. Links that would
+        duplicate an existing one are dropped first.
+        """
+        if not merges:
+            return
+
+        through = Question.tags.through._meta.db_table
+        mapping = ", ".join(["(%s, %s)"] * len(merges))
+        params = [value for pair in merges.items() for value in pair]
+        with connection.cursor() as cursor:
+            # A question keeps a single link per target: drop source links
+            # whose question already has the target, or an earlier link
+            # from another source merging into the same target
+            cursor.execute(
+                f"""
+                WITH tag_merge (source_id, target_id) AS (VALUES {mapping})
+                DELETE FROM {through}
+                WHERE tag_id IN (SELECT source_id FROM tag_merge)
+                AND EXISTS (
+                    SELECT 1
+                    FROM tag_merge
+                    JOIN {through} AS other
+                        ON other.question_id = {through}.question_id
+                    LEFT JOIN tag_merge AS other_merge
+                        ON other_merge.source_id = other.tag_id
+                    WHERE tag_merge.source_id = {through}.tag_id
+                    AND (
+                        other.tag_id = tag_merge.target_id
+                        OR (
+                            other_merge.target_id = tag_merge.target_id
+                            AND other.id < {through}.id
+                        )
+                    )
+                )
+                """,
+                params,
+            )
+            cursor.execute(
+                f"""
+                WITH tag_merge (source_id, target_id) AS (VALUES {mapping})
+                UPDATE {through}
+                SET tag_id = tag_merge.target_id
+                FROM tag_merge
+                WHERE {through}.tag_id = tag_merge.source_id
+                """,
+                params,
+            )
+        # The arrays of the affected questions still hold the source ids
+        QuestionService.refresh_tag_ids(having_tag_ids=list(merges))
+        Tag.objects.filter(pk__in=merges).delete()
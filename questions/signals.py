@@ -2,11 +2,12 @@
 Signal handlers for the questions app.
 """
 
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from django.contrib.postgres.search import SearchVector
 from django.db import connection
-from .models import Question
+from . import stats
+from .models import Question, QuestionVote
 
 
 @receiver(post_save, sender=Question)
@@ -22,3 +23,77 @@ def update_question_search_vector(sender, instance, **kwargs):
             search_vector=SearchVector("title", weight="A")
             + SearchVector("body", weight="B")
         )
+
+
+@receiver(m2m_changed, sender=Question.tags.through)
+def update_question_tag_ids(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    """Keep ``Question.tag_ids`` in sync with the question's tag links."""
+    # Skip if not using Postgres
+    if connection.vendor != "postgresql":
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    # Imported here: the services module imports the answers models
+    from .services import QuestionService
+
+    if not reverse:
+        QuestionService.refresh_tag_ids([instance.pk])
+    elif pk_set is not None:
+        # tag.questions.add()/remove(): pk_set holds question ids
+        QuestionService.refresh_tag_ids(pk_set)
+    else:
+        # tag.questions.clear(): the arrays still hold the tag's id
+        QuestionService.refresh_tag_ids(having_tag_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def invalidate_question_stats(sender, instance, **kwargs):
+    """
+    Drop the owner's cached stats when a question changes, and the public
+    search results if it is, or was, on the public list.
+    """
+    stats.invalidate(
+        [instance.owner_id],
+        public=instance.is_visible_publicly
+        or getattr(instance, "was_visible_publicly", False),
+    )
+    instance.was_visible_publicly = instance.is_visible_publicly
+
+
+@receiver(m2m_changed, sender=Question.tags.through)
+def invalidate_tag_stats(sender, instance, action, reverse, pk_set, **kwargs):
+    """Drop the owners' cached stats (most used tags) on tag link changes."""
+    if action not in ("post_add", "post_remove"):
+        # post_clear is followed by post_add when tags are replaced with
+        # set(); a bare clear() is left to the cache timeout
+        return
+    if not reverse:
+        stats.invalidate(
+            [instance.owner_id], public=instance.is_visible_publicly
+        )
+    elif pk_set:
+        owners = list(
+            Question.objects.filter(pk__in=pk_set).values_list(
+                "owner_id", "is_public", "status"
+            )
+        )
+        stats.invalidate(
+            [owner_id for owner_id, _, _ in owners],
+            public=(True, Question.STATUS_APPROVED)
+            in {(is_public, status) for _, is_public, status in owners},
+        )
+
+
+@receiver(post_save, sender=QuestionVote)
+@receiver(post_delete, sender=QuestionVote)
+def invalidate_vote_stats(sender, instance, **kwargs):
+    """Drop the question owner's cached stats (ratings) on vote changes."""
+    stats.invalidate(
+        Question.objects.filter(pk=instance.question_id).values_list(
+            "owner_id", flat=True
+        )
+    )
@@ -0,0 +1,180 @@
+"""
+Per-user statistics: the stats panel of the question list
+(``question_stats``) and the profile dashboard (``profile_stats``).
+
+Each is computed with a fixed number of aggregate queries, whatever the
+amount of data, and cached per user. Writes that can change them call
+``invalidate``: the post_save/post_delete/m2m_changed handlers for
+model-level writes, and the set-based paths (``QuestionService``, imports,
+admin actions) directly, since those send no signals. The same writes
+can change search results, so ``invalidate`` also expires the cached
+result lists (``questions.search.invalidate_results``): those of the
+users' own lists, and those of the public list when told it changed.
+"""
+
+from datetime import datetime, time, timedelta
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Avg, Count, Exists, OuterRef, Q
+from django.db.models.functions import TruncWeek
+from django.utils import timezone
+
+from answers.models import Answer
+from config.concurrent_queries import fetch_concurrently
+
+from .models import Question, QuestionVote
+from .search import invalidate_results
+
+# Invalidation keeps the figures current; the timeout only bounds how long
+# stats of inactive users occupy the cache
+STATS_CACHE_TIMEOUT = 60 * 60
+
+# Weeks of the answers-per-week chart on the profile, current week included
+PROFILE_WEEKS = 8
+
+# Tags listed as most used on the profile
+PROFILE_TOP_TAGS = 5
+
+_QUESTIONS_KEY = "questions:stats:{}"
+_PROFILE_KEY = "questions:profile:{}"
+
+
+def _cached(key, compute, user):
+    key = key.format(user.pk)
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute(user)
+        cache.set(key, stats, STATS_CACHE_TIMEOUT)
+    return stats
+
+
+def _compute_question_stats(user):
+    public = Q(is_public=True)
+    stats = Question.objects.filter(owner=user).aggregate(
+        # Totals of the list page's view modes
+        all=Count("pk"),
+        personal=Count("pk", filter=~public),
+        public=Count("pk", filter=public),
+        # Moderation status of the public ones; private questions are
+        # always approved
+        pending=Count(
+            "pk", filter=public & Q(status=Question.STATUS_PENDING)
+        ),
+        approved=Count(
+            "pk", filter=public & Q(status=Question.STATUS_APPROVED)
+        ),
+        denied=Count("pk", filter=public & Q(status=Question.STATUS_DENIED)),
+        answered=Count(
+            "pk",
+            filter=Q(
+                Exists(Answer.objects.filter(question_id=OuterRef("pk")))
+            ),
+        ),
+    )
+    stats["unanswered"] = stats["all"] - stats["answered"]
+    return stats
+
+
+def question_stats(user):
+    """
+    Return the user's question counts: ``all``, ``personal`` and
+    ``public`` (the view modes), ``pending``, ``approved`` and ``denied``
+    (public questions by status), ``answered`` and ``unanswered``.
+    """
+    return _cached(_QUESTIONS_KEY, _compute_question_stats, user)
+
+
+def _week_start(moment):
+    """Return the Monday of the week of a datetime or date."""
+    if hasattr(moment, "hour"):
+        moment = timezone.localtime(moment).date()
+    return moment - timedelta(days=moment.weekday())
+
+
+def _compute_profile_stats(user):
+    first_week = _week_start(timezone.now()) - timedelta(
+        weeks=PROFILE_WEEKS - 1
+    )
+    answers = Answer.objects.filter(user=user)
+    # Four independent aggregates, run concurrently
+    results = fetch_concurrently(
+        answers=lambda: answers.aggregate(
+            total=Count("pk"),
+            star=Count("pk", filter=Q(answer_type=Answer.ANSWER_TYPE_STAR)),
+            basic=Count(
+                "pk", filter=Q(answer_type=Answer.ANSWER_TYPE_BASIC)
+            ),
+        ),
+        weeks=answers.filter(
+            created_at__gte=timezone.make_aware(
+                datetime.combine(first_week, time.min)
+            )
+        )
+        .annotate(week=TruncWeek("created_at"))
+        .order_by()
+        .values("week")
+        .annotate(count=Count("pk"))
+        .values_list("week", "count"),
+        tags=Question.tags.through.objects.filter(question__owner=user)
+        .values("tag__name")
+        .annotate(count=Count("pk"))
+        .order_by("-count", "tag__name")
+        .values_list("tag__name", "count")[:PROFILE_TOP_TAGS],
+        votes=lambda: QuestionVote.objects.filter(
+            question__owner=user
+        ).aggregate(count=Count("pk"), average=Avg("rating")),
+    )
+
+    per_week = {
+        _week_start(week): count for week, count in results["weeks"]
+    }
+    weeks = (
+        first_week + timedelta(weeks=offset)
+        for offset in range(PROFILE_WEEKS)
+    )
+    return {
+        "answers_total": results["answers"]["total"],
+        "answers_star": results["answers"]["star"],
+        "answers_basic": results["answers"]["basic"],
+        "answers_per_week": [(week, per_week.get(week, 0)) for week in weeks],
+        "top_tags": results["tags"],
+        "votes_received": results["votes"]["count"],
+        "average_rating": results["votes"]["average"],
+    }
+
+
+def profile_stats(user):
+    """
+    Return the figures of the user's profile dashboard:
+
+    - ``answers_total``, ``answers_star`` and ``answers_basic``
+    - ``answers_per_week``: (week start, count) for the last
+      ``PROFILE_WEEKS`` weeks, oldest first
+    - ``top_tags``: (name, question count) of the user's most used tags
+    - ``votes_received`` and ``average_rating`` (None without votes) of the
+      user's questions
+
+    The question totals are in ``question_stats``.
+    """
+    return _cached(_PROFILE_KEY, _compute_profile_stats, user)
+
+
+def invalidate(user_ids, public=False):
+    """
+    Drop the cached stats of the given users, now and again when the
+    current transaction commits, so figures read in between are not kept.
+    Also expires the cached search results of their lists, and of the
+    public list if ``public`` (a question on it, or its tags, changed).
+    """
+    user_ids = set(user_ids)
+    keys = [
+        key.format(user_id)
+        for user_id in user_ids
+        for key in (_QUESTIONS_KEY, _PROFILE_KEY)
+    ]
+    if keys:
+        cache.delete_many(keys)
+        transaction.on_commit(partial(cache.delete_many, keys))
+    invalidate_results(user_ids, public=public)
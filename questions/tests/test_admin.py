@@ -0,0 +1,161 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from questions.models import Question, Tag
+from questions.stats import question_stats
+
+CHANGELISTS = (
+    "admin:questions_question_changelist",
+    "admin:questions_tag_changelist",
+    "admin:questions_questionvote_changelist",
+    "admin:answers_answer_changelist",
+    "admin:answers_staranswer_changelist",
+    "admin:answers_basicanswer_changelist",
+)
+
+
+@pytest.mark.django_db
+class TestAdminChangelists:
+    @pytest.mark.parametrize("url_name", CHANGELISTS)
+    def test_query_count_does_not_grow_with_rows(
+        self,
+        client,
+        django_assert_max_num_queries,
+        seed_question_data,
+        url_name,
+    ):
+        def count_queries(data):
+            client.force_login(data.user)
+            with django_assert_max_num_queries(100) as captured:
+                response = client.get(reverse(url_name), {"q": "situation"})
+            assert response.status_code == 200
+            return len(captured)
+
+        assert count_queries(seed_question_data(1)) == count_queries(
+            seed_question_data(20)
+        )
+
+    def test_filters_by_public_tag(self, admin_client, seed_question_data):
+        data = seed_question_data(2)
+
+        response = admin_client.get(
+            reverse("admin:questions_question_changelist"),
+            {"tag": data.public_tag.slug},
+        )
+
+        assert response.status_code == 200
+        results = set(response.context["cl"].result_list)
+        assert data.public_question in results
+        assert results == set(data.public_tag.questions.all())
+
+    def test_tags_use_autocomplete(self, admin_client, seed_question_data):
+        data = seed_question_data(1)
+
+        response = admin_client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "questions",
+                "model_name": "question",
+                "field_name": "tags",
+                "term": data.tag.name[:3],
+            },
+        )
+
+        assert response.status_code == 200
+        assert str(data.tag.pk) in [
+            result["id"] for result in response.json()["results"]
+        ]
+
+
+@pytest.mark.django_db
+class TestAdminActions:
+    def _run_action(self, client, url_name, action, objects, filters=""):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(
+                reverse(url_name) + filters,
+                {
+                    "action": action,
+                    "_selected_action": [obj.pk for obj in objects],
+                },
+            )
+        assert response.status_code == 302
+        return [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith(("UPDATE", "DELETE", "INSERT"))
+        ]
+
+    @pytest.mark.parametrize(
+        "action,expected",
+        [
+            ("approve_questions", (True, Question.STATUS_APPROVED)),
+            ("deny_questions", (True, Question.STATUS_DENIED)),
+            ("make_private", (False, Question.STATUS_APPROVED)),
+        ],
+    )
+    def test_moderation_actions_are_one_update(
+        self, admin_client, user, action, expected
+    ):
+        questions = Question.objects.bulk_create(
+            Question(owner=user, title=f"Q{i}", is_public=True)
+            for i in range(5)
+        )
+        writes = self._run_action(
+            admin_client,
+            "admin:questions_question_changelist",
+            action,
+            questions,
+        )
+
+        # A single UPDATE, whatever the size of the selection
+        assert len([sql for sql in writes if "questions_question" in sql]) == 1
+        assert set(
+            Question.objects.values_list("is_public", "status")
+        ) == {expected}
+
+    @pytest.mark.parametrize(
+        "action,filters,stat",
+        [
+            ("approve_questions", "?status__exact=PENDING", "approved"),
+            ("deny_questions", "?status__exact=PENDING", "denied"),
+            ("make_private", "?is_public__exact=1", "personal"),
+        ],
+    )
+    def test_filtered_actions_invalidate_owner_stats(
+        self, admin_client, user, action, filters, stat
+    ):
+        question = Question.objects.create(
+            owner=user, title="Q", is_public=True
+        )
+        assert question_stats(user)["pending"] == 1
+
+        # The updated question no longer matches the changelist filter
+        self._run_action(
+            admin_client,
+            "admin:questions_question_changelist",
+            action,
+            [question],
+            filters,
+        )
+
+        assert question_stats(user)["pending"] == 0
+        assert question_stats(user)[stat] == 1
+
+    def test_merge_duplicates_action(self, admin_client, user):
+        tags = [
+            Tag.objects.create(name=name, slug="python", owner=user)
+            for name in ("Python", "python")
+        ]
+        question = Question.objects.create(owner=user, title="Q")
+        question.tags.add(*tags)
+
+        self._run_action(
+            admin_client,
+            "admin:questions_tag_changelist",
+            "merge_duplicates",
+            tags,
+        )
+
+        assert list(question.tags.all()) == [tags[0]]
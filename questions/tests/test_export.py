@@ -0,0 +1,126 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from answers.models import BasicAnswer, StarAnswer
+from questions.export import CSV_COLUMNS, iter_export
+from questions.models import Question, Tag
+
+
+@pytest.fixture
+def collection(user, other_user):
+    tag = Tag.objects.create(name="Teamwork", slug="teamwork", owner=user)
+    star_question = Question.objects.create(owner=user, title="Conflict")
+    star_question.tags.add(tag)
+    StarAnswer.objects.create(
+        question=star_question,
+        user=user,
+        situation="S",
+        task="T",
+        action="A",
+        result="R",
+    )
+    basic_question = Question.objects.create(owner=user, title="Why us?")
+    BasicAnswer.objects.create(
+        question=basic_question, user=user, text="Because"
+    )
+    Question.objects.create(owner=user, title="Unanswered")
+    Question.objects.create(owner=other_user, title="Not mine")
+    return star_question, basic_question
+
+
+def _ndjson(data):
+    return [json.loads(line) for line in data.decode().splitlines()]
+
+
+@pytest.mark.django_db
+class TestIterExport:
+    def test_ndjson_has_one_line_per_owned_question(self, user, collection):
+        records = _ndjson(b"".join(iter_export(user)))
+
+        assert [record["title"] for record in records] == [
+            "Conflict",
+            "Why us?",
+            "Unanswered",
+        ]
+        star, basic, unanswered = records
+        assert star["tags"] == ["Teamwork"]
+        assert star["answers"][0]["situation"] == "S"
+        assert star["answers"][0]["answer_type"] == "STAR"
+        assert basic["answers"][0]["text"] == "Because"
+        assert unanswered["answers"] == []
+
+    def test_csv_has_one_row_per_answer(self, user, collection):
+        data = b"".join(iter_export(user, "csv")).decode()
+
+        rows = list(csv.DictReader(io.StringIO(data)))
+        assert tuple(rows[0]) == CSV_COLUMNS
+        assert [(row["title"], row["answer_type"]) for row in rows] == [
+            ("Conflict", "STAR"),
+            ("Why us?", "BASIC"),
+            ("Unanswered", ""),
+        ]
+        assert rows[0]["tags"] == "Teamwork"
+        assert rows[1]["text"] == "Because"
+
+    def test_gzip_output_decompresses_to_plain_output(
+        self, user, collection
+    ):
+        plain = b"".join(iter_export(user))
+        compressed = b"".join(iter_export(user, compress=True))
+
+        assert gzip.decompress(compressed) == plain
+
+    def test_queries_grow_with_chunks_not_rows(self, user):
+        Question.objects.bulk_create(
+            Question(owner=user, title=f"Question {i}") for i in range(10)
+        )
+
+        with CaptureQueriesContext(connection) as small_chunks:
+            blocks = list(iter_export(user, chunk_size=5))
+        with CaptureQueriesContext(connection) as one_chunk:
+            list(iter_export(user, chunk_size=10))
+
+        # One block per chunk; tags and answers are prefetched per chunk
+        assert len(blocks) == 2
+        assert len(small_chunks) == len(one_chunk) + 2
+
+    def test_unknown_format_raises(self, user):
+        with pytest.raises(ValueError):
+            iter_export(user, "xml")
+
+
+@pytest.mark.django_db
+class TestExportQuestionsCommand:
+    def test_writes_to_stdout(self, user, collection):
+        out = io.StringIO()
+
+        call_command("export_questions", user.username, stdout=out)
+
+        assert len(_ndjson(out.getvalue().encode())) == 3
+
+    def test_writes_gzip_file(self, user, collection, tmp_path):
+        path = tmp_path / "export.csv.gz"
+
+        call_command(
+            "export_questions",
+            user.username,
+            format="csv",
+            gzip=True,
+            output=str(path),
+            stderr=io.StringIO(),
+        )
+
+        rows = gzip.decompress(path.read_bytes()).decode().splitlines()
+        assert len(rows) == 4  # header + 3 questions
+
+    def test_unknown_user_is_an_error(self, db):
+        with pytest.raises(CommandError):
+            call_command("export_questions", "nobody")
@@ -144,6 +144,127 @@ class TestQuestionListFilterSearch:
         # Tag slug is lowercase in URLs
         assert "tag=leadership" in response.content.decode().lower()
 
+    @pytest.fixture
+    def both_tagged(self, user, tags, questions):
+        """A question with both tags, next to one question per tag."""
+        question = Question.objects.create(owner=user, title="Both tags")
+        question.tags.add(tags["public"], tags["private"])
+        return question
+
+    def test_multiple_tags_match_all_by_default(
+        self, client, user, questions, both_tagged
+    ):
+        client.force_login(user)
+        response = client.get(
+            reverse("questions:list"), {"tag": ["leadership", "MyTag"]}
+        )
+
+        assert list(response.context["questions"]) == [both_tagged]
+        assert response.context["selected_tags"] == ["leadership", "mytag"]
+        assert response.context["selected_tag_name"] == "Leadership, MyTag"
+        assert response.context["tag_mode"] == "all"
+
+    def test_mode_any_matches_any_tag(
+        self, client, user, questions, both_tagged
+    ):
+        client.force_login(user)
+        response = client.get(
+            reverse("questions:list"),
+            {"tag": ["leadership", "mytag"], "mode": "any"},
+        )
+
+        assert set(response.context["questions"]) == {
+            questions[0],
+            questions[1],
+            both_tagged,
+        }
+        assert response.context["tag_params"] == (
+            "tag=leadership&tag=mytag&mode=any"
+        )
+
+    def test_unknown_mode_falls_back_to_all(
+        self, client, user, questions, both_tagged
+    ):
+        client.force_login(user)
+        response = client.get(
+            reverse("questions:list"),
+            {"tag": ["leadership", "mytag"], "mode": "some"},
+        )
+
+        assert list(response.context["questions"]) == [both_tagged]
+        assert response.context["tag_mode"] == "all"
+
+    def test_pagination_preserves_multiple_tags(self, client, user, tags):
+        client.force_login(user)
+        for i in range(15):
+            question = Question.objects.create(owner=user, title=f"Q {i}")
+            question.tags.add(tags["public"], tags["private"])
+
+        response = client.get(
+            reverse("questions:list"),
+            {"tag": ["leadership", "mytag"], "mode": "any"},
+        )
+
+        assert (
+            "tag=leadership&amp;tag=mytag&amp;mode=any&sort="
+            in response.content.decode()
+        )
+
+    def test_tag_facets_count_questions_in_the_current_context(
+        self, client, user, questions, tags
+    ):
+        empty = Tag.objects.create(name="Empty", slug="empty", owner=user)
+        client.force_login(user)
+        response = client.get(
+            reverse("questions:list"),
+            {"search": "question about", "tag": "empty"},
+        )
+
+        counts = {
+            tag.slug: tag.question_count
+            for tag in response.context["available_tags"]
+        }
+        # The tag filter itself does not narrow the counts; the selected tag
+        # is listed even without questions
+        assert counts == {"leadership": 1, "mytag": 1, empty.slug: 0}
+
+    def test_tag_facets_hide_tags_without_questions(
+        self, client, user, questions
+    ):
+        client.force_login(user)
+        response = client.get(
+            reverse("questions:list"), {"search": "leadership"}
+        )
+
+        assert [tag.slug for tag in response.context["available_tags"]] == [
+            "leadership"
+        ]
+        assert "Leadership (public) &middot; 1" in response.content.decode()
+
+    def test_tag_facets_are_one_query(
+        self, client, user, tags, django_assert_max_num_queries
+    ):
+        for tag in tags.values():
+            for i in range(3):
+                question = Question.objects.create(owner=user, title=f"Q {i}")
+                question.tags.add(tag)
+        client.force_login(user)
+
+        def queries():
+            with django_assert_max_num_queries(50) as captured:
+                client.get(reverse("questions:list"))
+            return len(captured)
+
+        before = queries()
+        for i in range(5):
+            tag = Tag.objects.create(
+                name=f"Extra {i}", slug=f"extra-{i}", is_public=True
+            )
+            tag.questions.add(
+                Question.objects.create(owner=user, title=f"Extra {i}")
+            )
+        assert queries() == before
+
     def test_no_results_shows_zero_message(self, client, user):
         """
         Test that when search/filter returns no results, it shows
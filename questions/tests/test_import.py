@@ -0,0 +1,179 @@
+import gzip
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from answers.models import BasicAnswer, StarAnswer
+from questions.export import iter_export
+from questions.imports import detect_format, import_questions
+from questions.models import Question, Tag
+
+
+def _ndjson(*records):
+    return io.BytesIO(
+        "".join(f"{json.dumps(record)}\n" for record in records).encode()
+    )
+
+
+STAR = {
+    "answer_type": "STAR",
+    "situation": "S",
+    "task": "T",
+    "action": "A",
+    "result": "R",
+}
+
+
+@pytest.mark.django_db
+class TestImportQuestions:
+    def test_imports_questions_tags_and_answers(self, user):
+        file = _ndjson(
+            {
+                "title": "Conflict",
+                "tags": ["Teamwork", "teamwork", "Leadership"],
+                "answers": [STAR, {"answer_type": "BASIC", "text": "B"}],
+            },
+            {"title": "Private", "body": "Context"},
+        )
+
+        report = import_questions(user, file)
+
+        assert (report.rows, report.questions, report.answers) == (2, 2, 2)
+        assert report.error_count == 0
+        question = Question.objects.get(title="Conflict")
+        assert question.owner == user
+        assert question.status == Question.STATUS_APPROVED
+        assert sorted(question.tags.values_list("name", flat=True)) == [
+            "Leadership",
+            "Teamwork",
+        ]
+        assert StarAnswer.objects.get(question=question).result == "R"
+        assert BasicAnswer.objects.get(question=question).text == "B"
+
+    def test_reuses_public_then_personal_tags(self, user):
+        public = Tag.objects.create(
+            name="Amazon", slug="amazon", is_public=True
+        )
+        personal = Tag.objects.create(name="Mine", slug="mine", owner=user)
+
+        report = import_questions(
+            user,
+            _ndjson({"title": "Q", "tags": ["amazon", "MINE", "New"]}),
+        )
+
+        tags = set(Question.objects.get(title="Q").tags.all())
+        assert {public, personal} < tags
+        assert report.tags_created == 1
+        assert Tag.objects.get(name="New").owner == user
+
+    def test_public_questions_need_moderation(self, user):
+        import_questions(user, _ndjson({"title": "Q", "is_public": True}))
+
+        assert Question.objects.get().status == Question.STATUS_PENDING
+
+    def test_invalid_rows_are_reported_and_skipped(self, user):
+        file = io.BytesIO(
+            b'{"title": "Good"}\n'
+            b"not json\n"
+            b'{"title": ""}\n'
+            b'{"title": "Bad answer", "answers": [{"answer_type": "X"}]}\n'
+            b'{"title": "Missing STAR part", "answers": '
+            b'[{"answer_type": "STAR", "situation": "S"}]}\n'
+        )
+
+        report = import_questions(user, file)
+
+        assert list(Question.objects.values_list("title", flat=True)) == [
+            "Good"
+        ]
+        assert [line for line, _ in report.errors] == [2, 3, 4, 5]
+        assert report.errors[1][1].startswith("title:")
+        assert "answer_type" in report.errors[2][1]
+        assert "task" in report.errors[3][1]
+
+    def test_truncated_gzip_is_reported(self, user):
+        data = gzip.compress(
+            b"".join(b'{"title": "Q%d"}\n' % i for i in range(1000))
+        )
+
+        report = import_questions(
+            user, io.BytesIO(data[: len(data) // 2]), compressed=True
+        )
+
+        assert report.errors[-1][1].startswith("Could not read file:")
+
+    def test_round_trips_an_export(self, user, other_user):
+        question = Question.objects.create(owner=user, title="Conflict")
+        question.tags.add(Tag.objects.create(name="Teamwork", owner=user))
+        StarAnswer.objects.create(question=question, user=user, **{
+            key: value for key, value in STAR.items() if key != "answer_type"
+        })
+        Question.objects.create(owner=user, title="Unanswered")
+        exported = b"".join(iter_export(user, "csv", compress=True))
+
+        report = import_questions(
+            other_user, io.BytesIO(exported), "csv", compressed=True
+        )
+
+        assert (report.questions, report.answers) == (2, 1)
+        copy = Question.objects.get(owner=other_user, title="Conflict")
+        assert list(copy.tags.values_list("name", flat=True)) == ["Teamwork"]
+        assert StarAnswer.objects.get(question=copy).situation == "S"
+
+    def test_queries_grow_with_batches_not_rows(self, user):
+        def queries(count, batch_size):
+            records = [
+                {"title": f"Q{i}", "tags": [f"tag {i}"], "answers": [STAR]}
+                for i in range(count)
+            ]
+            with CaptureQueriesContext(connection) as captured:
+                import_questions(
+                    user, _ndjson(*records), batch_size=batch_size
+                )
+            return len(captured)
+
+        assert queries(10, batch_size=10) == queries(30, batch_size=30)
+
+
+class TestDetectFormat:
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("bank.ndjson", ("ndjson", False)),
+            ("bank.JSONL", ("ndjson", False)),
+            ("bank.csv.gz", ("csv", True)),
+        ],
+    )
+    def test_detects_format_and_compression(self, name, expected):
+        assert detect_format(name) == expected
+
+    def test_unknown_extension(self):
+        with pytest.raises(ValueError):
+            detect_format("bank.xlsx")
+
+
+@pytest.mark.django_db
+class TestImportQuestionsCommand:
+    def test_imports_file_and_reports_rate(self, user, tmp_path):
+        path = tmp_path / "bank.ndjson.gz"
+        path.write_bytes(gzip.compress(b'{"title": "Q"}\n\n[]\n'))
+        out, err = io.StringIO(), io.StringIO()
+
+        call_command(
+            "import_questions", user.username, str(path),
+            stdout=out, stderr=err,
+        )
+
+        assert Question.objects.filter(owner=user, title="Q").exists()
+        assert "Imported 1 questions" in out.getvalue()
+        assert "rows/sec" in out.getvalue()
+        assert "line 3: Expected a JSON object" in err.getvalue()
+
+    def test_unknown_user_is_an_error(self, db, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("import_questions", "nobody", str(tmp_path / "a.csv"))
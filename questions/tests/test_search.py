@@ -0,0 +1,207 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from questions import search
+from answers.models import BasicAnswer
+from questions.models import Question, QuestionVote
+from questions.search import (
+    PUBLIC_SCOPE,
+    START_SEL,
+    STOP_SEL,
+    Snippets,
+    attach_snippets,
+    result_ids,
+    user_scope,
+)
+from questions.stats import question_stats
+
+
+class TestSnippets:
+    def test_marks_matches_and_escapes_the_rest(self):
+        snippets = Snippets(
+            title=f"<b>{START_SEL}Lead{STOP_SEL}</b> & co",
+            body="no match here",
+        )
+
+        assert snippets.title == (
+            "&lt;b&gt;<mark>Lead</mark>&lt;/b&gt; &amp; co"
+        )
+        assert snippets.body is None
+        assert snippets.answer is None
+
+
+@pytest.mark.django_db
+class TestAttachSnippets:
+    def test_substring_fallback_keeps_context_around_the_match(self, user):
+        words = " ".join(f"w{i}" for i in range(30))
+        question = Question(
+            owner=user,
+            title="Conflict at work",
+            body=f"{words} resolving a CONFLICT calmly {words}",
+        )
+
+        attach_snippets([question], "conflict")
+
+        assert question.snippets.title == "<mark>Conflict</mark> at work"
+        assert question.snippets.body == (
+            "… w22 w23 w24 w25 w26 w27 w28 w29 resolving a "
+            "<mark>CONFLICT</mark> calmly w0 w1 w2 w3 w4 w5 w6 w7 w8 …"
+        )
+
+    def test_without_search_nothing_is_attached(
+        self, user, django_assert_num_queries
+    ):
+        question = Question(owner=user, title="Conflict")
+
+        with django_assert_num_queries(0):
+            attach_snippets([question], "")
+
+        assert not hasattr(question, "snippets")
+
+    def test_list_page_highlights_matches(self, authenticated_client, user):
+        Question.objects.create(
+            owner=user, title="Tell me about <teamwork>", body="Teamwork."
+        )
+
+        response = authenticated_client.get(
+            reverse("questions:list"), {"search": "teamwork"}
+        )
+
+        content = response.content.decode()
+        assert "Tell me about &lt;<mark>teamwork</mark>&gt;" in content
+        assert "<mark>Teamwork</mark>." in content
+
+
+@pytest.mark.django_db
+class TestResultIds:
+    def _search(self, client, query, **params):
+        return client.get(
+            reverse("questions:list"), {"search": query, **params}
+        )
+
+    def test_pages_come_from_the_cached_ids(
+        self, authenticated_client, user, django_assert_max_num_queries
+    ):
+        for i in range(13):
+            Question.objects.create(owner=user, title=f"Teamwork {i:02}")
+        # Cache the stats panel, so only the searches differ
+        question_stats(user)
+
+        with django_assert_max_num_queries(50) as first:
+            self._search(authenticated_client, "teamwork", sort="title")
+        # Same search, differently cased: the ids are not queried again
+        with django_assert_max_num_queries(50) as second:
+            response = self._search(
+                authenticated_client, "TEAMWORK", sort="title", page=2
+            )
+
+        assert len(second) == len(first) - 1
+        page_obj = response.context["page_obj"]
+        assert page_obj.paginator.count == 13
+        assert [q.title for q in page_obj.object_list] == ["Teamwork 12"]
+
+    def test_writes_expire_the_cached_ids(self, authenticated_client, user):
+        Question.objects.create(owner=user, title="Teamwork")
+        self._search(authenticated_client, "teamwork")
+
+        Question.objects.create(owner=user, title="More teamwork")
+        response = self._search(authenticated_client, "teamwork")
+
+        assert response.context["page_obj"].paginator.count == 2
+
+    def test_answer_edits_expire_the_cached_ids(self, user):
+        answer = BasicAnswer.objects.create(
+            question=Question.objects.create(owner=user, title="Q"),
+            user=user,
+            text="A",
+        )
+        key = search._ids_key(user_scope(user), {"search": "star"})
+
+        answer.text = "Star method"
+        answer.save()
+
+        assert search._ids_key(user_scope(user), {"search": "star"}) != key
+
+    def test_too_many_results_are_not_cached(
+        self, monkeypatch, user, django_assert_num_queries
+    ):
+        monkeypatch.setattr(search, "RESULT_IDS_MAX", 1)
+        Question.objects.create(owner=user, title="One")
+        Question.objects.create(owner=user, title="Two")
+        filters = {"search": "o"}
+
+        assert result_ids(user_scope(user), filters, Question.objects) is None
+        with django_assert_num_queries(0):
+            assert (
+                result_ids(user_scope(user), filters, Question.objects)
+                is None
+            )
+
+    def test_computes_without_waiting_for_the_lock_holder(self, user):
+        question = Question.objects.create(owner=user, title="Star")
+        key = search._ids_key(PUBLIC_SCOPE, {"search": "star"})
+        cache.add(f"{key}:lock", 1)
+
+        ids = result_ids(
+            PUBLIC_SCOPE, {"search": "star"}, Question.objects.all()
+        )
+
+        assert ids == [question.pk]
+        # Only the lock holder stores the list
+        assert cache.get(key) is None
+
+    def _public_key(self):
+        return search._ids_key(PUBLIC_SCOPE, {"search": "star"})
+
+    def test_private_writes_keep_the_public_results(self, user, other_user):
+        question = Question.objects.create(owner=user, title="Private")
+        key = self._public_key()
+
+        question.title = "Edited"
+        question.save()
+        BasicAnswer.objects.create(question=question, user=user, text="A")
+        QuestionVote.objects.create(
+            user=other_user, question=question, rating=4
+        )
+
+        assert self._public_key() == key
+
+    def test_listing_changes_expire_the_public_results(self, user):
+        question = Question.objects.create(
+            owner=user, title="Star", is_public=True
+        )
+        key = self._public_key()
+
+        question.status = Question.STATUS_APPROVED
+        question.save(update_fields=["status"])
+        approved = self._public_key()
+        # Made private again, as by the edit form, from a fresh load
+        question = Question.objects.get(pk=question.pk)
+        question.is_public = False
+        question.save()
+
+        assert len({key, approved, self._public_key()}) == 3
+
+    def test_pages_do_not_run_the_search_again(
+        self, client, user, django_assert_max_num_queries
+    ):
+        Question.objects.create(
+            owner=user,
+            title="Star method",
+            is_public=True,
+            status=Question.STATUS_APPROVED,
+        )
+        url = reverse("questions:public_list")
+        client.get(url, {"search": "star"})
+
+        with django_assert_max_num_queries(50) as captured:
+            response = client.get(url, {"search": "star"})
+
+        assert len(response.context["page_obj"].object_list) == 1
+        # Only the tag counts still filter by the search
+        searches = [
+            query["sql"] for query in captured if "LIKE" in query["sql"]
+        ]
+        assert len(searches) == 1
+        assert "GROUP BY" in searches[0]
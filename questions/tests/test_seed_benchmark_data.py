@@ -0,0 +1,66 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from answers.models import Answer, BasicAnswer, StarAnswer
+from questions.models import Question, QuestionVote, Tag
+
+
+def seed(**options):
+    defaults = {
+        "users": 3,
+        "public_tags": 4,
+        "tags_per_user": 2,
+        "questions_per_user": 10,
+        "batch_size": 7,
+        "verbosity": 0,
+    }
+    call_command("seed_benchmark_data", **{**defaults, **options})
+
+
+@pytest.mark.django_db
+class TestSeedBenchmarkData:
+    def test_creates_requested_rows(self):
+        seed()
+
+        assert Tag.objects.filter(is_public=True).count() == 4
+        assert Tag.objects.filter(is_public=False).count() == 6
+        assert Question.objects.count() == 30
+
+    def test_answers_have_child_rows_for_their_type(self):
+        seed(max_answers_per_question=3)
+
+        answers = Answer.objects.all()
+        assert answers.exists()
+        star_count = answers.filter(answer_type="STAR").count()
+        basic_count = answers.filter(answer_type="BASIC").count()
+        assert StarAnswer.objects.count() == star_count
+        assert BasicAnswer.objects.count() == basic_count
+        assert star_count + basic_count == answers.count()
+
+    def test_respects_business_rules(self):
+        seed(public_ratio=0.5, max_votes_per_question=3)
+
+        # Public questions never have answers or personal tags
+        assert not Answer.objects.filter(question__is_public=True).exists()
+        assert not Question.objects.filter(
+            is_public=True, tags__is_public=False
+        ).exists()
+        # Private questions are always approved
+        assert not Question.objects.filter(is_public=False).exclude(
+            status=Question.STATUS_APPROVED
+        ).exists()
+        # Votes only go to approved public questions
+        assert not QuestionVote.objects.exclude(
+            question__is_public=True,
+            question__status=Question.STATUS_APPROVED,
+        ).exists()
+
+    def test_refuses_to_reuse_prefix_without_flush(self):
+        seed()
+
+        with pytest.raises(CommandError):
+            seed()
+
+        seed(flush=True)
+        assert Question.objects.count() == 30
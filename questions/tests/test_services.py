@@ -0,0 +1,328 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from answers.models import Answer, BasicAnswer, StarAnswer
+from questions.models import Question, QuestionVote, Tag
+from questions.services import QuestionService, TagService
+
+
+def _tag(name, owner=None, **kwargs):
+    return Tag.objects.create(
+        name=name,
+        slug=name.lower(),
+        owner=owner,
+        is_public=owner is None,
+        **kwargs,
+    )
+
+
+def _question(owner, *tags):
+    question = Question.objects.create(owner=owner, title="Q")
+    question.tags.add(*tags)
+    return question
+
+
+def _writes(queries):
+    return [
+        query["sql"]
+        for query in queries
+        if query["sql"].lstrip().split(" ", 1)[0]
+        in ("INSERT", "UPDATE", "DELETE")
+    ]
+
+
+@pytest.mark.django_db
+class TestQuestionServiceCreate:
+    def test_one_insert_per_table(self, user):
+        public = _tag("Python")
+        with CaptureQueriesContext(connection) as queries:
+            question = QuestionService.create(
+                user,
+                "Tell me about yourself",
+                body="Keep it short",
+                tag_names=["python", "Career", "career"],
+            )
+
+        # question row, the new personal tag, the tag links
+        writes = _writes(queries)
+        assert len(writes) == 3
+        assert not any(sql.startswith("UPDATE") for sql in writes)
+        assert question.status == Question.STATUS_APPROVED
+        assert {tag.name for tag in question.tags.all()} == {
+            "Python",
+            "Career",
+        }
+        assert question.tags.get(name="Career").owner == user
+        assert public.questions.get() == question
+
+    def test_without_tags_is_a_single_insert(self, user):
+        with CaptureQueriesContext(connection) as queries:
+            QuestionService.create(user, "Why us?")
+
+        assert len(_writes(queries)) == 1
+
+    def test_public_question_from_regular_user_is_pending(self, user):
+        question = QuestionService.create(user, "Q", is_public=True)
+
+        assert question.status == Question.STATUS_PENDING
+
+    def test_public_question_from_superuser_is_approved(self, admin_user):
+        question = QuestionService.create(admin_user, "Q", is_public=True)
+
+        assert question.status == Question.STATUS_APPROVED
+
+    def test_links_tag_ids(self, user):
+        tags = [_tag("A"), _tag("B")]
+
+        question = QuestionService.create(
+            user, "Q", tag_ids=[tag.pk for tag in tags]
+        )
+
+        assert list(question.tags.order_by("name")) == tags
+
+    def test_saving_the_instance_again_keeps_it(self, user):
+        question = QuestionService.create(user, "Q")
+        question.title = "Renamed"
+        question.save()
+
+        assert Question.objects.get().title == "Renamed"
+
+    def test_saving_after_adding_tags_keeps_them_filterable(self, user):
+        question = QuestionService.create(user, "Q")
+        question.tags.add(_tag("Python", user))
+        question.title = "Renamed"
+        question.save()
+
+        assert list(Question.objects.all().tagged(["python"])) == [question]
+
+    def test_saving_does_not_write_a_stale_tag_ids_array(self, user):
+        # The array is maintained in the database (on PostgreSQL by the tag
+        # link signals); the instance's copy is never written back
+        question = QuestionService.create(user, "Q")
+        question.tag_ids = [1, 2]
+        question.save()
+
+        assert Question.objects.get().tag_ids is None
+
+
+@pytest.mark.django_db
+class TestPromoteToPublic:
+    def test_promotes_personal_tag(self, user):
+        tag = _tag("Python", user)
+        question = _question(user, tag)
+
+        assert TagService.promote_to_public(Tag.objects.all()) == (1, 0)
+
+        tag.refresh_from_db()
+        assert tag.is_public and tag.owner is None
+        assert list(question.tags.all()) == [tag]
+
+    def test_merges_into_existing_public_tag(self, user, other_user):
+        public = _tag("Python")
+        mine = _tag("python", user)
+        theirs = _tag("PYTHON", other_user)
+        both = _question(user, mine, public)
+        only_mine = _question(user, mine)
+        only_theirs = _question(other_user, theirs)
+
+        promoted, merged = TagService.promote_to_public(
+            Tag.objects.filter(pk__in=[mine.pk, theirs.pk])
+        )
+
+        assert (promoted, merged) == (0, 2)
+        assert list(Tag.objects.all()) == [public]
+        for question in (both, only_mine, only_theirs):
+            assert list(question.tags.all()) == [public]
+
+    def test_same_name_tags_share_one_promoted_tag(self, user, other_user):
+        mine = _tag("Go", user)
+        theirs = _tag("go", other_user)
+        question = _question(other_user, theirs)
+
+        assert TagService.promote_to_public(Tag.objects.all()) == (1, 1)
+
+        assert list(Tag.objects.filter(is_public=True)) == [mine]
+        assert list(question.tags.all()) == [mine]
+
+
+@pytest.mark.django_db
+class TestMergeDuplicates:
+    def test_dedupes_links_to_the_same_target(self, user):
+        first = _tag("SQL", user)
+        second = _tag("sql", user)
+        third = _tag("Sql", user)
+        question = _question(user, second, third)
+        other = _question(user, first, third)
+
+        assert TagService.merge_duplicates(Tag.objects.all()) == 2
+
+        assert list(Tag.objects.all()) == [first]
+        assert list(question.tags.all()) == [first]
+        assert list(other.tags.all()) == [first]
+
+    def test_keeps_personal_tags_of_different_owners(self, user, other_user):
+        _tag("SQL", user)
+        _tag("sql", other_user)
+
+        assert TagService.merge_duplicates(Tag.objects.all()) == 0
+        assert Tag.objects.count() == 2
+
+    def test_public_tag_absorbs_personal_duplicates(self, user, other_user):
+        mine = _tag("Leadership", user)
+        public = _tag("leadership")
+        question = _question(user, mine)
+
+        assert TagService.merge_duplicates(Tag.objects.all()) == 1
+
+        assert list(question.tags.all()) == [public]
+
+
+@pytest.mark.django_db
+class TestQuestionServiceDelete:
+    def _question_with_rows(self, owner, voter, answers):
+        question = _question(owner, _tag(f"tag {Tag.objects.count()}", owner))
+        QuestionVote.objects.create(user=voter, question=question, rating=5)
+        for i in range(answers):
+            StarAnswer.objects.create(
+                question=question,
+                user=owner,
+                situation="S",
+                task="T",
+                action="A",
+                result="R",
+            )
+            BasicAnswer.objects.create(question=question, user=owner, text="B")
+        return question
+
+    def test_deletes_related_rows_and_returns_counts(self, user, other_user):
+        question = self._question_with_rows(user, other_user, answers=2)
+        kept = self._question_with_rows(user, other_user, answers=1)
+
+        counts = QuestionService.delete([question.pk])
+
+        assert counts == {
+            "votes": 1,
+            "answers": 4,
+            "tag_links": 1,
+            "questions": 1,
+        }
+        assert list(Question.objects.all()) == [kept]
+        assert Answer.objects.count() == 2
+        assert StarAnswer.objects.count() == BasicAnswer.objects.count() == 1
+        assert QuestionVote.objects.get().question == kept
+        assert Tag.objects.count() == 2  # tags themselves are kept
+
+    def test_statement_count_does_not_grow_with_answers(
+        self, user, other_user
+    ):
+        def statements(answers):
+            question = self._question_with_rows(user, other_user, answers)
+            with CaptureQueriesContext(connection) as queries:
+                QuestionService.delete([question.pk])
+            return len(queries)
+
+        assert statements(1) == statements(10)
+
+    def test_no_ids_is_a_no_op(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert QuestionService.delete([])["questions"] == 0
+
+
+@pytest.mark.django_db
+class TestQuestionServiceMakePrivate:
+    def test_only_public_questions_change(self, user):
+        public = Question.objects.create(
+            owner=user,
+            title="Public",
+            is_public=True,
+            status=Question.STATUS_PENDING,
+        )
+        private = _question(user)
+
+        assert QuestionService.make_private([public.pk, private.pk]) == 1
+
+        public.refresh_from_db()
+        assert (public.is_public, public.status) == (
+            False,
+            Question.STATUS_APPROVED,
+        )
+
+    def test_no_ids_is_a_no_op(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert QuestionService.make_private([]) == 0
+
+
+@pytest.mark.django_db
+class TestQuestionServiceRetag:
+    def test_adds_missing_links_only(self, user):
+        python = _tag("Python")
+        first = _question(user, python)
+        second = _question(user)
+        tags, created = TagService.resolve_names(user, ["python", "Django"])
+
+        added, removed = QuestionService.retag([first.pk, second.pk], tags)
+
+        assert created == 1
+        assert (added, removed) == (3, 0)
+        assert {tag.name for tag in second.tags.all()} == {"Python", "Django"}
+        assert first.tags.count() == 2
+
+    def test_tags_created_concurrently_are_not_counted(
+        self, monkeypatch, user
+    ):
+        bulk_create = Tag.objects.bulk_create
+
+        def create_concurrently(tags, **kwargs):
+            # Another request creates "Django" first
+            Tag.objects.create(name="Django", owner=user)
+            return bulk_create(tags, **kwargs)
+
+        monkeypatch.setattr(Tag.objects, "bulk_create", create_concurrently)
+
+        tags, created = TagService.resolve_names(user, ["Django", "Flask"])
+
+        assert created == 1
+        assert set(tags) == {"django", "flask"}
+
+    def test_replace_drops_existing_links(self, user):
+        old = _tag("Old", user)
+        question = _question(user, old)
+        tags, _ = TagService.resolve_names(user, ["New"])
+
+        assert QuestionService.retag([question.pk], tags, replace=True) == (
+            1,
+            1,
+        )
+        assert [tag.name for tag in question.tags.all()] == ["New"]
+
+    def test_personal_tags_skip_public_questions(self, user):
+        public = Question.objects.create(owner=user, title="Q", is_public=True)
+        tags, _ = TagService.resolve_names(user, ["Mine"])
+
+        assert QuestionService.retag([public.pk], tags) == (0, 0)
+
+    def test_statement_count_does_not_grow_with_questions(self, user):
+        tags, _ = TagService.resolve_names(user, ["A", "B"])
+
+        def statements(count):
+            ids = [_question(user).pk for _ in range(count)]
+            with CaptureQueriesContext(connection) as queries:
+                QuestionService.retag(ids, tags, replace=True)
+            return len(queries)
+
+        assert statements(1) == statements(10)
+
+
+@pytest.mark.django_db
+class TestQuestionServiceRefreshTagIds:
+    def test_is_a_no_op_without_postgres(
+        self, user, django_assert_num_queries
+    ):
+        # Outside PostgreSQL there is no array to maintain: tagged() joins
+        question = _question(user, _tag("Python"))
+
+        with django_assert_num_queries(0):
+            assert QuestionService.refresh_tag_ids([question.pk]) == 0
+        question.refresh_from_db()
+        assert question.tag_ids is None
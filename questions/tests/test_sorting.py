@@ -312,8 +312,9 @@ class TestSortingPerformance:
 
         client.force_login(user)
         # Should be efficient with annotation - no separate answer count
-        # query needed
-        with django_assert_num_queries(6):
+        # query needed (the grouped tag facet counts and the stats panel
+        # aggregate are the other two)
+        with django_assert_num_queries(8):
             response = client.get(
                 reverse("questions:list"), {"sort": "-answer_count"}
             )
@@ -335,8 +336,8 @@ class TestSortingPerformance:
 
         client.force_login(user)
         # Title sorting should not need answer queries except for count
-        # display
-        with django_assert_num_queries(7):
+        # display (and the grouped tag facet counts and stats aggregate)
+        with django_assert_num_queries(9):
             response = client.get(
                 reverse("questions:list"), {"sort": "title"}
             )
@@ -0,0 +1,212 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from answers.models import BasicAnswer, StarAnswer
+from questions.models import Question, QuestionVote, Tag
+from questions.services import QuestionService, TagService
+from questions.stats import (
+    PROFILE_WEEKS,
+    invalidate,
+    profile_stats,
+    question_stats,
+)
+
+
+def _public(owner, status):
+    return Question.objects.create(
+        owner=owner, title="Public", is_public=True, status=status
+    )
+
+
+@pytest.mark.django_db
+class TestQuestionStats:
+    def test_counts_in_one_query(
+        self, user, other_user, django_assert_num_queries
+    ):
+        answered = Question.objects.create(owner=user, title="Answered")
+        BasicAnswer.objects.create(question=answered, user=user, text="A")
+        Question.objects.create(owner=user, title="Unanswered")
+        _public(user, Question.STATUS_PENDING)
+        _public(user, Question.STATUS_APPROVED)
+        _public(user, Question.STATUS_DENIED)
+        Question.objects.create(owner=other_user, title="Not mine")
+
+        with django_assert_num_queries(1):
+            stats = question_stats(user)
+
+        assert stats == {
+            "all": 5,
+            "personal": 2,
+            "public": 3,
+            "pending": 1,
+            "approved": 1,
+            "denied": 1,
+            "answered": 1,
+            "unanswered": 4,
+        }
+
+    def test_cached_until_a_write(self, user, django_assert_num_queries):
+        question = Question.objects.create(owner=user, title="Q")
+        question_stats(user)
+
+        with django_assert_num_queries(0):
+            assert question_stats(user)["answered"] == 0
+
+        BasicAnswer.objects.create(question=question, user=user, text="A")
+        assert question_stats(user)["answered"] == 1
+
+    def test_question_save_and_delete_invalidate(self, user):
+        question = Question.objects.create(owner=user, title="Q")
+        assert question_stats(user)["personal"] == 1
+
+        question.is_public = True
+        question.save()
+        assert question_stats(user)["public"] == 1
+
+        question.delete()
+        assert question_stats(user)["all"] == 0
+
+    def test_answer_delete_invalidates_question_owner(
+        self, user, other_user
+    ):
+        question = _public(user, Question.STATUS_APPROVED)
+        answer = BasicAnswer.objects.create(
+            question=question, user=other_user, text="A"
+        )
+        assert question_stats(user)["answered"] == 1
+
+        answer.delete()
+
+        assert question_stats(user)["answered"] == 0
+
+    def test_set_based_writes_invalidate(self, user):
+        QuestionService.create(user, "Created", is_public=True)
+        assert question_stats(user)["pending"] == 1
+
+        QuestionService.make_private(
+            Question.objects.values_list("pk", flat=True)
+        )
+        assert question_stats(user)["personal"] == 1
+
+        QuestionService.delete(Question.objects.values_list("pk", flat=True))
+        assert question_stats(user)["all"] == 0
+
+    def test_list_page_shows_stats(self, authenticated_client, user):
+        _public(user, Question.STATUS_DENIED)
+
+        response = authenticated_client.get(
+            reverse("questions:list"), {"view": "all"}
+        )
+
+        assert response.context["stats"]["denied"] == 1
+        assert "1 denied" in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestProfileStats:
+    def test_figures(self, user, other_user):
+        python = Tag.objects.create(name="Python", slug="python", owner=user)
+        sql = Tag.objects.create(name="SQL", slug="sql", owner=user)
+        first = Question.objects.create(owner=user, title="First")
+        first.tags.add(python, sql)
+        second = Question.objects.create(owner=user, title="Second")
+        second.tags.add(python)
+        StarAnswer.objects.create(
+            question=first,
+            user=user,
+            situation="S",
+            task="T",
+            action="A",
+            result="R",
+        )
+        BasicAnswer.objects.create(question=first, user=user, text="B")
+        BasicAnswer.objects.create(
+            question=second,
+            user=user,
+            text="Old",
+            created_at=timezone.now() - timedelta(weeks=PROFILE_WEEKS),
+        )
+        QuestionVote.objects.create(
+            user=other_user, question=first, rating=4
+        )
+        QuestionVote.objects.create(user=user, question=second, rating=5)
+
+        stats = profile_stats(user)
+
+        assert (
+            stats["answers_total"],
+            stats["answers_star"],
+            stats["answers_basic"],
+        ) == (3, 1, 2)
+        weeks = stats["answers_per_week"]
+        assert len(weeks) == PROFILE_WEEKS
+        # The old answer is before the first week shown
+        assert [count for _, count in weeks] == [0] * (
+            PROFILE_WEEKS - 1
+        ) + [2]
+        assert weeks[-1][0].weekday() == 0
+        assert stats["top_tags"] == [("Python", 2), ("SQL", 1)]
+        assert stats["votes_received"] == 2
+        assert stats["average_rating"] == 4.5
+
+    def test_query_count_does_not_grow_with_data(
+        self, user, django_assert_num_queries
+    ):
+        def queries():
+            with django_assert_num_queries(4) as captured:
+                profile_stats(user)
+            invalidate([user.pk])
+            return len(captured)
+
+        before = queries()
+        for i in range(5):
+            question = Question.objects.create(owner=user, title=f"Q {i}")
+            question.tags.add(
+                Tag.objects.create(name=f"T {i}", slug=f"t-{i}", owner=user)
+            )
+            BasicAnswer.objects.create(question=question, user=user, text="A")
+        assert queries() == before
+
+    def test_answers_by_others_invalidate_both_users(self, user, other_user):
+        question = _public(user, Question.STATUS_APPROVED)
+        assert profile_stats(other_user)["answers_total"] == 0
+        assert question_stats(user)["answered"] == 0
+
+        BasicAnswer.objects.create(
+            question=question, user=other_user, text="A"
+        )
+
+        assert profile_stats(other_user)["answers_total"] == 1
+        assert question_stats(user)["answered"] == 1
+
+    def test_tag_and_vote_changes_invalidate(self, user, other_user):
+        question = Question.objects.create(owner=user, title="Q")
+        assert profile_stats(user)["top_tags"] == []
+
+        question.tags.add(Tag.objects.create(name="Go", slug="go"))
+        assert profile_stats(user)["top_tags"] == [("Go", 1)]
+
+        tags, _ = TagService.resolve_names(user, ["Rust"])
+        QuestionService.retag([question.pk], tags, replace=True)
+        assert profile_stats(user)["top_tags"] == [("Rust", 1)]
+
+        QuestionVote.objects.create(
+            user=other_user, question=question, rating=3
+        )
+        assert profile_stats(user)["average_rating"] == 3
+
+    def test_question_delete_invalidates_answer_authors(
+        self, user, other_user
+    ):
+        question = _public(user, Question.STATUS_APPROVED)
+        BasicAnswer.objects.create(
+            question=question, user=other_user, text="A"
+        )
+        assert profile_stats(other_user)["answers_total"] == 1
+
+        QuestionService.delete([question.pk])
+
+        assert profile_stats(other_user)["answers_total"] == 0
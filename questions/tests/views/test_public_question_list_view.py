@@ -1,4 +1,5 @@
 import pytest
+from asgiref.sync import async_to_sync
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
@@ -32,3 +33,61 @@ class TestPublicQuestionListView:
 
         assert response.status_code == 200
         assert "Pending Questions" in response.content.decode()
+
+
+def _content(response):
+    if not response.streaming:
+        return response.content.decode()
+    if not response.is_async:
+        return b"".join(response.streaming_content).decode()
+
+    # The async view (ASYNC_VIEWS) streams from an async iterator
+    async def consume():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    return async_to_sync(consume)().decode()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("stream", (False, True))
+class TestPublicQuestionListViewModes:
+    """The page is the same whether the moderation queue is streamed."""
+
+    @pytest.fixture(autouse=True)
+    def questions(self, settings, stream, admin_user, user):
+        settings.STREAM_HTML_RESPONSES = stream
+        Question.objects.create(
+            owner=user,
+            title="Published question",
+            is_public=True,
+            status=Question.STATUS_APPROVED,
+        )
+        for i in range(3):
+            Question.objects.create(
+                owner=user,
+                title=f"Pending question {i}",
+                is_public=True,
+                status=Question.STATUS_PENDING,
+            )
+
+    def test_admin_sees_every_pending_question(self, admin_client, stream):
+        response = admin_client.get(reverse("questions:public_list"))
+
+        assert response.streaming == stream
+        content = _content(response)
+        assert "3 pending" in content
+        for i in range(3):
+            assert f"Pending question {i}" in content
+        assert "Published question" in content
+        assert "<!--stream:" not in content
+        assert content.rstrip().endswith("</html>")
+
+    def test_regular_user_sees_no_moderation_queue(
+        self, authenticated_client
+    ):
+        response = authenticated_client.get(reverse("questions:public_list"))
+
+        content = _content(response)
+        assert "Pending Questions" not in content
+        assert "Pending question" not in content
+        assert "Published question" in content
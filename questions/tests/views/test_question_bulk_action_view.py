@@ -0,0 +1,190 @@
+import pytest
+from django.contrib.messages import get_messages
+from django.urls import reverse
+
+from answers.models import BasicAnswer
+from questions.models import Question, Tag
+
+JSON = {"HTTP_ACCEPT": "application/json"}
+
+
+def _question(owner, title="Q", **kwargs):
+    return Question.objects.create(owner=owner, title=title, **kwargs)
+
+
+@pytest.mark.django_db
+class TestQuestionBulkActionView:
+    url = reverse("questions:bulk_action")
+
+    def test_requires_login(self, client, user):
+        question = _question(user)
+
+        response = client.post(
+            self.url, {"action": "delete", "ids": [question.pk]}
+        )
+
+        assert response.status_code == 302
+        assert Question.objects.filter(pk=question.pk).exists()
+
+    def test_get_not_allowed(self, authenticated_client):
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == 405
+
+    def test_unknown_action_is_400(self, authenticated_client):
+        response = authenticated_client.post(self.url, {"action": "publish"})
+
+        assert response.status_code == 400
+
+    def test_retag_without_tags_is_400(self, authenticated_client):
+        response = authenticated_client.post(self.url, {"action": "retag"})
+
+        assert response.status_code == 400
+
+    def test_delete_ignores_other_users_questions(
+        self, authenticated_client, user, other_user
+    ):
+        mine = _question(user)
+        BasicAnswer.objects.create(question=mine, user=user, text="A")
+        theirs = _question(other_user)
+
+        response = authenticated_client.post(
+            self.url,
+            {"action": "delete", "ids": [mine.pk, theirs.pk, "x"]},
+            **JSON,
+        )
+
+        data = response.json()
+        assert (data["selected"], data["questions"], data["answers"]) == (
+            1,
+            1,
+            1,
+        )
+        assert list(Question.objects.all()) == [theirs]
+
+    def test_select_all_uses_list_filters(
+        self, authenticated_client, user, other_user
+    ):
+        matching = _question(user, "Tell me about a conflict")
+        _question(user, "Why this company?")
+        _question(user, "Conflict", is_public=True)
+        _question(other_user, "Conflict at work")
+
+        response = authenticated_client.post(
+            self.url,
+            {
+                "action": "delete",
+                "select_all": "1",
+                "view": "personal",
+                "search": "conflict",
+            },
+            **JSON,
+        )
+
+        assert response.json()["questions"] == 1
+        assert not Question.objects.filter(pk=matching.pk).exists()
+        assert Question.objects.count() == 3
+
+    def test_make_private(self, authenticated_client, user):
+        public = _question(
+            user, is_public=True, status=Question.STATUS_PENDING
+        )
+
+        response = authenticated_client.post(
+            self.url, {"action": "make_private", "ids": [public.pk]}, **JSON
+        )
+
+        assert response.json()["questions"] == 1
+        public.refresh_from_db()
+        assert not public.is_public
+
+    def test_retag_replace(self, authenticated_client, user):
+        question = _question(user)
+        question.tags.add(
+            Tag.objects.create(name="Old", slug="old", owner=user)
+        )
+
+        response = authenticated_client.post(
+            self.url,
+            {
+                "action": "retag",
+                "ids": [question.pk],
+                "tags": "Leadership, Teamwork",
+                "replace": "1",
+            },
+            **JSON,
+        )
+
+        data = response.json()
+        assert (data["tag_links_added"], data["tag_links_removed"]) == (2, 1)
+        assert data["tags_created"] == 2
+        assert {tag.name for tag in question.tags.all()} == {
+            "Leadership",
+            "Teamwork",
+        }
+
+    def test_retag_without_own_questions_creates_no_tags(
+        self, authenticated_client, other_user
+    ):
+        question = _question(other_user)
+
+        response = authenticated_client.post(
+            self.url,
+            {"action": "retag", "ids": [question.pk], "tags": "Teamwork"},
+            **JSON,
+        )
+
+        assert response.json()["selected"] == 0
+        assert response.json()["tags_created"] == 0
+        assert not Tag.objects.exists()
+
+    def test_retag_public_questions_creates_no_personal_tags(
+        self, authenticated_client, user
+    ):
+        question = _question(user, is_public=True)
+        public = Tag.objects.create(
+            name="Leadership", slug="leadership", is_public=True
+        )
+
+        response = authenticated_client.post(
+            self.url,
+            {
+                "action": "retag",
+                "ids": [question.pk],
+                "tags": "Leadership, Teamwork",
+            },
+            **JSON,
+        )
+
+        data = response.json()
+        assert (data["tag_links_added"], data["tags_created"]) == (1, 0)
+        assert list(question.tags.all()) == [public]
+        assert list(Tag.objects.all()) == [public]
+
+    def test_form_post_redirects_back_with_message(
+        self, authenticated_client, user
+    ):
+        question = _question(user)
+        next_url = reverse("questions:list") + "?view=all"
+
+        response = authenticated_client.post(
+            self.url,
+            {"action": "delete", "ids": [question.pk], "next": next_url},
+        )
+
+        assert response.status_code == 302
+        assert response.url == next_url
+        messages = [str(m) for m in get_messages(response.wsgi_request)]
+        assert messages == ["Deleted 1 question(s) and 0 answer(s)."]
+
+    def test_external_next_is_ignored(self, authenticated_client, user):
+        response = authenticated_client.post(
+            self.url,
+            {
+                "action": "make_private",
+                "ids": [_question(user).pk],
+                "next": "https://evil.example.com/",
+            },
+        )
+
+        assert response.url == reverse("questions:list")
@@ -0,0 +1,51 @@
+import gzip
+import json
+
+import pytest
+from django.urls import reverse
+
+from questions.models import Question
+
+
+@pytest.mark.django_db
+class TestQuestionExportView:
+    @pytest.fixture
+    def questions(self, user, other_user):
+        Question.objects.create(owner=user, title="Mine")
+        Question.objects.create(owner=other_user, title="Not mine")
+
+    def _content(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_streams_ndjson_attachment(self, authenticated_client, questions):
+        response = authenticated_client.get(reverse("questions:export"))
+
+        assert response.status_code == 200
+        assert response.streaming
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert "attachment" in response["Content-Disposition"]
+        lines = self._content(response).decode().splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Mine"]
+
+    def test_gzip_csv(self, authenticated_client, questions):
+        response = authenticated_client.get(
+            reverse("questions:export"), {"format": "csv", "gzip": "1"}
+        )
+
+        assert response["Content-Type"] == "application/gzip"
+        assert response["Content-Disposition"].endswith('.csv.gz"')
+        rows = gzip.decompress(self._content(response)).decode().splitlines()
+        assert rows[0].startswith("question_id,")
+        assert len(rows) == 2
+
+    def test_unknown_format_is_400(self, authenticated_client):
+        response = authenticated_client.get(
+            reverse("questions:export"), {"format": "xml"}
+        )
+
+        assert response.status_code == 400
+
+    def test_requires_login(self, client):
+        response = client.get(reverse("questions:export"))
+
+        assert response.status_code == 302
@@ -0,0 +1,46 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from questions.models import Question
+
+
+@pytest.mark.django_db
+class TestQuestionImportView:
+    def test_imports_uploaded_csv(self, authenticated_client, user):
+        upload = SimpleUploadedFile(
+            "bank.csv",
+            b"title,tags,answer_type,text\n"
+            b"Why us?,Motivation,BASIC,Because\n"
+            b",,,\n",
+        )
+
+        response = authenticated_client.post(
+            reverse("questions:import"), {"file": upload}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["rows"], data["questions"], data["answers"]) == (2, 1, 1)
+        assert data["errors"][0]["line"] == 3
+        assert "rows_per_second" in data
+        assert Question.objects.get(owner=user).title == "Why us?"
+
+    def test_unsupported_file_type_is_400(self, authenticated_client):
+        upload = SimpleUploadedFile("bank.xlsx", b"")
+
+        response = authenticated_client.post(
+            reverse("questions:import"), {"file": upload}
+        )
+
+        assert response.status_code == 400
+
+    def test_missing_file_is_400(self, authenticated_client):
+        response = authenticated_client.post(reverse("questions:import"))
+
+        assert response.status_code == 400
+
+    def test_get_not_allowed(self, authenticated_client):
+        response = authenticated_client.get(reverse("questions:import"))
+
+        assert response.status_code == 405
@@ -0,0 +1,69 @@
+import pytest
+from django.urls import reverse
+
+from questions.models import Question, Tag
+
+
+@pytest.mark.django_db
+class TestQuestionTagsView:
+    @pytest.fixture
+    def question(self, user):
+        question = Question.objects.create(
+            owner=user, title="Tell me about a conflict"
+        )
+        question.tags.add(
+            *[
+                Tag.objects.create(
+                    name=name, slug=name.lower(), owner=user, is_public=False
+                )
+                for name in ("Conflict", "Amazon", "Teamwork")
+            ]
+        )
+        return question
+
+    def test_returns_all_tags_as_json(self, authenticated_client, question):
+        response = authenticated_client.get(
+            reverse("questions:tags", args=[question.pk]),
+            HTTP_ACCEPT="application/json",
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["question_id"] == question.pk
+        assert [tag["name"] for tag in data["tags"]] == [
+            "Amazon",
+            "Conflict",
+            "Teamwork",
+        ]
+
+    def test_returns_html_fragment_by_default(
+        self, authenticated_client, question
+    ):
+        response = authenticated_client.get(
+            reverse("questions:tags", args=[question.pk])
+        )
+
+        assert response.status_code == 200
+        content = response.content.decode()
+        assert "All Tags (3)" in content
+        assert "Teamwork" in content
+        assert "<html" not in content
+
+    def test_private_question_of_other_user_is_404(
+        self, client, other_user, question
+    ):
+        client.force_login(other_user)
+
+        response = client.get(reverse("questions:tags", args=[question.pk]))
+
+        assert response.status_code == 404
+
+    def test_list_card_shows_preview_and_modal_trigger(
+        self, authenticated_client, question
+    ):
+        response = authenticated_client.get(reverse("questions:list"))
+
+        content = response.content.decode()
+        assert "Amazon" in content
+        assert "Conflict" in content
+        assert reverse("questions:tags", args=[question.pk]) in content
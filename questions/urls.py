@@ -1,22 +1,40 @@
+from django.conf import settings
 from django.urls import path
 
 from .views.approve_public_question import approve_public_question
-from .views.check_tag_exists import check_tag_exists
+from .views.check_tag_exists import acheck_tag_exists, check_tag_exists
 from .views.deny_public_question import deny_public_question
-from .views.public_question_list import public_question_list
+from .views.public_question_list import (
+    apublic_question_list,
+    public_question_list,
+)
+from .views.question_bulk_action import question_bulk_action
 from .views.question_create import question_create
 from .views.question_delete import question_delete
-from .views.question_detail import question_detail
+from .views.question_detail import aquestion_detail, question_detail
 from .views.question_edit import question_edit
+from .views.question_export import question_export
+from .views.question_import import question_import
 from .views.question_list import question_list
+from .views.question_tags import question_tags
 from .views.save_public_question import save_public_question
 
 
 app_name = "questions"
 
+# The ASGI deployment serves async versions of the read-heavy views
+if settings.ASYNC_VIEWS:
+    public_list_view = apublic_question_list
+    check_tag_exists_view = acheck_tag_exists
+    detail_view = aquestion_detail
+else:
+    public_list_view = public_question_list
+    check_tag_exists_view = check_tag_exists
+    detail_view = question_detail
+
 urlpatterns = [
     path("", question_list, name="list"),
-    path("public/", public_question_list, name="public_list"),
+    path("public/", public_list_view, name="public_list"),
     path("save/<int:question_id>/", save_public_question, name="save_public"),
     path(
         "approve/<int:question_id>/",
@@ -24,9 +42,17 @@ urlpatterns = [
         name="approve_public",
     ),
     path("deny/<int:question_id>/", deny_public_question, name="deny_public"),
-    path("ajax/check-tag-exists/", check_tag_exists, name="check_tag_exists"),
+    path(
+        "ajax/check-tag-exists/",
+        check_tag_exists_view,
+        name="check_tag_exists",
+    ),
     path("create/", question_create, name="create"),
-    path("<int:pk>/", question_detail, name="detail"),
+    path("bulk/", question_bulk_action, name="bulk_action"),
+    path("export/", question_export, name="export"),
+    path("import/", question_import, name="import"),
+    path("<int:pk>/", detail_view, name="detail"),
     path("<int:pk>/edit/", question_edit, name="edit"),
     path("<int:pk>/delete/", question_delete, name="delete"),
+    path("<int:pk>/tags/", question_tags, name="tags"),
 ]
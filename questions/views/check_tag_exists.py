@@ -3,32 +3,34 @@ from django.contrib.auth.decorators import login_required
 from questions.models import Tag
 
 
-@login_required
-def check_tag_exists(request):
-    """
-    AJAX endpoint to check if a tag name already exists for the current user.
-    Returns the existing tag info if found, or indicates if it can be created.
-    """
+def _validate(request):
+    """Return the requested tag name, or an error response."""
     if request.method != "GET":
-        return JsonResponse({"error": "Only GET method allowed"}, status=405)
+        return None, JsonResponse(
+            {"error": "Only GET method allowed"}, status=405
+        )
 
     tag_name = request.GET.get("name", "").strip()
 
     if not tag_name:
-        return JsonResponse({"error": "Tag name is required"}, status=400)
+        return None, JsonResponse(
+            {"error": "Tag name is required"}, status=400
+        )
 
-    # Check if tag name already exists using the same logic as form save()
-    # First, try to find a public tag
-    existing_tag = Tag.objects.filter(
-        name__iexact=tag_name, is_public=True
-    ).first()
+    return tag_name, None
 
-    # If no public tag, try to find user's personal tag
-    if not existing_tag:
-        existing_tag = Tag.objects.filter(
-            name__iexact=tag_name, owner=request.user, is_public=False
-        ).first()
 
+def _public_tag_query(tag_name):
+    return Tag.objects.filter(name__iexact=tag_name, is_public=True)
+
+
+def _personal_tag_query(tag_name, user):
+    return Tag.objects.filter(
+        name__iexact=tag_name, owner=user, is_public=False
+    )
+
+
+def _response(existing_tag):
     if existing_tag:
         return JsonResponse(
             {
@@ -43,3 +45,39 @@ def check_tag_exists(request):
         )
     else:
         return JsonResponse({"exists": False, "can_create": True})
+
+
+@login_required
+def check_tag_exists(request):
+    """
+    AJAX endpoint to check if a tag name already exists for the current user.
+    Returns the existing tag info if found, or indicates if it can be created.
+    """
+    tag_name, error = _validate(request)
+    if error:
+        return error
+
+    # Check if tag name already exists using the same logic as form save()
+    # First, try to find a public tag
+    existing_tag = _public_tag_query(tag_name).first()
+
+    # If no public tag, try to find user's personal tag
+    if not existing_tag:
+        existing_tag = _personal_tag_query(tag_name, request.user).first()
+
+    return _response(existing_tag)
+
+
+@login_required
+async def acheck_tag_exists(request):
+    """Async version of ``check_tag_exists`` for the ASGI deployment."""
+    tag_name, error = _validate(request)
+    if error:
+        return error
+
+    existing_tag = await _public_tag_query(tag_name).afirst()
+    if not existing_tag:
+        user = await request.auser()
+        existing_tag = await _personal_tag_query(tag_name, user).afirst()
+
+    return _response(existing_tag)
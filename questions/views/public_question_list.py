@@ -1,10 +1,29 @@
-from django.core.paginator import Paginator
-from django.shortcuts import render
+from asgiref.sync import sync_to_async
 from django.db.models import Count, Q
 from django.contrib.postgres.search import SearchQuery
 from django.db import connection
 
+from answers.models import Answer
+from config.concurrent_queries import (
+    apaginate_concurrently,
+    apaginate_ids_concurrently,
+    paginate_concurrently,
+    paginate_ids_concurrently,
+)
+from config.streaming import arender_streaming, render_streaming
 from questions.models import Question, Tag
+from questions.search import PUBLIC_SCOPE, attach_snippets, result_ids
+from questions.views.question_list import (
+    selected_tags_query,
+    tag_counts_query,
+    tag_facets,
+    tag_filter_context,
+    tag_filters,
+)
+
+# Number of tag badges shown on each question card; the full list is
+# loaded on demand from the questions:tags endpoint
+CARD_VISIBLE_TAGS = 2
 
 # Sorting options for public questions (value, label)
 SORT_OPTIONS = (
@@ -14,47 +33,27 @@ SORT_OPTIONS = (
     ("-title", "Title (Z-A)"),
 )
 
+TEMPLATE_NAME = "questions/pages/public_list.html"
 
-def public_question_list(request):
-    """
-    Display paginated list of public questions that users can save
-    to their own collection.
-    """
-    # Get filter, search, and sort parameters
-    tag_filter = request.GET.get("tag", "").strip()
-    search_query = request.GET.get("search", "").strip()
-    sort_by = request.GET.get("sort", "-created_at").strip()
-
-    # Only show public approved questions with optimized queries
-    questions = (
-        Question.objects.filter(
-            is_public=True, status=Question.STATUS_APPROVED
-        )
-        .select_related("owner")
-        .prefetch_related("tags")
+
+def _listed_questions():
+    """Return the approved public questions, which the list shows."""
+    return Question.objects.filter(
+        is_public=True, status=Question.STATUS_APPROVED
+    )
+
+
+def _card_rows(questions):
+    """Load what the question cards show along with ``questions``."""
+    return questions.select_related("owner").with_tag_preview(
+        CARD_VISIBLE_TAGS
     )
 
-    # Apply tag filter if provided
-    selected_tag = None
-    selected_tag_name = None
-    if tag_filter:
-        # Filter questions that have the specified tag (case-insensitive by
-        # slug)
-        questions = questions.filter(tags__slug__iexact=tag_filter)
-        # Get the actual tag object for display
-        try:
-            tag_obj = Tag.objects.filter(
-                is_public=True, slug__iexact=tag_filter
-            ).first()
-            if tag_obj:
-                selected_tag = tag_obj.slug
-                selected_tag_name = tag_obj.name
-            else:
-                selected_tag = tag_filter
-                selected_tag_name = tag_filter
-        except AttributeError:
-            selected_tag = tag_filter
-            selected_tag_name = tag_filter
+
+def _searched_questions(search_query):
+    """Return the approved public questions matching the search."""
+    # Only show public approved questions
+    questions = _listed_questions()
 
     # Apply search filter if provided
     # Search across question title (partial match), body, and answer content
@@ -67,100 +66,256 @@ def public_question_list(request):
             # Partial match on title + full-text search on body
             questions = questions.filter(
                 Q(title__icontains=search_query) | Q(search_vector=search)
-            ).distinct()
+            )
         else:
             # Fallback to basic search for non-Postgres databases (e.g., SQLite
             # in tests)
             questions = questions.filter(
                 Q(title__icontains=search_query)
                 | Q(body__icontains=search_query)
-            ).distinct()
+            )
+    return questions
+
+
+def _public_questions(tags, tag_mode, search_query, sort_by):
+    """
+    Build the (unevaluated) queryset of approved public questions for the
+    given filters. Returns the queryset and the validated sort value.
+    """
+    # Apply tag filter if provided: questions with all (or any) of the tags,
+    # case-insensitive by slug
+    questions = _card_rows(
+        _searched_questions(search_query).tagged(tags, tag_mode)
+    )
 
     # Validate and apply sorting
     valid_sort_values = [option[0] for option in SORT_OPTIONS]
     if sort_by not in valid_sort_values:
         sort_by = "-created_at"  # Default to newest first
 
-    # Order by selected sort option and make distinct to avoid duplicates
-    # from tag filter
-    questions = questions.distinct().order_by(sort_by)
-
-    # Paginate questions (12 per page)
-    paginator = Paginator(questions, 12)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+    # Order by selected sort option. The tag filter needs no DISTINCT: it is
+    # a containment test on PostgreSQL, and the join fallback (tagged())
+    # applies its own.
+    return questions.order_by(sort_by), sort_by
 
-    # Force evaluation and get the actual list of questions for this page
-    # This prevents re-evaluation of the queryset later
-    questions_list = list(page_obj.object_list)
 
-    if questions_list:
-        question_ids = [q.id for q in questions_list]
+def _result_ids(params, questions, sort_by):
+    """
+    Return the ordered ids of a search's results, briefly cached, or None
+    when not searching (or too many matched). Pages of ids are loaded from
+    ``_card_rows(_listed_questions())``, without the search filters.
+    """
+    tags, tag_mode, search_query, _ = params
+    if not search_query:
+        return None
+    return result_ids(
+        PUBLIC_SCOPE,
+        {
+            "search": search_query,
+            "tags": tags,
+            "tag_mode": tag_mode,
+            "sort": sort_by,
+        },
+        questions,
+    )
 
-        # Get answer counts for questions on this page - single query
-        from answers.models import Answer
 
-        answer_counts = dict(
-            Answer.objects.filter(
-                question_id__in=question_ids,
-                is_public=True,  # Only count public answers
-            )
-            .values("question_id")
-            .annotate(count=Count("id"))
-            .values_list("question_id", "count")
+def _answer_counts_query(question_ids):
+    """Return (question_id, count) rows of public answers - single query."""
+    return (
+        Answer.objects.filter(
+            question_id__in=question_ids,
+            is_public=True,  # Only count public answers
         )
+        .values("question_id")
+        .annotate(count=Count("id"))
+        .values_list("question_id", "count")
+    )
 
-        # Attach counts to questions as attributes
-        for question in questions_list:
-            question.answer_count = answer_counts.get(question.id, 0)
-
-    # Replace the queryset with our evaluated list to prevent re-querying
-    page_obj.object_list = questions_list
 
-    # Get saved question titles for the current user (if authenticated)
-    saved_question_titles = set()
-    if request.user.is_authenticated:
-        saved_question_titles = set(
-            Question.objects.filter(
-                owner=request.user, is_public=False
-            ).values_list("title", flat=True)
-        )
+def _saved_titles_query(user):
+    """Return titles of the user's private copies of public questions."""
+    return Question.objects.filter(owner=user, is_public=False).values_list(
+        "title", flat=True
+    )
 
-    pending_questions = Question.objects.none()
-    if request.user.is_authenticated and request.user.is_superuser:
-        pending_questions = (
-            Question.objects.filter(
-                is_public=True, status=Question.STATUS_PENDING
-            )
-            .select_related("owner")
-            .prefetch_related("tags")
-            .order_by("-created_at")
-        )
 
-    # Get all public tags for the filter dropdown
-    available_tags = (
-        Tag.objects.filter(is_public=True).distinct().order_by("name")
+def _pending_questions(user):
+    """Return the moderation queue, which only superusers see."""
+    if not (user.is_authenticated and user.is_superuser):
+        return Question.objects.none()
+    return (
+        Question.objects.filter(is_public=True, status=Question.STATUS_PENDING)
+        .select_related("owner")
+        .order_by("-created_at")
     )
 
+
+def _context(
+    page_obj, tags, tag_mode, tag_objs, search_query, sort_by, **extra
+):
     # Get sort option label for display
     sort_label = next(
         (label for value, label in SORT_OPTIONS if value == sort_by),
         "Newest First",
     )
-
-    context = {
+    return {
         "questions": page_obj,
         "page_obj": page_obj,
         "is_public_view": True,
-        "saved_question_titles": saved_question_titles,
-        "pending_questions": pending_questions,
-        "available_tags": available_tags,
-        "selected_tag": selected_tag,
-        "selected_tag_name": selected_tag_name,
+        **tag_filter_context(tags, tag_mode, tag_objs),
         "search_query": search_query,
         "sort_options": SORT_OPTIONS,
         "selected_sort": sort_by,
         "selected_sort_label": sort_label,
+        **extra,
     }
 
-    return render(request, "questions/pages/public_list.html", context)
+
+def _list_params(request):
+    """Get filter (tags and tag mode), search, and sort parameters."""
+    return (
+        *tag_filters(request.GET),
+        request.GET.get("search", "").strip(),
+        request.GET.get("sort", "-created_at").strip(),
+    )
+
+
+def _page_tasks(request, tags, search_query):
+    """
+    Queries the page needs besides the page itself, which do not depend on
+    it and so run concurrently with it.
+    """
+    tasks = {
+        # Get all public tags for the filter dropdown
+        "available_tags": Tag.objects.filter(is_public=True)
+        .distinct()
+        .order_by("name"),
+        # Questions per tag among the search results, for the dropdown
+        "tag_counts": tag_counts_query(_searched_questions(search_query)),
+    }
+    if tags:
+        # Get the actual tag objects for display
+        tasks["selected_tags"] = selected_tags_query(
+            tags, Tag.objects.filter(is_public=True)
+        )
+    if request.user.is_authenticated:
+        # Get saved question titles for the current user
+        tasks["saved_question_titles"] = _saved_titles_query(request.user)
+    return tasks
+
+
+def _list_context(page_obj, results, params, sort_by, pending_questions):
+    tags, tag_mode, search_query, _ = params
+    return _context(
+        page_obj,
+        tags,
+        tag_mode,
+        results.get("selected_tags", ()),
+        search_query,
+        sort_by,
+        saved_question_titles=set(results.get("saved_question_titles", ())),
+        pending_questions=pending_questions,
+        available_tags=tag_facets(
+            results["available_tags"], results["tag_counts"], tags
+        ),
+    )
+
+
+def public_question_list(request):
+    """
+    Display paginated list of public questions that users can save
+    to their own collection.
+    """
+    params = _list_params(request)
+    questions, sort_by = _public_questions(*params)
+
+    # Paginate questions (12 per page). The page, its count and the other
+    # independent queries run concurrently. Searches page through a cached
+    # list of the matching ids instead.
+    tasks = _page_tasks(request, params[0], params[2])
+    ids = _result_ids(params, questions, sort_by)
+    if ids is None:
+        page_obj, results = paginate_concurrently(
+            questions, 12, request.GET.get("page"), **tasks
+        )
+    else:
+        page_obj, results = paginate_ids_concurrently(
+            ids,
+            _card_rows(_listed_questions()),
+            12,
+            request.GET.get("page"),
+            **tasks,
+        )
+
+    questions_list = page_obj.object_list
+    # Highlight why each question matched - for this page's ids only
+    attach_snippets(questions_list, params[2])
+    if questions_list:
+        answer_counts = dict(
+            _answer_counts_query([q.id for q in questions_list])
+        )
+        # Attach counts to questions as attributes
+        for question in questions_list:
+            question.answer_count = answer_counts.get(question.id, 0)
+
+    context = _list_context(
+        page_obj, results, params, sort_by, _pending_questions(request.user)
+    )
+
+    # The moderation queue is unbounded, so its cards are streamed after the
+    # rest of the page has been sent
+    return render_streaming(
+        request, TEMPLATE_NAME, context, streamed=["pending_questions"]
+    )
+
+
+async def apublic_question_list(request):
+    """
+    Async version of ``public_question_list`` for the ASGI deployment.
+
+    Runs the same queries through the async ORM. Everything the template
+    touches is evaluated up front because templates cannot query the
+    database from an async context.
+    """
+    # Resolve the user asynchronously and reuse it for the template, which
+    # would otherwise load it again through the lazy request.user
+    user = request.user = await request.auser()
+
+    params = _list_params(request)
+    questions, sort_by = _public_questions(*params)
+
+    tasks = _page_tasks(request, params[0], params[2])
+    ids = await sync_to_async(_result_ids)(params, questions, sort_by)
+    if ids is None:
+        page_obj, results = await apaginate_concurrently(
+            questions, 12, request.GET.get("page"), **tasks
+        )
+    else:
+        page_obj, results = await apaginate_ids_concurrently(
+            ids,
+            _card_rows(_listed_questions()),
+            12,
+            request.GET.get("page"),
+            **tasks,
+        )
+
+    questions_list = page_obj.object_list
+    await sync_to_async(attach_snippets)(questions_list, params[2])
+    if questions_list:
+        answer_counts = {
+            question_id: count
+            async for question_id, count in _answer_counts_query(
+                [q.id for q in questions_list]
+            )
+        }
+        for question in questions_list:
+            question.answer_count = answer_counts.get(question.id, 0)
+
+    context = _list_context(
+        page_obj, results, params, sort_by, _pending_questions(user)
+    )
+
+    return await arender_streaming(
+        request, TEMPLATE_NAME, context, streamed=["pending_questions"]
+    )
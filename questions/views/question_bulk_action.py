@@ -0,0 +1,120 @@
+from django.contrib import messages
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+from django.shortcuts import redirect
+from django.utils.http import url_has_allowed_host_and_scheme
+
+from questions.models import Question
+from questions.services import QuestionService, TagService
+from questions.views.question_list import filter_questions, tag_filters
+
+BULK_ACTIONS = ("delete", "make_private", "retag")
+
+
+def _selected_questions(request):
+    """
+    Return (id, is_public) of the user's questions the action applies to:
+    the posted ``ids``, or with ``select_all`` every question matching the
+    list page filters posted along (``view``, ``tag``, ``mode``,
+    ``search``). Ids of other users' questions are dropped, so the
+    ownership check is part of the selection itself.
+    """
+    data = request.POST
+    if data.get("select_all") in ("1", "true", "on"):
+        tags, tag_mode = tag_filters(data)
+        questions = filter_questions(
+            request.user,
+            tags,
+            data.get("search", "").strip(),
+            data.get("view", "personal").strip(),
+            tag_mode,
+        )
+    else:
+        ids = [value for value in data.getlist("ids") if value.isdigit()]
+        if not ids:
+            return []
+        questions = Question.objects.filter(owner=request.user, pk__in=ids)
+    return list(questions.values_list("pk", "is_public"))
+
+
+def _run(request, action, questions):
+    """Run ``action`` on ``questions``; return (result counts, message)."""
+    ids = [pk for pk, _ in questions]
+    if action == "delete":
+        counts = QuestionService.delete(ids)
+        return counts, (
+            f"Deleted {counts['questions']} question(s) and "
+            f"{counts['answers']} answer(s)."
+        )
+
+    if action == "make_private":
+        updated = QuestionService.make_private(ids)
+        return {"questions": updated}, f"Made {updated} question(s) private."
+
+    names = [
+        name.strip()
+        for name in request.POST.get("tags", "").split(",")
+        if name.strip()
+    ]
+    tags, created = {}, 0
+    if any(not is_public for _, is_public in questions):
+        tags, created = TagService.resolve_names(request.user, names)
+    elif questions:
+        # Public questions only take public tags: look them up, but do not
+        # create personal tags that would never be linked
+        tags, _ = TagService.resolve_names(request.user, names, create=False)
+    added, removed = QuestionService.retag(
+        ids, tags, replace=request.POST.get("replace") in ("1", "true", "on")
+    )
+    counts = {
+        "questions": len(ids),
+        "tag_links_added": added,
+        "tag_links_removed": removed,
+        "tags_created": created,
+    }
+    return counts, (
+        f"Retagged {len(ids)} question(s): {added} tag(s) added, "
+        f"{removed} removed."
+    )
+
+
+@login_required
+def question_bulk_action(request):
+    """
+    Apply an action to many of the user's questions at once.
+    - ``action``: ``delete``, ``make_private`` or ``retag``
+    - ``ids`` (repeated), or ``select_all=1`` with the list page filters
+    - ``retag`` also takes ``tags`` (comma-separated names) and ``replace``
+
+    Each action runs as a few set-based statements whatever the size of the
+    selection. JSON clients get the affected row counts; the list page gets
+    a message and is redirected back (to ``next``).
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"error": "Only POST requests allowed"}, status=405
+        )
+
+    action = request.POST.get("action", "")
+    if action not in BULK_ACTIONS:
+        return JsonResponse({"error": "Unknown action"}, status=400)
+    if action == "retag" and not request.POST.get("tags", "").strip():
+        return JsonResponse({"error": "No tags given"}, status=400)
+
+    questions = _selected_questions(request)
+    counts, message = _run(request, action, questions)
+
+    if "application/json" in request.headers.get("Accept", ""):
+        return JsonResponse(
+            {"action": action, "selected": len(questions), **counts}
+        )
+
+    messages.success(request, message)
+    next_url = request.POST.get("next", "")
+    if url_has_allowed_host_and_scheme(
+        next_url,
+        allowed_hosts={request.get_host()},
+        require_https=request.is_secure(),
+    ):
+        return redirect(next_url)
+    return redirect("questions:list")
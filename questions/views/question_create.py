@@ -5,6 +5,7 @@ from django.shortcuts import redirect, render
 
 from questions.forms import QuestionForm
 from questions.models import Question, Tag
+from questions.services import QuestionService
 
 
 @login_required
@@ -28,31 +29,23 @@ def question_create(request):
 
         form = QuestionForm(post_data, user=request.user)
         if form.is_valid():
-            question = form.save(commit=False)
-            question.owner = request.user
+            question = QuestionService.create(
+                owner=request.user,
+                title=form.cleaned_data["title"],
+                body=form.cleaned_data.get("body", ""),
+                is_public=form.cleaned_data.get("is_public", False),
+                tag_names=form.tag_names(),
+            )
 
-            is_public = form.cleaned_data.get("is_public", False)
-            question.is_public = is_public
-
-            if request.user.is_superuser:
-                question.status = Question.STATUS_APPROVED
-                approval_message = (
-                    "Your question has been created successfully!"
-                )
-            elif is_public:
-                question.status = Question.STATUS_PENDING
+            if question.status == Question.STATUS_PENDING:
                 approval_message = (
                     "Your question is pending review by a moderator."
                 )
             else:
-                question.status = Question.STATUS_APPROVED
                 approval_message = (
                     "Your question has been created successfully!"
                 )
 
-            question.save()
-            form.save()  # This will handle tags via the custom save method
-
             messages.success(request, approval_message)
             return redirect("questions:detail", pk=question.pk)
     else:
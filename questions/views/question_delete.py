@@ -4,6 +4,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.views.decorators.http import require_POST
 
 from questions.models import Question
+from questions.services import QuestionService
 
 
 @login_required
@@ -15,18 +16,15 @@ def question_delete(request, pk):
     - Non-admins can only delete their own questions
     """
     # Admins can delete any question, non-admins only their own
-    if request.user.is_superuser:
-        question = get_object_or_404(Question, pk=pk)
-    else:
-        question = get_object_or_404(Question, pk=pk, owner=request.user)
-
-    # Store question title for success message before deletion
-    question_title = question.title
-
-    # Check if question has answers - warn user but allow deletion
-    answer_count = question.answers.count()
-
-    question.delete()
+    questions = Question.objects.all()
+    if not request.user.is_superuser:
+        questions = questions.filter(owner=request.user)
+    question_title = get_object_or_404(
+        questions.values_list("title", flat=True), pk=pk
+    )
+
+    # Answers are deleted too - the message tells the user how many
+    answer_count = QuestionService.delete([pk])["answers"]
 
     if answer_count > 0:
         answer_suffix = "s" if answer_count != 1 else ""
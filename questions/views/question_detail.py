@@ -1,22 +1,40 @@
-from django.shortcuts import get_object_or_404, render
+from django.shortcuts import aget_object_or_404, get_object_or_404, render
 
 from questions.models import Question
 
+TEMPLATE_NAME = "questions/pages/detail.html"
 
-def question_detail(request, pk):
-    """Display a single question with its answers"""
-    if request.user.is_authenticated and request.user.is_superuser:
+
+def _question_queryset(user):
+    """Questions the user may open, with what the page renders loaded."""
+    if user.is_authenticated and user.is_superuser:
         queryset = Question.objects.all()
     else:
-        queryset = Question.objects.visible_to_user(request.user)
+        queryset = Question.objects.visible_to_user(user)
+
+    # Tags are prefetched so the tag list can count and render them from
+    # one query
+    return queryset.select_related("owner").prefetch_related("tags", "votes")
 
-    question = get_object_or_404(queryset, pk=pk)
 
-    # Get answers visible to the user with related answer content
-    answers = question.answers.visible_to_user(request.user).select_related(
-        "user", "staranswer", "basicanswer"
+def _answers_queryset(question, user):
+    """Get answers visible to the user, with their authors"""
+    return question.answers.visible_to_user(user).select_related("user")
+
+
+def _already_saved_query(question, user):
+    return Question.objects.filter(
+        owner=user,
+        title=question.title,
+        is_public=False,
     )
 
+
+def question_detail(request, pk):
+    """Display a single question with its answers"""
+    question = get_object_or_404(_question_queryset(request.user), pk=pk)
+    answers = _answers_queryset(question, request.user)
+
     # Check if current user has an answer for this question
     user_answer = None
     if request.user.is_authenticated:
@@ -24,11 +42,40 @@ def question_detail(request, pk):
 
     already_saved = False
     if question.is_public and request.user.is_authenticated:
-        already_saved = Question.objects.filter(
-            owner=request.user,
-            title=question.title,
-            is_public=False,
-        ).exists()
+        already_saved = _already_saved_query(question, request.user).exists()
+
+    context = {
+        "question": question,
+        "answers": answers,
+        "user_answer": user_answer,
+        "already_saved": already_saved,
+    }
+
+    return render(request, TEMPLATE_NAME, context)
+
+
+async def aquestion_detail(request, pk):
+    """Async version of ``question_detail`` for the ASGI deployment."""
+    # Resolve the user asynchronously and reuse it for the template, which
+    # would otherwise load it again through the lazy request.user
+    user = request.user = await request.auser()
+
+    question = await aget_object_or_404(_question_queryset(user), pk=pk)
+    answers = _answers_queryset(question, user)
+    if not question.is_public:
+        # The page lists answers on private questions only. Iterating fills
+        # the queryset's result cache, so the template's answers.count and
+        # loop read from it instead of querying
+        async for _ in answers:
+            pass
+
+    user_answer = None
+    if user.is_authenticated:
+        user_answer = await answers.filter(user=user).afirst()
+
+    already_saved = False
+    if question.is_public and user.is_authenticated:
+        already_saved = await _already_saved_query(question, user).aexists()
 
     context = {
         "question": question,
@@ -37,4 +84,4 @@ def question_detail(request, pk):
         "already_saved": already_saved,
     }
 
-    return render(request, "questions/pages/detail.html", context)
+    return render(request, TEMPLATE_NAME, context)
@@ -0,0 +1,37 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse, StreamingHttpResponse
+
+from questions.export import (
+    CONTENT_TYPES,
+    FORMAT_NDJSON,
+    FORMATS,
+    export_filename,
+    iter_export,
+)
+
+
+@login_required
+def question_export(request):
+    """
+    Download the user's questions, tags and answers as NDJSON or CSV
+    (``?format=csv``), optionally gzip-compressed (``?gzip=1``). The file is
+    streamed as it is generated, so collections of any size can be exported.
+    """
+    if request.method != "GET":
+        return JsonResponse({"error": "Only GET method allowed"}, status=405)
+
+    fmt = request.GET.get("format", FORMAT_NDJSON).lower()
+    if fmt not in FORMATS:
+        return JsonResponse(
+            {"error": f"format must be one of: {', '.join(FORMATS)}"},
+            status=400,
+        )
+    compress = request.GET.get("gzip", "").lower() in ("1", "true")
+
+    response = StreamingHttpResponse(
+        iter_export(request.user, fmt, compress=compress),
+        content_type="application/gzip" if compress else CONTENT_TYPES[fmt],
+    )
+    filename = export_filename(request.user, fmt, compress=compress)
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
@@ -0,0 +1,29 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+
+from questions.imports import detect_format, import_questions
+
+
+@login_required
+def question_import(request):
+    """
+    Import questions, tags and answers from an uploaded NDJSON or CSV file
+    (``file``, optionally gzip-compressed; the format follows the file
+    extension). Responds with the import report: counts, rows per second
+    and the errors of rows that were skipped.
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"error": "Only POST requests allowed"}, status=405
+        )
+
+    upload = request.FILES.get("file")
+    if upload is None:
+        return JsonResponse({"error": "No file uploaded"}, status=400)
+    try:
+        fmt, compressed = detect_format(upload.name)
+    except ValueError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+
+    report = import_questions(request.user, upload, fmt, compressed)
+    return JsonResponse(report.as_dict())
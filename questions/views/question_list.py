@@ -1,11 +1,23 @@
+from urllib.parse import urlencode
+
 from questions.models import Question, Tag
 from django.db.models import Count, Q
 from django.contrib.postgres.search import SearchQuery
 from django.db import connection
 
-from django.core.paginator import Paginator
 from django.shortcuts import redirect, render
 
+from config.concurrent_queries import (
+    paginate_concurrently,
+    paginate_ids_concurrently,
+)
+from questions.search import attach_snippets, result_ids, user_scope
+from questions.stats import question_stats
+
+# Number of tag badges shown on each question card; the full list is
+# loaded on demand from the questions:tags endpoint
+CARD_VISIBLE_TAGS = 2
+
 # Sorting options for private questions (value, label)
 SORT_OPTIONS = (
     ("-created_at", "Newest First"),
@@ -24,19 +36,90 @@ VIEW_OPTIONS = (
 )
 
 
-def question_list(request):
+def tag_filters(params):
     """
-    Display paginated list of user's personal questions
-    (both private and public).
+    Return the tag slugs (``tag``, repeatable) and the tag match mode
+    (``mode``: ``all`` or ``any``) of a query string.
     """
-    if not request.user.is_authenticated:
-        # Redirect unauthenticated users to public questions
-        return redirect("questions:public_list")
+    slugs = dict.fromkeys(
+        slug.strip() for slug in params.getlist("tag") if slug.strip()
+    )
+    mode = params.get("mode", Question.TAG_MODE_ALL).strip()
+    if mode not in Question.TAG_MODES:
+        mode = Question.TAG_MODE_ALL
+    return list(slugs), mode
 
-    # Get filter, search, sort, and view parameters
-    tag_filter = request.GET.get("tag", "").strip()
-    search_query = request.GET.get("search", "").strip()
-    sort_by = request.GET.get("sort", "-created_at").strip()
+
+def selected_tags_query(slugs, tags):
+    """Return the tags among ``tags`` matching the filter, for display."""
+    matches = Q()
+    for slug in slugs:
+        matches |= Q(slug__iexact=slug)
+    return tags.filter(matches)
+
+
+def tag_counts_query(questions):
+    """
+    Return (tag_id, count) rows: how many of ``questions`` each tag is on.
+    One GROUP BY over the tag links of the filtered question ids.
+    """
+    return (
+        Question.tags.through.objects.filter(
+            question_id__in=questions.order_by().values("pk")
+        )
+        .order_by()
+        .values("tag_id")
+        .annotate(count=Count("pk"))
+        .values_list("tag_id", "count")
+    )
+
+
+def tag_facets(tags, counts, slugs):
+    """
+    Return the ``tags`` that are on any question of the current context,
+    with their ``question_count``. Selected tags (``slugs``) are kept even
+    without questions, so they can still be unselected.
+    """
+    counts = dict(counts)
+    selected = {slug.lower() for slug in slugs}
+    facets = []
+    for tag in tags:
+        tag.question_count = counts.get(tag.pk, 0)
+        if tag.question_count or tag.slug.lower() in selected:
+            facets.append(tag)
+    return facets
+
+
+def tag_filter_context(slugs, mode, tags):
+    """
+    Template context of the tag filter. ``tags`` are the matching tags
+    (see ``selected_tags_query``); slugs use their spelling when found.
+    ``tag_params`` is the filter as a query string, for links.
+    """
+    found = {}
+    for tag in tags:
+        found.setdefault(tag.slug.lower(), tag)
+    selected = [found.get(slug.lower()) for slug in slugs]
+    selected_slugs = [
+        tag.slug if tag else slug for tag, slug in zip(selected, slugs)
+    ]
+    params = [("tag", slug) for slug in selected_slugs]
+    if mode == Question.TAG_MODE_ANY and len(slugs) > 1:
+        params.append(("mode", mode))
+    return {
+        "selected_tag": selected_slugs[0] if slugs else None,
+        "selected_tags": selected_slugs,
+        "selected_tag_name": ", ".join(
+            tag.name if tag else slug for tag, slug in zip(selected, slugs)
+        )
+        or None,
+        "tag_mode": mode,
+        "tag_params": urlencode(params),
+    }
+
+
+def list_filters(request):
+    """Return the tag, tag mode, search and view mode filters."""
     view_mode = request.GET.get("view", "personal").strip()
 
     # Validate view mode
@@ -44,13 +127,26 @@ def question_list(request):
     if view_mode not in valid_view_values:
         view_mode = "personal"  # Default to personal
 
-    # Start with user's own questions with optimized queries
-    questions = (
-        Question.objects.filter(owner=request.user)
-        .select_related("owner")
-        .prefetch_related("tags")
+    tags, tag_mode = tag_filters(request.GET)
+    return (
+        tags,
+        tag_mode,
+        request.GET.get("search", "").strip(),
+        view_mode,
     )
 
+
+def filter_questions(
+    user, tags, search_query, view_mode, tag_mode=Question.TAG_MODE_ALL
+):
+    """
+    Return the user's questions matching the list page filters, unordered.
+    Also used by the bulk actions to select "everything matching the
+    current filter".
+    """
+    # Start with user's own questions
+    questions = Question.objects.filter(owner=user)
+
     # Apply visibility filter based on view mode
     if view_mode == "personal":
         # Only show private questions
@@ -59,28 +155,9 @@ def question_list(request):
         # Only show public questions (regardless of status)
         questions = questions.filter(is_public=True)
 
-    # Apply tag filter if provided
-    selected_tag = None
-    selected_tag_name = None
-    if tag_filter:
-        # Filter questions that have the specified tag (case-insensitive by
-        # slug)
-        questions = questions.filter(tags__slug__iexact=tag_filter)
-        # Get the actual tag object for display
-        try:
-            tag_obj = Tag.objects.filter(
-                Q(owner=request.user, slug__iexact=tag_filter)
-                | Q(is_public=True, slug__iexact=tag_filter)
-            ).first()
-            if tag_obj:
-                selected_tag = tag_obj.slug
-                selected_tag_name = tag_obj.name
-            else:
-                selected_tag = tag_filter
-                selected_tag_name = tag_filter
-        except AttributeError:
-            selected_tag = tag_filter
-            selected_tag_name = tag_filter
+    # Apply tag filter if provided: questions with all (or any) of the tags,
+    # case-insensitive by slug
+    questions = questions.tagged(tags, tag_mode)
 
     # Apply search filter if provided
     # Search across question title (partial match), body, and answer content
@@ -99,7 +176,7 @@ def question_list(request):
             from answers.models import Answer
 
             matching_answer_question_ids = (
-                Answer.objects.filter(user=request.user, search_vector=search)
+                Answer.objects.filter(user=user, search_vector=search)
                 .values_list("question_id", flat=True)
                 .distinct()
             )
@@ -109,7 +186,7 @@ def question_list(request):
             questions = questions.filter(
                 Q(id__in=questions_with_search.values_list("id", flat=True))
                 | Q(id__in=matching_answer_question_ids)
-            ).distinct()
+            )
         else:
             # Fallback to basic search for non-Postgres databases
             # (e.g., SQLite in tests)
@@ -117,7 +194,54 @@ def question_list(request):
             questions = questions.filter(
                 Q(title__icontains=search_query)
                 | Q(body__icontains=search_query)
-            ).distinct()
+            )
+
+    return questions
+
+
+def question_list(request):
+    """
+    Display paginated list of user's personal questions
+    (both private and public).
+    """
+    if not request.user.is_authenticated:
+        # Redirect unauthenticated users to public questions
+        return redirect("questions:public_list")
+
+    tags, tag_mode, search_query, view_mode = list_filters(request)
+    sort_by = request.GET.get("sort", "-created_at").strip()
+
+    questions = (
+        filter_questions(
+            request.user, tags, search_query, view_mode, tag_mode
+        )
+        .select_related("owner")
+        .with_tag_preview(CARD_VISIBLE_TAGS)
+    )
+
+    # Queries that do not depend on the page; they run concurrently with it
+    tasks = {
+        # Get all available tags for the filter dropdown
+        # Include both public tags and user's private tags
+        "available_tags": Tag.objects.filter(
+            Q(is_public=True) | Q(owner=request.user)
+        )
+        .distinct()
+        .order_by("name"),
+        # Questions per tag for the current search and visibility (the tag
+        # filter aside), for the filter options
+        "tag_counts": tag_counts_query(
+            filter_questions(request.user, (), search_query, view_mode)
+        ),
+        # Counts for the stats panel, usually from the cache
+        "stats": lambda: question_stats(request.user),
+    }
+    if tags:
+        # Get the actual tag objects for display
+        tasks["selected_tags"] = selected_tags_query(
+            tags,
+            Tag.objects.filter(Q(owner=request.user) | Q(is_public=True)),
+        )
 
     # Validate and apply sorting
     valid_sort_values = [option[0] for option in SORT_OPTIONS]
@@ -127,28 +251,54 @@ def question_list(request):
     # If sorting by answer count, annotate the queryset
     # Otherwise, apply simple ordering
     if "answer_count" in sort_by:
-        from answers.models import Answer
-
         questions = (
             questions.annotate(
                 answer_count=Count("answers", distinct=True)
-            )
-            .distinct()
-            .order_by(sort_by, "-created_at")
+            ).order_by(sort_by, "-created_at")
         )
     else:
-        # Order by selected sort option and make distinct to avoid
-        # duplicates from tag filter
-        questions = questions.distinct().order_by(sort_by)
+        # Order by selected sort option. The tag filter needs no DISTINCT:
+        # it is a containment test on PostgreSQL, and the join fallback
+        # (tagged()) applies its own.
+        questions = questions.order_by(sort_by)
 
-    # Paginate questions (12 per page)
-    paginator = Paginator(questions, 12)
-    page_number = request.GET.get("page")
-    page_obj = paginator.get_page(page_number)
+    # Searches page through a briefly cached list of the matching ids
+    ids = None
+    if search_query:
+        ids = result_ids(
+            user_scope(request.user),
+            {
+                "view": view_mode,
+                "search": search_query,
+                "tags": tags,
+                "tag_mode": tag_mode,
+                "sort": sort_by,
+            },
+            questions,
+        )
 
-    # Force evaluation and get the actual list of questions for this page
-    # This prevents re-evaluation of the queryset later
-    questions_list = list(page_obj.object_list)
+    # Paginate questions (12 per page). The page, its count and the other
+    # independent queries run concurrently.
+    if ids is None:
+        page_obj, results = paginate_concurrently(
+            questions, 12, request.GET.get("page"), **tasks
+        )
+    else:
+        # The page's rows are loaded by id, without the search filters
+        rows = (
+            Question.objects.filter(owner=request.user)
+            .select_related("owner")
+            .with_tag_preview(CARD_VISIBLE_TAGS)
+        )
+        if "answer_count" in sort_by:
+            rows = rows.annotate(answer_count=Count("answers", distinct=True))
+        page_obj, results = paginate_ids_concurrently(
+            ids, rows, 12, request.GET.get("page"), **tasks
+        )
+    questions_list = page_obj.object_list
+
+    # Highlight why each question matched - for this page's ids only
+    attach_snippets(questions_list, search_query, user=request.user)
 
     # If answer counts were not already annotated (i.e., not sorting by
     # answer_count), fetch them separately for the current page
@@ -169,17 +319,6 @@ def question_list(request):
         for question in questions_list:
             question.answer_count = answer_counts.get(question.id, 0)
 
-    # Replace the queryset with our evaluated list to prevent re-querying
-    page_obj.object_list = questions_list
-
-    # Get all available tags for the filter dropdown
-    # Include both public tags and user's private tags
-    available_tags = (
-        Tag.objects.filter(Q(is_public=True) | Q(owner=request.user))
-        .distinct()
-        .order_by("name")
-    )
-
     # Get sort option label for display
     sort_label = next(
         (label for value, label in SORT_OPTIONS if value == sort_by),
@@ -195,9 +334,12 @@ def question_list(request):
     context = {
         "questions": page_obj,
         "page_obj": page_obj,
-        "available_tags": available_tags,
-        "selected_tag": selected_tag,
-        "selected_tag_name": selected_tag_name,
+        "available_tags": tag_facets(
+            results["available_tags"], results["tag_counts"], tags
+        ),
+        **tag_filter_context(
+            tags, tag_mode, results.get("selected_tags", ())
+        ),
         "search_query": search_query,
         "sort_options": SORT_OPTIONS,
         "selected_sort": sort_by,
@@ -205,6 +347,7 @@ def question_list(request):
         "view_options": VIEW_OPTIONS,
         "selected_view": view_mode,
         "selected_view_label": view_label,
+        "stats": results["stats"],
     }
 
     return render(request, "questions/pages/list.html", context)
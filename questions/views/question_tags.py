@@ -0,0 +1,39 @@
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404, render
+
+from questions.models import Question
+
+
+def question_tags(request, pk):
+    """
+    Return the full tag list for a question, loaded on demand by the shared
+    tag modal on question cards. Responds with an HTML fragment, or JSON
+    when requested via the Accept header.
+    """
+    if request.user.is_authenticated and request.user.is_superuser:
+        queryset = Question.objects.all()
+    else:
+        queryset = Question.objects.visible_to_user(request.user)
+
+    question = get_object_or_404(queryset, pk=pk)
+    tags = list(question.tags.order_by("name"))
+
+    if request.headers.get("Accept") == "application/json":
+        return JsonResponse(
+            {
+                "question_id": question.pk,
+                "tags": [
+                    {
+                        "id": tag.pk,
+                        "name": tag.name,
+                        "slug": tag.slug,
+                        "is_public": tag.is_public,
+                    }
+                    for tag in tags
+                ],
+            }
+        )
+
+    return render(
+        request, "components/tag_modal_content.html", {"tags": tags}
+    )
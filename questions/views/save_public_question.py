@@ -5,6 +5,7 @@ from django.shortcuts import get_object_or_404, redirect
 from django.utils.http import url_has_allowed_host_and_scheme
 
 from questions.models import Question
+from questions.services import QuestionService
 
 
 @login_required
@@ -52,18 +53,16 @@ def save_public_question(request, question_id):
         )
         return redirect(redirect_target or "questions:public_list")
 
-    # Create a copy for the user (title only, no description)
-    user_question = Question.objects.create(
+    # Create a copy for the user (title and tags only, no description),
+    # auto-approved as a private question
+    user_question = QuestionService.create(
         owner=request.user,
         title=public_question.title,
-        body="",  # Don't copy the description
-        is_public=False,  # User's personal copy
-        status=Question.STATUS_APPROVED,  # Auto-approve user's own questions
+        tag_ids=public_question.tags.order_by().values_list(
+            "pk", flat=True
+        ),
     )
 
-    # Copy tags if any
-    user_question.tags.set(public_question.tags.all())
-
     if request.headers.get("Accept") == "application/json":
         return JsonResponse(
             {